@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compares the per-call cost of decoding online attribute responses with and without `fast_decode`.
+
+Usage: python scripts/benchmark_attributes_decoding.py [attribute_count] [calls]
+"""
+import json
+import sys
+import timeit
+
+import httpx
+
+from snowplow_signals.api_client import _parse_response
+from snowplow_signals.attributes_client import (
+    _decode_attributes_data,
+    _format_get_attributes_response,
+    orjson,
+)
+from snowplow_signals.models import GetAttributesResponse
+
+
+def build_response(attribute_count: int) -> httpx.Response:
+    """
+    Builds a response for a wide service, mixing the value types attributes usually have.
+    """
+    data: dict[str, list] = {}
+    for i in range(attribute_count):
+        value = [i, f"value_{i}", i / 3, i % 2 == 0, [f"item_{i}", f"item_{i + 1}"]][
+            i % 5
+        ]
+        data[f"attribute_{i}"] = [value]
+    return httpx.Response(200, content=json.dumps(data).encode())
+
+
+def decode_with_model(response: httpx.Response) -> dict:
+    return _format_get_attributes_response(
+        GetAttributesResponse(data=_parse_response(response))
+    )
+
+
+def decode_fast(response: httpx.Response) -> dict:
+    return _format_get_attributes_response(
+        GetAttributesResponse.model_construct(
+            data=_decode_attributes_data(response.content)
+        )
+    )
+
+
+def main(attribute_count: int, calls: int) -> None:
+    response = build_response(attribute_count)
+    assert decode_with_model(response) == decode_fast(response)
+
+    print(
+        f"{attribute_count} attributes, {calls} calls, orjson {'installed' if orjson else 'not installed'}"
+    )
+    for name, decode in (("model", decode_with_model), ("fast", decode_fast)):
+        seconds = min(timeit.repeat(lambda: decode(response), number=calls, repeat=5))
+        print(f"{name:>6}: {seconds / calls * 1e6:8.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main(
+        attribute_count=int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        calls=int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+    )
@@ -1,4 +1,18 @@
-from snowplow_signals.api_client import SignalsAPIError
+from snowplow_signals.api_client import CircuitOpenError, SignalsAPIError
+from snowplow_signals.attributes_cache import AttributesCache
+from snowplow_signals.attributes_dispatcher import (
+    AsyncAttributesDispatcher,
+    AttributesDispatcher,
+)
+from snowplow_signals.auth import FileTokenStore, InMemoryTokenStore, TokenStore
+from snowplow_signals.interventions_multiplexer import (
+    InterventionsMultiplexer,
+    MultiplexedSubscription,
+)
+from snowplow_signals.interventions_publisher import (
+    AsyncInterventionsPublisher,
+    InterventionsPublisher,
+)
 from snowplow_signals.models import (
     AtomicProperty,
     Attribute,
@@ -35,7 +49,18 @@ from snowplow_signals.models import (
     Service,
     StreamAttributeGroup,
 )
-from snowplow_signals.signals import Signals, SignalsSandbox
+from snowplow_signals.registry_cache import RegistryCache
+from snowplow_signals.resilience import (
+    CircuitBreakerPolicy,
+    ReconnectPolicy,
+    RetryPolicy,
+)
+from snowplow_signals.signals import (
+    AsyncSignals,
+    AsyncSignalsSandbox,
+    Signals,
+    SignalsSandbox,
+)
 
 from .definitions import (
     PagePing,
@@ -51,6 +76,8 @@ from .definitions import (
 
 Signals
 SignalsSandbox
+AsyncSignals
+AsyncSignalsSandbox
 AttributeGroup
 ExternalBatchAttributeGroup
 StreamAttributeGroup
@@ -85,4 +112,19 @@ InterventionCriteriaNone
 InterventionCriterion
 SignalsAPIError
 AttributeKeyIdentifiers
+AttributesCache
+AttributesDispatcher
+AsyncAttributesDispatcher
+InterventionsPublisher
+AsyncInterventionsPublisher
+InterventionsMultiplexer
+MultiplexedSubscription
+TokenStore
+InMemoryTokenStore
+FileTokenStore
+RetryPolicy
+ReconnectPolicy
+CircuitBreakerPolicy
+CircuitOpenError
+RegistryCache
 AttributeKeyId
@@ -1,19 +1,52 @@
+import asyncio
 import json
 import os
-from collections.abc import Generator, Mapping
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from datetime import timedelta
 from importlib.metadata import version
-from typing import Literal, Optional, Union
+from threading import Lock, Thread
+from typing import Any, Literal, NamedTuple, Optional, Self
 
 import httpx
-import jwt
+
+from .auth import InMemoryTokenStore, TokenStore, token_expiry
+from .cli_logging import get_logger
+from .resilience import (
+    IDEMPOTENT_METHODS,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    RetryBudget,
+    RetryPolicy,
+    endpoint_group,
+    parse_retry_after,
+)
+
+logger = get_logger(__name__)
 
 HTTP_METHODS = Literal["GET", "POST", "PUT", "DELETE"]
 
 X_SIGNALS_SDK_NAME = f"signals-py {version('snowplow-signals')}"
+DEFAULT_TIMEOUT_SECONDS = 30.0
 DEFAULT_STREAM_CONNECT_TIMEOUT_SECONDS = 10.0
+DEFAULT_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+DEFAULT_TOKEN_REFRESH_SKEW = timedelta(seconds=60)
+
+
+class ConditionalResponse(NamedTuple):
+    body: Any | None
+    """The decoded JSON response, or None if the API answered 304 Not Modified."""
+    etag: str | None
+    """The `ETag` identifying this version of the response, if the API sent one."""
 
 
-class ApiClient:
+class BaseApiClient:
+    """
+    Internal base class holding the configuration, authentication and request building shared by `ApiClient` and `AsyncApiClient`.
+    """
+
     def __init__(
         self,
         api_url: str,
@@ -22,6 +55,12 @@ class ApiClient:
         org_id: str | None = None,
         auth_mode: Literal["bdp", "sandbox"] = "bdp",
         sandbox_token: str | None = None,
+        token_store: TokenStore | None = None,
+        token_refresh_skew: timedelta = DEFAULT_TOKEN_REFRESH_SKEW,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
     ):
         self.api_url = api_url.rstrip("/")
         self.auth_mode = auth_mode
@@ -29,7 +68,22 @@ class ApiClient:
         self.api_key_id = api_key_id
         self.org_id = org_id
         self.sandbox_token = sandbox_token
-        self.token = None
+        self.token_store: TokenStore = token_store or InMemoryTokenStore()
+        self.token_refresh_skew = token_refresh_skew
+        self.token: str | None = None
+        self._token_expiry = 0.0
+        self._token_refresh_skew = 0.0
+        self.timeout = timeout
+        self.endpoint_timeouts = dict(endpoint_timeouts or {})
+        self.retry_policy = retry_policy
+        self._retry_budget = (
+            RetryBudget(retry_policy.budget_ratio, retry_policy.budget_capacity)
+            if retry_policy is not None
+            else None
+        )
+        self.circuit_breaker = circuit_breaker
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = Lock()
 
         # Validate auth mode dependencies
         if self.auth_mode == "sandbox":
@@ -51,21 +105,258 @@ class ApiClient:
             "Authorization": f"Bearer {token}",
         }
 
-    def _fetch_token(self) -> str:
-        access_token_url = (
+    def _get_url(self, endpoint: str) -> str:
+        return f"{self.api_url}/api/v1/{endpoint}"
+
+    def _get_token_url(self) -> str:
+        return (
             f"https://console.snowplowanalytics.com/api/msc/v1/organizations/{self.org_id}/credentials/v3/token"
             if os.getenv("BDP_NEXT") is None
             else f"https://next.console.snowplowanalytics.com/api/msc/v1/organizations/{self.org_id}/credentials/v3/token"
         )
 
+    def _get_token_headers(self) -> dict[str, str]:
+        return {
+            "X-API-Key-Id": self.api_key_id or "",
+            "X-API-Key": self.api_key or "",
+            "X-Signals-Sdk-Name": X_SIGNALS_SDK_NAME,
+        }
+
+    def _usable_token(self) -> str | None:
+        """
+        Returns the current token if it has not expired, adopting a newer one from the token store if another client refreshed it.
+        """
+        now = time.time()
+        if self.token is None or self._token_expiry - self._token_refresh_skew <= now:
+            stored = self.token_store.get()
+            if stored is not None and stored != self.token:
+                self._set_token(stored)
+        if self.token is not None and self._token_expiry > now:
+            return self.token
+        return None
+
+    def _should_refresh(self) -> bool:
+        return self._token_expiry - self._token_refresh_skew <= time.time()
+
+    def _set_token(self, token: str) -> None:
+        self._token_expiry = token_expiry(token)
+        # Never refresh before half of a short-lived token's lifetime has passed
+        lifetime = self._token_expiry - time.time()
+        self._token_refresh_skew = max(
+            0.0, min(self.token_refresh_skew.total_seconds(), lifetime / 2)
+        )
+        self.token = token
+
+    def _timeout_for(self, endpoint: str) -> float | httpx.Timeout:
+        """
+        Returns the timeout of the longest `endpoint_timeouts` prefix matching the endpoint, or the default timeout.
+        """
+        prefixes = [
+            prefix for prefix in self.endpoint_timeouts if endpoint.startswith(prefix)
+        ]
+        if not prefixes:
+            return self.timeout
+        return self.endpoint_timeouts[max(prefixes, key=len)]
+
+    def _circuit_breaker_for(self, endpoint: str) -> CircuitBreaker | None:
+        if self.circuit_breaker is None:
+            return None
+        group = endpoint_group(endpoint)
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(group)
+            if breaker is None:
+                breaker = self._circuit_breakers[group] = CircuitBreaker(
+                    self.circuit_breaker
+                )
+            return breaker
+
+    def _start_request(self, method: HTTP_METHODS, idempotent: bool | None) -> bool:
+        """
+        Counts a request towards the retry budget.
+
+        Returns:
+            Whether the request may be retried.
+        """
+        if self._retry_budget is None:
+            return False
+        self._retry_budget.deposit()
+        return idempotent if idempotent is not None else method in IDEMPOTENT_METHODS
+
+    def _retry_delay(
+        self,
+        retryable: bool,
+        attempt: int,
+        response: httpx.Response | None = None,
+    ) -> float | None:
+        """
+        Returns how long to wait before retrying a failed attempt, or None if it should not be retried.
+
+        Args:
+            retryable: Whether the request may be retried at all.
+            attempt: The number of the failed attempt, starting at 1.
+            response: The response of the attempt, or None if it failed without one.
+        """
+        policy = self.retry_policy
+        budget = self._retry_budget
+        if policy is None or budget is None or not retryable:
+            return None
+        if attempt >= policy.max_attempts:
+            return None
+        retry_after = None
+        if response is not None:
+            if response.status_code not in policy.retry_statuses:
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        delay = policy.backoff(attempt, retry_after)
+        if delay is None or not budget.withdraw():
+            return None
+        return delay
+
+
+def _check_circuit(breaker: CircuitBreaker | None, endpoint: str) -> None:
+    if breaker is not None and not breaker.allow():
+        raise CircuitOpenError(endpoint_group(endpoint))
+
+
+def _record_outcome(breaker: CircuitBreaker | None, status_code: int | None) -> None:
+    """
+    Records an attempt on the circuit breaker. Connection errors, timeouts, throttling and server errors count as failures.
+    """
+    if breaker is None:
+        return
+    if status_code is None or status_code == 429 or status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """
+    Whether an error means the API could not serve the request, rather than rejecting it.
+    """
+    if isinstance(error, SignalsAPIError):
+        return error.status_code == 429 or error.status_code >= 500
+    return True
+
+
+def _parse_response(response: httpx.Response) -> dict:
+    if response.status_code in (200, 201):
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            raise SignalsAPIError(
+                response.status_code, f"Failed to decode response: {response.text}"
+            )
+    try:
+        payload = response.json()
+        raise SignalsAPIError(response.status_code, payload)
+    except (KeyError, ValueError):
+        raise SignalsAPIError(
+            response.status_code, f"Failed to decode response: {response.text}"
+        )
+
+
+def _conditional_headers(etag: str | None) -> dict[str, str] | None:
+    return {"If-None-Match": etag} if etag is not None else None
+
+
+def _conditional_response(
+    response: httpx.Response, etag: str | None
+) -> "ConditionalResponse":
+    if response.status_code == 304:
+        return ConditionalResponse(None, response.headers.get("ETag", etag))
+    return ConditionalResponse(_parse_response(response), response.headers.get("ETag"))
+
+
+def _response_error(response: httpx.Response) -> "SignalsAPIError":
+    try:
+        return SignalsAPIError(response.status_code, response.json())
+    except json.JSONDecodeError:
+        return SignalsAPIError(
+            response.status_code, f"Failed to decode response: {response.text}"
+        )
+
+
+class ApiClient(BaseApiClient):
+    """
+    Client for the Signals API.
+
+    Requests are sent through a single long-lived `httpx.Client`, so connections (and their TLS sessions) are pooled and kept alive between calls.
+    Call `close()`, or use the client as a context manager, to release the pooled connections.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str | None = None,
+        api_key_id: str | None = None,
+        org_id: str | None = None,
+        auth_mode: Literal["bdp", "sandbox"] = "bdp",
+        sandbox_token: str | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        token_store: TokenStore | None = None,
+        token_refresh_skew: timedelta = DEFAULT_TOKEN_REFRESH_SKEW,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+    ):
+        """
+        Args:
+            api_url: The base URL of the Signals API.
+            api_key: The API key, required in 'bdp' mode.
+            api_key_id: The API key ID, required in 'bdp' mode.
+            org_id: The organization ID, required in 'bdp' mode.
+            auth_mode: Either 'bdp' or 'sandbox'.
+            sandbox_token: The sandbox token, required in 'sandbox' mode.
+            limits: Connection pool limits and keep-alive expiry. Defaults to `DEFAULT_HTTP_LIMITS`.
+            http2: Enable HTTP/2. Requires the `h2` package (`pip install httpx[http2]`).
+            token_store: Where the access token is kept; share a `FileTokenStore` to reuse one token across processes. Defaults to an in-memory store.
+            token_refresh_skew: How long before expiry the access token is refreshed in the background.
+            timeout: The default request timeout in seconds.
+            endpoint_timeouts: Timeouts by endpoint prefix, e.g. `{"get-online-attributes": 2.0}`; the longest matching prefix wins.
+            retry_policy: Retries failed idempotent requests if set.
+            circuit_breaker: Fails requests to an endpoint fast while it keeps failing, if set.
+        """
+        super().__init__(
+            api_url=api_url,
+            api_key=api_key,
+            api_key_id=api_key_id,
+            org_id=org_id,
+            auth_mode=auth_mode,
+            sandbox_token=sandbox_token,
+            token_store=token_store,
+            token_refresh_skew=token_refresh_skew,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+        )
+        self._refresh_lock = Lock()
+
+        self._client = httpx.Client(
+            limits=limits or DEFAULT_HTTP_LIMITS,
+            http2=http2,
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and release its pooled connections.
+        """
+        self._client.close()
+
+    def _fetch_token(self) -> str:
         response = (
-            httpx.get(
-                access_token_url,
-                headers={
-                    "X-API-Key-Id": self.api_key_id,
-                    "X-API-Key": self.api_key,
-                    "X-Signals-Sdk-Name": X_SIGNALS_SDK_NAME,
-                },
+            self._client.get(
+                self._get_token_url(),
+                headers=self._get_token_headers(),
             )
             .raise_for_status()
             .json()
@@ -73,59 +364,88 @@ class ApiClient:
 
         return response["accessToken"]
 
-    def _check_token(self, token: Union[str, None]) -> str:
+    def _get_token(self) -> str:
         if self.auth_mode == "sandbox":
-            if not self.sandbox_token:
-                raise ValueError(
-                    "When auth_mode is 'sandbox' a non-empty sandbox_token must be provided"
-                )
-            return self.sandbox_token
+            return self.sandbox_token  # pyright: ignore[reportReturnType]
 
+        token = self._usable_token()
         if token is None:
-            return self._fetch_token()
-        else:
-            try:
-                jwt.decode(
-                    token, options={"verify_signature": False, "verify_exp": True}
-                )
+            return self._refresh_token()
+        if self._should_refresh() and not self._refresh_lock.locked():
+            Thread(
+                target=self._refresh_token_in_background,
+                name=f"SignalsTokenRefresh-{id(self)}",
+                daemon=True,
+            ).start()
+        return token
+
+    def _refresh_token(self) -> str:
+        # Only one thread fetches; the others wait and reuse its token
+        with self._refresh_lock:
+            token = self._usable_token()
+            if token is not None and not self._should_refresh():
+                return token
+            # Only one client sharing the token store fetches; the others adopt its token
+            with self.token_store.lock():
+                token = self._usable_token()
+                if token is not None and not self._should_refresh():
+                    return token
+                token = self._fetch_token()
+                self.token_store.set(token)
+                self._set_token(token)
                 return token
-            except jwt.ExpiredSignatureError:
-                return self._fetch_token()
 
-    def _request(
+    def _refresh_token_in_background(self) -> None:
+        try:
+            self._refresh_token()
+        except Exception:
+            # the token is still valid, the next request after expiry refreshes synchronously
+            logger.warning("Failed to refresh the Signals API token", exc_info=True)
+
+    def _send(
         self,
         method: HTTP_METHODS,
         endpoint: str,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
-    ) -> dict:
-        token = self._check_token(self.token)
-        self.token = token
-
-        url = f"{self.api_url}/api/v1/{endpoint}"
-        response = httpx.request(
-            method=method,
-            url=url,
-            headers=self._get_headers(token),
-            params=params,
-            json=data,
-            timeout=30.0,
-        )
-
-        if response.status_code in (200, 201):
+        idempotent: bool | None = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        breaker = self._circuit_breaker_for(endpoint)
+        retryable = self._start_request(method, idempotent)
+        attempt = 0
+        while True:
+            attempt += 1
+            # fetched before checking the circuit, so that auth failures do not count against the endpoint
+            token = self._get_token()
+            _check_circuit(breaker, endpoint)
             try:
-                return response.json()
-            except json.JSONDecodeError:
-                raise SignalsAPIError(
-                    response.status_code, f"Failed to decode response: {response.text}"
+                response = self._client.request(
+                    method=method,
+                    url=self._get_url(endpoint),
+                    headers=self._get_headers(token, headers),
+                    params=params,
+                    json=data,
+                    timeout=self._timeout_for(endpoint),
                 )
-        try:
-            payload = response.json()
-            raise SignalsAPIError(response.status_code, payload)
-        except (KeyError, ValueError):
-            raise SignalsAPIError(
-                response.status_code, f"Failed to decode response: {response.text}"
-            )
+            except httpx.TransportError:
+                _record_outcome(breaker, None)
+                delay = self._retry_delay(retryable, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                # e.g. cancelled, so that a trial request does not leave the circuit half open
+                if breaker is not None:
+                    breaker.record_abandoned()
+                raise
+            else:
+                _record_outcome(breaker, response.status_code)
+                delay = self._retry_delay(retryable, attempt, response)
+                if delay is None:
+                    return response
+
+            logger.debug(f"Retrying {method} {endpoint} in {delay:.2f}s")
+            time.sleep(delay)
 
     def _stream_request(
         self,
@@ -135,20 +455,21 @@ class ApiClient:
         data: Optional[dict] = None,
         headers: Optional[dict[str, str]] = None,
         connect_timeout: Optional[float] = DEFAULT_STREAM_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: Optional[float] = None,
+        on_response: Optional[Callable[[httpx.Response], None]] = None,
     ) -> Generator[str | None]:
-        token = self._check_token(self.token)
-        self.token = token
-
-        url = f"{self.api_url}/api/v1/{endpoint}"
+        token = self._get_token()
 
-        with httpx.stream(
+        with self._client.stream(
             method=method,
-            url=url,
+            url=self._get_url(endpoint),
             headers=self._get_headers(token, headers),
             params=params,
             json=data,
-            timeout=(connect_timeout, None, None, None),
+            timeout=(connect_timeout, read_timeout, None, None),
         ) as stream:
+            if on_response is not None:
+                on_response(stream)
             if stream.status_code == 200:
                 gen = stream.iter_lines()
 
@@ -164,14 +485,8 @@ class ApiClient:
                         # connection likely killed
                         break
             else:
-                try:
-                    stream.read()
-                    payload = stream.json()
-                    raise SignalsAPIError(stream.status_code, payload)
-                except json.JSONDecodeError:
-                    raise SignalsAPIError(
-                        stream.status_code, f"Failed to decode response: {stream.text}"
-                    )
+                stream.read()
+                raise _response_error(stream)
 
     def make_request(
         self,
@@ -179,8 +494,67 @@ class ApiClient:
         endpoint: str,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
+        idempotent: bool | None = None,
     ) -> dict:
-        return self._request(method=method, endpoint=endpoint, params=params, data=data)
+        """
+        Sends a request to the Signals API and returns the decoded JSON response.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The endpoint, relative to `/api/v1/`.
+            params: Query parameters.
+            data: The JSON body.
+            idempotent: Whether the request may be retried. Defaults to True for GET, PUT and DELETE requests.
+        """
+        response = self._send(
+            method=method,
+            endpoint=endpoint,
+            params=params,
+            data=data,
+            idempotent=idempotent,
+        )
+        return _parse_response(response)
+
+    def make_raw_request(
+        self,
+        method: HTTP_METHODS,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool | None = None,
+    ) -> bytes:
+        """
+        Sends a request to the Signals API like `make_request`, but returns the undecoded response body so callers can parse it themselves.
+        """
+        response = self._send(
+            method=method,
+            endpoint=endpoint,
+            params=params,
+            data=data,
+            idempotent=idempotent,
+        )
+        if response.status_code in (200, 201):
+            return response.content
+        raise _response_error(response)
+
+    def make_conditional_request(
+        self, endpoint: str, etag: str | None = None
+    ) -> ConditionalResponse:
+        """
+        Sends a GET request that the Signals API can answer with 304 Not Modified when the `etag` still matches.
+
+        Args:
+            endpoint: The endpoint, relative to `/api/v1/`.
+            etag: The `ETag` of the previously received response, if any.
+        Returns:
+            The decoded JSON response, or None if it was not modified, and its `ETag`.
+        """
+        response = self._send(
+            method="GET",
+            endpoint=endpoint,
+            headers=_conditional_headers(etag),
+        )
+        return _conditional_response(response, etag)
 
     def make_stream_request(
         self,
@@ -189,7 +563,302 @@ class ApiClient:
         params: Optional[Mapping[str, str | list[str]]] = None,
         data: Optional[dict[str, object]] = None,
         headers: Optional[dict[str, str]] = None,
+        read_timeout: Optional[float] = None,
+        on_response: Optional[Callable[[httpx.Response], None]] = None,
     ) -> Generator[str | None]:
+        """
+        Sends a request to the Signals API and yields the lines of the streamed response as they arrive.
+
+        Args:
+            read_timeout: If set, yields `None` and ends the stream once no line arrived for `read_timeout` seconds, so the caller can reconnect.
+            on_response: Called with the response as soon as it is open, e.g. to abort it from another thread.
+        """
+        return self._stream_request(
+            method=method,
+            endpoint=endpoint,
+            params=params,
+            data=data,
+            headers=headers,
+            read_timeout=read_timeout,
+            on_response=on_response,
+        )
+
+
+class AsyncApiClient(BaseApiClient):
+    """
+    Asyncio client for the Signals API, built on a long-lived `httpx.AsyncClient`.
+
+    Shares authentication, request building and response handling with `ApiClient`.
+    Call `aclose()`, or use the client as an async context manager, to release the pooled connections.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str | None = None,
+        api_key_id: str | None = None,
+        org_id: str | None = None,
+        auth_mode: Literal["bdp", "sandbox"] = "bdp",
+        sandbox_token: str | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        token_store: TokenStore | None = None,
+        token_refresh_skew: timedelta = DEFAULT_TOKEN_REFRESH_SKEW,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+    ):
+        """
+        Args:
+            api_url: The base URL of the Signals API.
+            api_key: The API key, required in 'bdp' mode.
+            api_key_id: The API key ID, required in 'bdp' mode.
+            org_id: The organization ID, required in 'bdp' mode.
+            auth_mode: Either 'bdp' or 'sandbox'.
+            sandbox_token: The sandbox token, required in 'sandbox' mode.
+            limits: Connection pool limits and keep-alive expiry. Defaults to `DEFAULT_HTTP_LIMITS`.
+            http2: Enable HTTP/2. Requires the `h2` package (`pip install httpx[http2]`).
+            token_store: Where the access token is kept; share a `FileTokenStore` to reuse one token across processes. Defaults to an in-memory store.
+            token_refresh_skew: How long before expiry the access token is refreshed in the background.
+            timeout: The default request timeout in seconds.
+            endpoint_timeouts: Timeouts by endpoint prefix, e.g. `{"get-online-attributes": 2.0}`; the longest matching prefix wins.
+            retry_policy: Retries failed idempotent requests if set.
+            circuit_breaker: Fails requests to an endpoint fast while it keeps failing, if set.
+        """
+        super().__init__(
+            api_url=api_url,
+            api_key=api_key,
+            api_key_id=api_key_id,
+            org_id=org_id,
+            auth_mode=auth_mode,
+            sandbox_token=sandbox_token,
+            token_store=token_store,
+            token_refresh_skew=token_refresh_skew,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+        )
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+        self._client = httpx.AsyncClient(
+            limits=limits or DEFAULT_HTTP_LIMITS,
+            http2=http2,
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its pooled connections.
+        """
+        await self._client.aclose()
+
+    async def _fetch_token(self) -> str:
+        response = await self._client.get(
+            self._get_token_url(),
+            headers=self._get_token_headers(),
+        )
+
+        return response.raise_for_status().json()["accessToken"]
+
+    async def _get_token(self) -> str:
+        if self.auth_mode == "sandbox":
+            return self.sandbox_token  # pyright: ignore[reportReturnType]
+
+        token = self._usable_token()
+        if token is None:
+            return await self._refresh_token()
+        if self._should_refresh() and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(
+                self._refresh_token_in_background()
+            )
+        return token
+
+    async def _refresh_token(self) -> str:
+        # Only one task fetches; the others wait and reuse its token
+        async with self._refresh_lock:
+            token = self._usable_token()
+            if token is not None and not self._should_refresh():
+                return token
+            # Only one client sharing the token store fetches; the others adopt its token.
+            # The store lock may block on other processes, so it is taken off the event loop.
+            store_lock = self.token_store.lock()
+            await asyncio.to_thread(store_lock.__enter__)
+            try:
+                token = self._usable_token()
+                if token is not None and not self._should_refresh():
+                    return token
+                token = await self._fetch_token()
+                self.token_store.set(token)
+                self._set_token(token)
+                return token
+            finally:
+                await asyncio.to_thread(store_lock.__exit__, None, None, None)
+
+    async def _refresh_token_in_background(self) -> None:
+        try:
+            await self._refresh_token()
+        except Exception:
+            # the token is still valid, the next request after expiry refreshes synchronously
+            logger.warning("Failed to refresh the Signals API token", exc_info=True)
+
+    async def _send(
+        self,
+        method: HTTP_METHODS,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool | None = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        breaker = self._circuit_breaker_for(endpoint)
+        retryable = self._start_request(method, idempotent)
+        attempt = 0
+        while True:
+            attempt += 1
+            # fetched before checking the circuit, so that auth failures do not count against the endpoint
+            token = await self._get_token()
+            _check_circuit(breaker, endpoint)
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=self._get_url(endpoint),
+                    headers=self._get_headers(token, headers),
+                    params=params,
+                    json=data,
+                    timeout=self._timeout_for(endpoint),
+                )
+            except httpx.TransportError:
+                _record_outcome(breaker, None)
+                delay = self._retry_delay(retryable, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                # e.g. cancelled, so that a trial request does not leave the circuit half open
+                if breaker is not None:
+                    breaker.record_abandoned()
+                raise
+            else:
+                _record_outcome(breaker, response.status_code)
+                delay = self._retry_delay(retryable, attempt, response)
+                if delay is None:
+                    return response
+
+            logger.debug(f"Retrying {method} {endpoint} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _stream_request(
+        self,
+        method: HTTP_METHODS,
+        endpoint: str,
+        params: Optional[Mapping[str, str | list[str]]] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict[str, str]] = None,
+        connect_timeout: Optional[float] = DEFAULT_STREAM_CONNECT_TIMEOUT_SECONDS,
+    ) -> AsyncGenerator[str]:
+        token = await self._get_token()
+
+        async with self._client.stream(
+            method=method,
+            url=self._get_url(endpoint),
+            headers=self._get_headers(token, headers),
+            params=params,
+            json=data,
+            timeout=(connect_timeout, None, None, None),
+        ) as stream:
+            if stream.status_code != 200:
+                await stream.aread()
+                raise _response_error(stream)
+
+            # cancelling the consuming task closes the connection, so no read timeout polling is needed
+            async for line in stream.aiter_lines():
+                yield line
+
+    async def make_request(
+        self,
+        method: HTTP_METHODS,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool | None = None,
+    ) -> dict:
+        """
+        Sends a request to the Signals API and returns the decoded JSON response.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The endpoint, relative to `/api/v1/`.
+            params: Query parameters.
+            data: The JSON body.
+            idempotent: Whether the request may be retried. Defaults to True for GET, PUT and DELETE requests.
+        """
+        response = await self._send(
+            method=method,
+            endpoint=endpoint,
+            params=params,
+            data=data,
+            idempotent=idempotent,
+        )
+        return _parse_response(response)
+
+    async def make_raw_request(
+        self,
+        method: HTTP_METHODS,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool | None = None,
+    ) -> bytes:
+        """
+        Sends a request to the Signals API like `make_request`, but returns the undecoded response body so callers can parse it themselves.
+        """
+        response = await self._send(
+            method=method,
+            endpoint=endpoint,
+            params=params,
+            data=data,
+            idempotent=idempotent,
+        )
+        if response.status_code in (200, 201):
+            return response.content
+        raise _response_error(response)
+
+    async def make_conditional_request(
+        self, endpoint: str, etag: str | None = None
+    ) -> ConditionalResponse:
+        """
+        Sends a GET request that the Signals API can answer with 304 Not Modified when the `etag` still matches.
+
+        Args:
+            endpoint: The endpoint, relative to `/api/v1/`.
+            etag: The `ETag` of the previously received response, if any.
+        Returns:
+            The decoded JSON response, or None if it was not modified, and its `ETag`.
+        """
+        response = await self._send(
+            method="GET",
+            endpoint=endpoint,
+            headers=_conditional_headers(etag),
+        )
+        return _conditional_response(response, etag)
+
+    def make_stream_request(
+        self,
+        method: HTTP_METHODS,
+        endpoint: str,
+        params: Optional[Mapping[str, str | list[str]]] = None,
+        data: Optional[dict[str, object]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> AsyncGenerator[str]:
         return self._stream_request(
             method=method, endpoint=endpoint, params=params, data=data, headers=headers
         )
@@ -203,3 +872,13 @@ class SignalsAPIError(Exception):
     def __str__(self):
         msg = "[Signals API] {0}: {1}"
         return msg.format(self.status_code, self.message)
+
+
+class CircuitOpenError(SignalsAPIError):
+    """
+    Raised without contacting the Signals API while the circuit breaker of an endpoint is open.
+    """
+
+    def __init__(self, endpoint: str):
+        super().__init__(503, f"Circuit breaker open for '{endpoint}'")
+        self.endpoint = endpoint
@@ -0,0 +1,182 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from datetime import timedelta
+from threading import Lock
+from typing import Any, Literal, NamedTuple
+
+from pydantic import BaseModel
+
+from .models import InterventionInstance
+
+DEFAULT_CACHE_MAX_SIZE = 10_000
+DEFAULT_CACHE_TTL = timedelta(seconds=30)
+
+
+class AttributesCacheKey(NamedTuple):
+    kind: Literal["group", "service"]
+    name: str
+    version: int | None
+    attributes: tuple[str, ...] | None
+    attribute_key: str
+    identifier: str
+
+
+class AttributesCacheStats(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class AttributesCache:
+    """
+    A thread-safe, size-bounded LRU cache of online attribute lookups with per attribute group or service TTLs.
+
+    Entries are keyed on the attribute group or service, its version, the requested attributes, the attribute key and the identifier.
+    Pass an instance as `attributes_cache` to `Signals` (or `AttributesClient`) to read through it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        ttl: timedelta = DEFAULT_CACHE_TTL,
+        ttls: Mapping[str, timedelta] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries; the least recently used entry is evicted beyond it.
+            ttl: The default time-to-live of entries.
+            ttls: Time-to-live overrides by attribute group or service name.
+            clock: Monotonic clock returning seconds, for testing.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: OrderedDict[AttributesCacheKey, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        # index of entries by (attribute_key, identifier) so intervention invalidation does not scan the cache
+        self._targets: dict[tuple[str, str], set[AttributesCacheKey]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: AttributesCacheKey) -> dict[str, Any] | None:
+        """
+        Returns a copy of the cached attributes for the key, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(entry[1])
+
+    def get_stale(self, key: AttributesCacheKey) -> dict[str, Any] | None:
+        """
+        Returns a copy of the cached attributes for the key even if they have expired, or None if missing.
+        Used as a fallback while the API is unavailable, so it does not count towards the hit and miss counters.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else dict(entry[1])
+
+    def set(self, key: AttributesCacheKey, attributes: dict[str, Any]) -> None:
+        """
+        Stores a copy of the attributes for the key, evicting the least recently used entries if the cache is full.
+        """
+        expires_at = self._clock() + self._ttl_for(key.name).total_seconds()
+        with self._lock:
+            self._entries[key] = (expires_at, dict(attributes))
+            self._entries.move_to_end(key)
+            self._targets.setdefault((key.attribute_key, key.identifier), set()).add(
+                key
+            )
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._unindex(evicted)
+                self._evictions += 1
+
+    def invalidate(
+        self,
+        *,
+        name: str | None = None,
+        attribute_key: str | None = None,
+        identifier: str | None = None,
+    ) -> int:
+        """
+        Removes all entries matching the given attribute group or service name, attribute key and identifier.
+        Arguments left as None match any value; calling with no arguments clears the cache.
+
+        Returns:
+            The number of removed entries.
+        """
+        with self._lock:
+            candidates = (
+                list(self._targets.get((attribute_key, identifier), ()))
+                if attribute_key is not None and identifier is not None
+                else list(self._entries)
+            )
+            keys = [
+                key
+                for key in candidates
+                if (name is None or key.name == name)
+                and (attribute_key is None or key.attribute_key == attribute_key)
+                and (identifier is None or key.identifier == identifier)
+            ]
+            for key in keys:
+                del self._entries[key]
+                self._unindex(key)
+            return len(keys)
+
+    def invalidate_intervention_target(
+        self, intervention: InterventionInstance
+    ) -> None:
+        """
+        Removes the entries of the identifier an intervention was delivered for.
+        Can be registered as a subscription handler so attributes are refetched after an intervention fires.
+        """
+        target = intervention.target_attribute_key
+        if target is not None:
+            self.invalidate(attribute_key=target.name, identifier=target.id)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._targets.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> AttributesCacheStats:
+        with self._lock:
+            return AttributesCacheStats(
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def _unindex(self, key: AttributesCacheKey) -> None:
+        target = (key.attribute_key, key.identifier)
+        keys = self._targets.get(target)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._targets[target]
+
+    def _ttl_for(self, name: str) -> timedelta:
+        return self.ttls.get(name, self.ttl)
@@ -1,17 +1,77 @@
+import asyncio
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from functools import partial
 from typing import Any
 
-from .api_client import ApiClient
+import httpx
+import pandas as pd
+from pydantic import TypeAdapter
+
+from .api_client import (
+    ApiClient,
+    AsyncApiClient,
+    SignalsAPIError,
+    _is_unavailable,
+)
+from .attributes_cache import AttributesCache, AttributesCacheKey
+from .attributes_frame import AttributesFrameBuilder, DtypeBackend, row_identifiers
+from .cli_logging import get_logger
 from .models import (
     AttributeKeyIdentifiers,
     GetAttributeGroupAttributesRequest,
     GetAttributesResponse,
     GetServiceAttributesRequest,
 )
+from .single_flight import AsyncSingleFlight, SingleFlight
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up `fast_decode`
+    orjson = None
+
+logger = get_logger(__name__)
+
+GET_ONLINE_ATTRIBUTES_ENDPOINT = "get-online-attributes"
+DEFAULT_MAX_IDENTIFIERS_PER_REQUEST = 250
+
+BatchAttributes = dict[str, dict[str, dict[str, Any]]]
+"""Attributes keyed by attribute key name, then by identifier."""
+
+GetAttributesRequest = GetAttributeGroupAttributesRequest | GetServiceAttributesRequest
+CacheKeyFactory = Callable[[str, str], AttributesCacheKey]
+RequestFactory = Callable[[dict[str, list[str]]], GetAttributesRequest]
+
+_ATTRIBUTES_DATA_ADAPTER = TypeAdapter(dict[str, list[Any]])
 
 
 class AttributesClient:
-    def __init__(self, api_client: ApiClient):
+    def __init__(
+        self,
+        api_client: ApiClient,
+        max_identifiers_per_request: int = DEFAULT_MAX_IDENTIFIERS_PER_REQUEST,
+        cache: AttributesCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+    ):
+        """
+        Args:
+            api_client: The API client to send requests with.
+            max_identifiers_per_request: The maximum number of identifiers sent in a single batch request.
+            cache: Optional read-through cache for attribute lookups.
+            coalesce_requests: If True, concurrent identical single-identifier lookups share one in-flight request.
+            serve_stale_on_error: If True, expired cached attributes are returned when the API is unavailable, instead of raising.
+            fast_decode: If True, response bodies are parsed straight into attribute values, with `orjson` if it is installed, skipping the `GetAttributesResponse` model validation.
+        """
         self.api_client = api_client
+        self.max_identifiers_per_request = max_identifiers_per_request
+        self.cache = cache
+        self.serve_stale_on_error = serve_stale_on_error
+        self._stale_cache = cache if serve_stale_on_error else None
+        self.fast_decode = fast_decode
+        self.single_flight: SingleFlight[AttributesCacheKey, dict[str, Any]] | None = (
+            SingleFlight() if coalesce_requests else None
+        )
 
     def get_group_attributes(
         self,
@@ -21,46 +81,580 @@ class AttributesClient:
         attribute_key: str,
         identifier: str,
     ) -> dict[str, Any]:
-        attributes = (
-            [f"{name}_v{version}:{attribute}" for attribute in attributes]
-            if isinstance(attributes, list)
-            else [attributes]
+        request = _build_group_attributes_request(
+            name=name,
+            version=version,
+            attributes=attributes,
+            attribute_keys={attribute_key: [identifier]},
+        )
+        cache_key = _group_cache_key(
+            name, version, attributes, attribute_key, identifier
+        )
+        return self._get(cache_key, request)
+
+    def get_service_attributes(
+        self,
+        name: str,
+        attribute_key: str,
+        identifier: str,
+    ) -> dict[str, Any]:
+        request = _build_service_attributes_request(
+            name=name,
+            attribute_keys={attribute_key: [identifier]},
+        )
+        cache_key = _service_cache_key(name, attribute_key, identifier)
+        return self._get(cache_key, request)
+
+    def get_group_attributes_batch(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves attribute group attributes for many identifiers, sending as few requests as the `max_identifiers_per_request` limit allows.
+
+        Args:
+            name: The name of the attribute group.
+            version: The version of the attribute group.
+            attributes: The list of attributes to retrieve.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return self._get_batch(
+            identifiers,
+            partial(_group_cache_key, name, version, attributes),
+            partial(_build_group_attributes_request, name, version, attributes),
         )
-        attribute_key_identifiers = AttributeKeyIdentifiers(
-            root={attribute_key: [identifier]}
+
+    def get_service_attributes_batch(
+        self,
+        name: str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves service attributes for many identifiers, sending as few requests as the `max_identifiers_per_request` limit allows.
+
+        Args:
+            name: The name of the service.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return self._get_batch(
+            identifiers,
+            partial(_service_cache_key, name),
+            partial(_build_service_attributes_request, name),
         )
 
-        request = GetAttributeGroupAttributesRequest(
+    def get_service_attributes_frame(
+        self,
+        name: str,
+        attribute_key: str,
+        identifiers: Sequence[str],
+        attribute_types: Mapping[str, str] | None = None,
+        dtype_backend: DtypeBackend = "numpy_nullable",
+    ) -> pd.DataFrame:
+        """
+        Retrieves service attributes for many identifiers of one attribute key as a DataFrame, with one row per identifier and one column per attribute.
+        Chunks are requested one after the other and their values are appended column by column; the cache is bypassed.
+
+        Args:
+            name: The name of the service.
+            attribute_key: The name of the attribute key, used as the index name.
+            identifiers: The identifiers to retrieve attributes for. Duplicates are dropped.
+            attribute_types: The declared attribute types by attribute name, used to pick the column dtypes.
+            dtype_backend: 'numpy_nullable' for nullable pandas dtypes, or 'pyarrow' for Arrow-backed dtypes, which requires `pyarrow`.
+        Returns:
+            The attributes indexed by identifier.
+        """
+        builder = AttributesFrameBuilder()
+        for chunk in _chunk_identifiers(
+            {attribute_key: identifiers}, self.max_identifiers_per_request
+        ):
+            response = self._fetch(_build_service_attributes_request(name, chunk))
+            builder.add(attribute_key, chunk[attribute_key], response.data)
+        return builder.build(attribute_key, attribute_types or {}, dtype_backend)
+
+    def _get(
+        self, cache_key: AttributesCacheKey, request: GetAttributesRequest
+    ) -> dict[str, Any]:
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            if self.single_flight is None:
+                return self._fetch_and_store(cache_key, request)
+            # callers sharing a flight each get their own copy of the result
+            return dict(
+                self.single_flight.do(
+                    cache_key, partial(self._fetch_and_store, cache_key, request)
+                )
+            )
+        except (SignalsAPIError, httpx.TransportError) as e:
+            stale = _read_stale(self._stale_cache, cache_key, e)
+            if stale is None:
+                raise
+            return stale
+
+    def _fetch_and_store(
+        self, cache_key: AttributesCacheKey, request: GetAttributesRequest
+    ) -> dict[str, Any]:
+        result = _format_get_attributes_response(self._fetch(request))
+        if self.cache is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    def _get_batch(
+        self,
+        identifiers: Mapping[str, Sequence[str]],
+        cache_key: CacheKeyFactory,
+        build_request: RequestFactory,
+    ) -> BatchAttributes:
+        result, missing = _read_cache(self.cache, cache_key, identifiers)
+        for chunk in _chunk_identifiers(missing, self.max_identifiers_per_request):
+            try:
+                fetched = _format_batch_get_attributes_response(
+                    self._fetch(build_request(chunk)), chunk
+                )
+            except (SignalsAPIError, httpx.TransportError) as e:
+                fetched = _read_stale_batch(self._stale_cache, cache_key, chunk, e)
+                if fetched is None:
+                    raise
+            else:
+                _write_cache(self.cache, cache_key, fetched)
+            _merge_batch_result(result, fetched)
+        return result
+
+    def _fetch(self, request: GetAttributesRequest) -> GetAttributesResponse:
+        data = request.model_dump(mode="json", exclude_none=True)
+        if self.fast_decode:
+            content = self.api_client.make_raw_request(
+                method="POST",
+                endpoint=GET_ONLINE_ATTRIBUTES_ENDPOINT,
+                data=data,
+                idempotent=True,
+            )
+            return GetAttributesResponse.model_construct(
+                data=_decode_attributes_data(content)
+            )
+
+        response = self.api_client.make_request(
+            method="POST",
+            endpoint=GET_ONLINE_ATTRIBUTES_ENDPOINT,
+            data=data,
+            # reads only, so safe to retry
+            idempotent=True,
+        )
+        return GetAttributesResponse(data=response)
+
+
+class AsyncAttributesClient:
+    """
+    Asyncio counterpart of `AttributesClient`, building the same requests and formatting responses the same way.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncApiClient,
+        max_identifiers_per_request: int = DEFAULT_MAX_IDENTIFIERS_PER_REQUEST,
+        cache: AttributesCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+    ):
+        """
+        Args:
+            api_client: The API client to send requests with.
+            max_identifiers_per_request: The maximum number of identifiers sent in a single batch request.
+            cache: Optional read-through cache for attribute lookups.
+            coalesce_requests: If True, concurrent identical single-identifier lookups share one in-flight request.
+            serve_stale_on_error: If True, expired cached attributes are returned when the API is unavailable, instead of raising.
+            fast_decode: If True, response bodies are parsed straight into attribute values, with `orjson` if it is installed, skipping the `GetAttributesResponse` model validation.
+        """
+        self.api_client = api_client
+        self.max_identifiers_per_request = max_identifiers_per_request
+        self.cache = cache
+        self.serve_stale_on_error = serve_stale_on_error
+        self._stale_cache = cache if serve_stale_on_error else None
+        self.fast_decode = fast_decode
+        self.single_flight: (
+            AsyncSingleFlight[AttributesCacheKey, dict[str, Any]] | None
+        ) = (AsyncSingleFlight() if coalesce_requests else None)
+
+    async def get_group_attributes(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        attribute_key: str,
+        identifier: str,
+    ) -> dict[str, Any]:
+        request = _build_group_attributes_request(
+            name=name,
+            version=version,
             attributes=attributes,
-            attribute_keys=attribute_key_identifiers,
+            attribute_keys={attribute_key: [identifier]},
+        )
+        cache_key = _group_cache_key(
+            name, version, attributes, attribute_key, identifier
         )
-        return self._make_request(request)
+        return await self._get(cache_key, request)
 
-    def get_service_attributes(
+    async def get_service_attributes(
         self,
         name: str,
         attribute_key: str,
         identifier: str,
     ) -> dict[str, Any]:
-        attribute_key_identifiers = AttributeKeyIdentifiers(
-            root={attribute_key: [identifier]}
+        request = _build_service_attributes_request(
+            name=name,
+            attribute_keys={attribute_key: [identifier]},
+        )
+        cache_key = _service_cache_key(name, attribute_key, identifier)
+        return await self._get(cache_key, request)
+
+    async def get_group_attributes_batch(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves attribute group attributes for many identifiers, sending the chunked requests concurrently.
+
+        Args:
+            name: The name of the attribute group.
+            version: The version of the attribute group.
+            attributes: The list of attributes to retrieve.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return await self._get_batch(
+            identifiers,
+            partial(_group_cache_key, name, version, attributes),
+            partial(_build_group_attributes_request, name, version, attributes),
         )
 
-        request = GetServiceAttributesRequest(
-            service=name,
-            attribute_keys=attribute_key_identifiers,
+    async def get_service_attributes_batch(
+        self,
+        name: str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves service attributes for many identifiers, sending the chunked requests concurrently.
+
+        Args:
+            name: The name of the service.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return await self._get_batch(
+            identifiers,
+            partial(_service_cache_key, name),
+            partial(_build_service_attributes_request, name),
+        )
+
+    async def get_service_attributes_frame(
+        self,
+        name: str,
+        attribute_key: str,
+        identifiers: Sequence[str],
+        attribute_types: Mapping[str, str] | None = None,
+        dtype_backend: DtypeBackend = "numpy_nullable",
+    ) -> pd.DataFrame:
+        """
+        Retrieves service attributes for many identifiers of one attribute key as a DataFrame, with one row per identifier and one column per attribute.
+        Chunks are requested concurrently and their values are appended column by column; the cache is bypassed.
+
+        Args:
+            name: The name of the service.
+            attribute_key: The name of the attribute key, used as the index name.
+            identifiers: The identifiers to retrieve attributes for. Duplicates are dropped.
+            attribute_types: The declared attribute types by attribute name, used to pick the column dtypes.
+            dtype_backend: 'numpy_nullable' for nullable pandas dtypes, or 'pyarrow' for Arrow-backed dtypes, which requires `pyarrow`.
+        Returns:
+            The attributes indexed by identifier.
+        """
+        chunks = list(
+            _chunk_identifiers(
+                {attribute_key: identifiers}, self.max_identifiers_per_request
+            )
         )
-        return self._make_request(request)
+        responses = await asyncio.gather(
+            *(
+                self._fetch(_build_service_attributes_request(name, chunk))
+                for chunk in chunks
+            )
+        )
+        builder = AttributesFrameBuilder()
+        for chunk, response in zip(chunks, responses):
+            builder.add(attribute_key, chunk[attribute_key], response.data)
+        return builder.build(attribute_key, attribute_types or {}, dtype_backend)
 
-    def _make_request(
-        self, request: GetAttributeGroupAttributesRequest | GetServiceAttributesRequest
+    async def _get(
+        self, cache_key: AttributesCacheKey, request: GetAttributesRequest
     ) -> dict[str, Any]:
-        response = self.api_client.make_request(
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            if self.single_flight is None:
+                return await self._fetch_and_store(cache_key, request)
+            # callers sharing a flight each get their own copy of the result
+            return dict(
+                await self.single_flight.do(
+                    cache_key, partial(self._fetch_and_store, cache_key, request)
+                )
+            )
+        except (SignalsAPIError, httpx.TransportError) as e:
+            stale = _read_stale(self._stale_cache, cache_key, e)
+            if stale is None:
+                raise
+            return stale
+
+    async def _fetch_and_store(
+        self, cache_key: AttributesCacheKey, request: GetAttributesRequest
+    ) -> dict[str, Any]:
+        result = _format_get_attributes_response(await self._fetch(request))
+        if self.cache is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def _get_batch(
+        self,
+        identifiers: Mapping[str, Sequence[str]],
+        cache_key: CacheKeyFactory,
+        build_request: RequestFactory,
+    ) -> BatchAttributes:
+        result, missing = _read_cache(self.cache, cache_key, identifiers)
+
+        async def fetch_chunk(chunk: dict[str, list[str]]) -> BatchAttributes:
+            try:
+                fetched = _format_batch_get_attributes_response(
+                    await self._fetch(build_request(chunk)), chunk
+                )
+            except (SignalsAPIError, httpx.TransportError) as e:
+                stale = _read_stale_batch(self._stale_cache, cache_key, chunk, e)
+                if stale is None:
+                    raise
+                return stale
+            _write_cache(self.cache, cache_key, fetched)
+            return fetched
+
+        responses = await asyncio.gather(
+            *(
+                fetch_chunk(chunk)
+                for chunk in _chunk_identifiers(
+                    missing, self.max_identifiers_per_request
+                )
+            )
+        )
+        for fetched in responses:
+            _merge_batch_result(result, fetched)
+        return result
+
+    async def _fetch(self, request: GetAttributesRequest) -> GetAttributesResponse:
+        data = request.model_dump(mode="json", exclude_none=True)
+        if self.fast_decode:
+            content = await self.api_client.make_raw_request(
+                method="POST",
+                endpoint=GET_ONLINE_ATTRIBUTES_ENDPOINT,
+                data=data,
+                idempotent=True,
+            )
+            return GetAttributesResponse.model_construct(
+                data=_decode_attributes_data(content)
+            )
+
+        response = await self.api_client.make_request(
             method="POST",
-            endpoint="get-online-attributes",
-            data=request.model_dump(mode="json", exclude_none=True),
+            endpoint=GET_ONLINE_ATTRIBUTES_ENDPOINT,
+            data=data,
+            # reads only, so safe to retry
+            idempotent=True,
         )
-        return _format_get_attributes_response(GetAttributesResponse(data=response))
+        return GetAttributesResponse(data=response)
+
+
+def _build_group_attributes_request(
+    name: str,
+    version: int,
+    attributes: list[str] | str,
+    attribute_keys: dict[str, list[str]],
+) -> GetAttributeGroupAttributesRequest:
+    attributes = (
+        [f"{name}_v{version}:{attribute}" for attribute in attributes]
+        if isinstance(attributes, list)
+        else [attributes]
+    )
+
+    return GetAttributeGroupAttributesRequest(
+        attributes=attributes,
+        attribute_keys=AttributeKeyIdentifiers(root=attribute_keys),
+    )
+
+
+def _build_service_attributes_request(
+    name: str,
+    attribute_keys: dict[str, list[str]],
+) -> GetServiceAttributesRequest:
+    return GetServiceAttributesRequest(
+        service=name,
+        attribute_keys=AttributeKeyIdentifiers(root=attribute_keys),
+    )
+
+
+def _group_cache_key(
+    name: str,
+    version: int,
+    attributes: list[str] | str,
+    attribute_key: str,
+    identifier: str,
+) -> AttributesCacheKey:
+    return AttributesCacheKey(
+        kind="group",
+        name=name,
+        version=version,
+        attributes=tuple(attributes) if isinstance(attributes, list) else (attributes,),
+        attribute_key=attribute_key,
+        identifier=identifier,
+    )
+
+
+def _service_cache_key(
+    name: str, attribute_key: str, identifier: str
+) -> AttributesCacheKey:
+    return AttributesCacheKey(
+        kind="service",
+        name=name,
+        version=None,
+        attributes=None,
+        attribute_key=attribute_key,
+        identifier=identifier,
+    )
+
+
+def _read_cache(
+    cache: AttributesCache | None,
+    cache_key: CacheKeyFactory,
+    identifiers: Mapping[str, Sequence[str]],
+) -> tuple[BatchAttributes, dict[str, list[str]]]:
+    """
+    Splits the identifiers into the attributes already cached and the identifiers that still need fetching.
+    """
+    if cache is None:
+        return {}, {key: list(values) for key, values in identifiers.items()}
+
+    cached: BatchAttributes = {}
+    missing: dict[str, list[str]] = {}
+    for attribute_key, key_identifiers in identifiers.items():
+        for identifier in dict.fromkeys(key_identifiers):
+            attributes = cache.get(cache_key(attribute_key, identifier))
+            if attributes is None:
+                missing.setdefault(attribute_key, []).append(identifier)
+            else:
+                cached.setdefault(attribute_key, {})[identifier] = attributes
+    return cached, missing
+
+
+def _write_cache(
+    cache: AttributesCache | None,
+    cache_key: CacheKeyFactory,
+    fetched: BatchAttributes,
+) -> None:
+    if cache is None:
+        return
+    for attribute_key, attributes_by_identifier in fetched.items():
+        for identifier, attributes in attributes_by_identifier.items():
+            # identifiers missing from the response are requested again next time
+            if attributes:
+                cache.set(cache_key(attribute_key, identifier), attributes)
+
+
+def _read_stale(
+    cache: AttributesCache | None, cache_key: AttributesCacheKey, error: Exception
+) -> dict[str, Any] | None:
+    """
+    Returns the expired cached attributes for the key if the API is unavailable, or None if they cannot be served.
+    """
+    if cache is None or not _is_unavailable(error):
+        return None
+    attributes = cache.get_stale(cache_key)
+    if attributes is not None:
+        logger.warning(
+            f"Serving stale attributes, the Signals API is unavailable: {error}"
+        )
+    return attributes
+
+
+def _read_stale_batch(
+    cache: AttributesCache | None,
+    cache_key: CacheKeyFactory,
+    identifiers: dict[str, list[str]],
+    error: Exception,
+) -> BatchAttributes | None:
+    """
+    Returns the expired cached attributes of all the identifiers if the API is unavailable, or None if any of them cannot be served.
+    """
+    if cache is None or not _is_unavailable(error):
+        return None
+    result: BatchAttributes = {}
+    for attribute_key, key_identifiers in identifiers.items():
+        for identifier in key_identifiers:
+            attributes = cache.get_stale(cache_key(attribute_key, identifier))
+            if attributes is None:
+                return None
+            result.setdefault(attribute_key, {})[identifier] = attributes
+    logger.warning(f"Serving stale attributes, the Signals API is unavailable: {error}")
+    return result
+
+
+def _chunk_identifiers(
+    identifiers: Mapping[str, Sequence[str]], chunk_size: int
+) -> Iterator[dict[str, list[str]]]:
+    """
+    Splits the identifiers into chunks of at most `chunk_size` identifiers in total, dropping duplicates and keeping their order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunk: dict[str, list[str]] = {}
+    size = 0
+    for attribute_key, key_identifiers in identifiers.items():
+        for identifier in dict.fromkeys(key_identifiers):
+            chunk.setdefault(attribute_key, []).append(identifier)
+            size += 1
+            if size == chunk_size:
+                yield chunk
+                chunk = {}
+                size = 0
+    if chunk:
+        yield chunk
+
+
+def _decode_attributes_data(content: bytes) -> dict[str, list[Any]]:
+    """
+    Parses a get-online-attributes response body into attribute values by attribute name, checking only its shape.
+    """
+    if orjson is None:
+        return _ATTRIBUTES_DATA_ADAPTER.validate_json(content)
+
+    data = orjson.loads(content)
+    if not isinstance(data, dict) or not all(
+        isinstance(values, list) for values in data.values()
+    ):
+        raise ValueError("Expected a mapping of attribute names to lists of values")
+    return data
 
 
 def _format_get_attributes_response(response: GetAttributesResponse) -> dict[str, Any]:
@@ -79,3 +673,39 @@ def _format_get_attributes_response(response: GetAttributesResponse) -> dict[str
             result[key] = value[0] if value else None
 
     return result
+
+
+def _format_batch_get_attributes_response(
+    response: GetAttributesResponse, identifiers: dict[str, list[str]]
+) -> BatchAttributes:
+    """
+    Splits a multi-identifier GetAttributesResponse into attributes per identifier.
+
+    The rows of the response are matched to the identifiers by `row_identifiers`; identifiers without a row get no attributes.
+
+    Args:
+        response: The GetAttributesResponse to format.
+        identifiers: The attribute key identifiers, in the order they were sent in the request.
+
+    Returns:
+        A dictionary of attribute key names to identifiers to attribute values.
+    """
+    result: BatchAttributes = {
+        attribute_key: {identifier: {} for identifier in key_identifiers}
+        for attribute_key, key_identifiers in identifiers.items()
+    }
+    for index, row in enumerate(row_identifiers(identifiers, response.data)):
+        if row is None:
+            logger.debug("Ignoring a row for an identifier that was not requested")
+            continue
+        attribute_key, identifier = row
+        result[attribute_key][identifier] = {
+            key: values[index] for key, values in response.data.items()
+        }
+
+    return result
+
+
+def _merge_batch_result(result: BatchAttributes, other: BatchAttributes) -> None:
+    for attribute_key, attributes in other.items():
+        result.setdefault(attribute_key, {}).update(attributes)
@@ -0,0 +1,379 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from threading import Condition, Thread
+from typing import Any, NamedTuple, Self
+
+from pydantic import BaseModel
+
+from .attributes_client import AsyncAttributesClient, AttributesClient, BatchAttributes
+from .metrics import Histogram, HistogramSnapshot
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_WAIT = timedelta(milliseconds=2)
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+
+BATCH_SIZE_BOUNDS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+WAIT_TIME_MS_BOUNDS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100)
+
+
+class _BatchKey(NamedTuple):
+    """Lookups with the same key are merged into one multi-identifier request."""
+
+    name: str
+    version: int | None
+    attributes: tuple[str, ...] | str | None
+
+
+class _PendingLookup(NamedTuple):
+    attribute_key: str
+    identifier: str
+    enqueued_at: float
+    future: "Future[dict[str, Any]] | asyncio.Future[dict[str, Any]]"
+
+
+class AttributesDispatcherStats(BaseModel):
+    batch_sizes: HistogramSnapshot
+    wait_times_ms: HistogramSnapshot
+
+
+class _BaseAttributesDispatcher:
+    def __init__(self, max_batch_size: int, max_wait: timedelta):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._buckets: dict[_BatchKey, list[_PendingLookup]] = {}
+        self._batch_sizes = Histogram(BATCH_SIZE_BOUNDS)
+        self._wait_times_ms = Histogram(WAIT_TIME_MS_BOUNDS)
+
+    def stats(self) -> AttributesDispatcherStats:
+        """
+        Returns histograms of the dispatched batch sizes and of the time lookups waited before being dispatched.
+        """
+        return AttributesDispatcherStats(
+            batch_sizes=self._batch_sizes.snapshot(),
+            wait_times_ms=self._wait_times_ms.snapshot(),
+        )
+
+    def _record_dispatch(self, lookups: list[_PendingLookup]) -> dict[str, list[str]]:
+        now = time.monotonic()
+        self._batch_sizes.observe(len(lookups))
+        identifiers: dict[str, list[str]] = {}
+        for lookup in lookups:
+            self._wait_times_ms.observe((now - lookup.enqueued_at) * 1000)
+            identifiers.setdefault(lookup.attribute_key, []).append(lookup.identifier)
+        return identifiers
+
+
+class AttributesDispatcher(_BaseAttributesDispatcher):
+    """
+    Merges single-identifier lookups from many threads into multi-identifier requests.
+
+    Lookups for the same attribute group (with the same attributes) or service are collected until `max_batch_size` lookups are waiting or the oldest one has waited `max_wait`.
+    They are then sent as one batch request from a small worker pool, and each caller's future receives its own identifier's attributes.
+    """
+
+    def __init__(
+        self,
+        attributes_client: AttributesClient,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: timedelta = DEFAULT_MAX_WAIT,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ):
+        """
+        Args:
+            attributes_client: The client used to send the merged batch requests, e.g. `signals.attributes`.
+            max_batch_size: Dispatch a batch as soon as this many lookups are waiting for it.
+            max_wait: Dispatch a batch once its oldest lookup has waited this long.
+            max_concurrent_batches: The number of batch requests that can be in flight at once.
+        """
+        super().__init__(max_batch_size=max_batch_size, max_wait=max_wait)
+        self.attributes_client = attributes_client
+        self._condition = Condition()
+        self._deadlines: dict[_BatchKey, float] = {}
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_concurrent_batches, thread_name_prefix="SignalsAttributesDispatcher"
+        )
+        self._thread = Thread(
+            target=self._run,
+            name=f"SignalsAttributesDispatcher-{id(self)}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def submit_group_attributes(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        attribute_key: str,
+        identifier: str,
+    ) -> "Future[dict[str, Any]]":
+        """
+        Queues an attribute group lookup and returns a future for its attributes.
+        """
+        batch_key = _BatchKey(
+            name=name,
+            version=version,
+            attributes=(
+                tuple(attributes) if isinstance(attributes, list) else attributes
+            ),
+        )
+        return self._submit(batch_key, attribute_key, identifier)
+
+    def submit_service_attributes(
+        self, name: str, attribute_key: str, identifier: str
+    ) -> "Future[dict[str, Any]]":
+        """
+        Queues a service lookup and returns a future for its attributes.
+        """
+        batch_key = _BatchKey(name=name, version=None, attributes=None)
+        return self._submit(batch_key, attribute_key, identifier)
+
+    def get_group_attributes(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        attribute_key: str,
+        identifier: str,
+    ) -> dict[str, Any]:
+        """
+        Retrieves the attributes for a given attribute group, blocking until the batch it was merged into completes.
+        """
+        return self.submit_group_attributes(
+            name=name,
+            version=version,
+            attributes=attributes,
+            attribute_key=attribute_key,
+            identifier=identifier,
+        ).result()
+
+    def get_service_attributes(
+        self, name: str, attribute_key: str, identifier: str
+    ) -> dict[str, Any]:
+        """
+        Retrieves the attributes for a given service, blocking until the batch it was merged into completes.
+        """
+        return self.submit_service_attributes(
+            name=name, attribute_key=attribute_key, identifier=identifier
+        ).result()
+
+    def close(self) -> None:
+        """
+        Dispatches any waiting lookups, waits for in-flight batches and stops the dispatcher.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            for batch_key in list(self._buckets):
+                self._dispatch(batch_key)
+            self._condition.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _submit(
+        self, batch_key: _BatchKey, attribute_key: str, identifier: str
+    ) -> "Future[dict[str, Any]]":
+        future: Future[dict[str, Any]] = Future()
+        lookup = _PendingLookup(attribute_key, identifier, time.monotonic(), future)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Dispatcher is closed")
+            bucket = self._buckets.setdefault(batch_key, [])
+            bucket.append(lookup)
+            if len(bucket) >= self.max_batch_size:
+                self._dispatch(batch_key)
+            elif len(bucket) == 1:
+                self._deadlines[batch_key] = (
+                    lookup.enqueued_at + self.max_wait.total_seconds()
+                )
+                self._condition.notify()
+        return future
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                for batch_key, deadline in list(self._deadlines.items()):
+                    if deadline <= now:
+                        self._dispatch(batch_key)
+                timeout = (
+                    min(self._deadlines.values()) - now if self._deadlines else None
+                )
+                self._condition.wait(timeout)
+
+    def _dispatch(self, batch_key: _BatchKey) -> None:
+        # called with the condition held
+        lookups = self._buckets.pop(batch_key)
+        self._deadlines.pop(batch_key, None)
+        self._executor.submit(self._send, batch_key, lookups)
+
+    def _send(self, batch_key: _BatchKey, lookups: list[_PendingLookup]) -> None:
+        # cancelled lookups are left out, and the others can no longer be cancelled once running
+        lookups = [
+            lookup for lookup in lookups if lookup.future.set_running_or_notify_cancel()
+        ]
+        if not lookups:
+            return
+        identifiers = self._record_dispatch(lookups)
+        try:
+            if batch_key.attributes is None:
+                result = self.attributes_client.get_service_attributes_batch(
+                    name=batch_key.name, identifiers=identifiers
+                )
+            else:
+                result = self.attributes_client.get_group_attributes_batch(
+                    name=batch_key.name,
+                    version=batch_key.version,  # pyright: ignore[reportArgumentType]
+                    attributes=_attributes_argument(batch_key),
+                    identifiers=identifiers,
+                )
+        except Exception as e:
+            for lookup in lookups:
+                lookup.future.set_exception(e)
+            return
+
+        for lookup in lookups:
+            lookup.future.set_result(_lookup_result(result, lookup))
+
+
+class AsyncAttributesDispatcher(_BaseAttributesDispatcher):
+    """
+    Asyncio counterpart of `AttributesDispatcher`, merging lookups awaited concurrently on one event loop.
+    """
+
+    def __init__(
+        self,
+        attributes_client: AsyncAttributesClient,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: timedelta = DEFAULT_MAX_WAIT,
+    ):
+        """
+        Args:
+            attributes_client: The client used to send the merged batch requests, e.g. `signals.attributes`.
+            max_batch_size: Dispatch a batch as soon as this many lookups are waiting for it.
+            max_wait: Dispatch a batch once its oldest lookup has waited this long.
+        """
+        super().__init__(max_batch_size=max_batch_size, max_wait=max_wait)
+        self.attributes_client = attributes_client
+        self._timers: dict[_BatchKey, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def get_group_attributes(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        attribute_key: str,
+        identifier: str,
+    ) -> dict[str, Any]:
+        """
+        Retrieves the attributes for a given attribute group once the batch it was merged into completes.
+        """
+        batch_key = _BatchKey(
+            name=name,
+            version=version,
+            attributes=(
+                tuple(attributes) if isinstance(attributes, list) else attributes
+            ),
+        )
+        return await self._submit(batch_key, attribute_key, identifier)
+
+    async def get_service_attributes(
+        self, name: str, attribute_key: str, identifier: str
+    ) -> dict[str, Any]:
+        """
+        Retrieves the attributes for a given service once the batch it was merged into completes.
+        """
+        batch_key = _BatchKey(name=name, version=None, attributes=None)
+        return await self._submit(batch_key, attribute_key, identifier)
+
+    async def aclose(self) -> None:
+        """
+        Dispatches any waiting lookups and waits for in-flight batches.
+        """
+        for batch_key in list(self._buckets):
+            self._dispatch(batch_key)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _submit(
+        self, batch_key: _BatchKey, attribute_key: str, identifier: str
+    ) -> "asyncio.Future[dict[str, Any]]":
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        bucket = self._buckets.setdefault(batch_key, [])
+        bucket.append(
+            _PendingLookup(attribute_key, identifier, time.monotonic(), future)
+        )
+        if len(bucket) >= self.max_batch_size:
+            self._dispatch(batch_key)
+        elif len(bucket) == 1:
+            self._timers[batch_key] = loop.call_later(
+                self.max_wait.total_seconds(), self._dispatch, batch_key
+            )
+        return future
+
+    def _dispatch(self, batch_key: _BatchKey) -> None:
+        lookups = self._buckets.pop(batch_key, None)
+        timer = self._timers.pop(batch_key, None)
+        if timer is not None:
+            timer.cancel()
+        if lookups:
+            task = asyncio.create_task(self._send(batch_key, lookups))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch_key: _BatchKey, lookups: list[_PendingLookup]) -> None:
+        identifiers = self._record_dispatch(lookups)
+        try:
+            if batch_key.attributes is None:
+                result = await self.attributes_client.get_service_attributes_batch(
+                    name=batch_key.name, identifiers=identifiers
+                )
+            else:
+                result = await self.attributes_client.get_group_attributes_batch(
+                    name=batch_key.name,
+                    version=batch_key.version,  # pyright: ignore[reportArgumentType]
+                    attributes=_attributes_argument(batch_key),
+                    identifiers=identifiers,
+                )
+        except Exception as e:
+            for lookup in lookups:
+                if not lookup.future.done():
+                    lookup.future.set_exception(e)
+            return
+
+        for lookup in lookups:
+            if not lookup.future.done():
+                lookup.future.set_result(_lookup_result(result, lookup))
+
+
+def _attributes_argument(batch_key: _BatchKey) -> list[str] | str:
+    return (
+        list(batch_key.attributes)
+        if isinstance(batch_key.attributes, tuple)
+        else batch_key.attributes or ""
+    )
+
+
+def _lookup_result(result: BatchAttributes, lookup: _PendingLookup) -> dict[str, Any]:
+    # every caller gets its own copy, as identifiers repeated in a batch share a row
+    return dict(result.get(lookup.attribute_key, {}).get(lookup.identifier, {}))
@@ -0,0 +1,194 @@
+from collections.abc import Iterable, Mapping, Sequence
+from numbers import Number
+from typing import Any, Literal
+
+import pandas as pd
+
+from .models import AttributeGroupResponse
+
+DtypeBackend = Literal["numpy_nullable", "pyarrow"]
+
+# nullable pandas dtypes of the scalar attribute types, missing values become <NA>
+NUMPY_NULLABLE_DTYPES = {
+    "bytes": "object",
+    "string": "string",
+    "int32": "Int32",
+    "int64": "Int64",
+    "double": "Float64",
+    "float": "Float32",
+    "bool": "boolean",
+}
+
+PYARROW_TYPES = {
+    "bytes": "binary",
+    "string": "string",
+    "int32": "int32",
+    "int64": "int64",
+    "double": "float64",
+    "float": "float32",
+    "bool": "bool_",
+}
+
+
+def attribute_types(
+    attribute_groups: Iterable[AttributeGroupResponse],
+) -> dict[str, str]:
+    """
+    Collects the declared types of the attributes and fields of attribute groups, by attribute name.
+    """
+    types: dict[str, str] = {}
+    for attribute_group in attribute_groups:
+        for attribute in (attribute_group.attributes or []) + (
+            attribute_group.fields or []
+        ):
+            types[attribute.name] = attribute.type
+    return types
+
+
+def row_identifiers(
+    identifiers: Mapping[str, Sequence[str]], data: Mapping[str, list[Any]]
+) -> list[tuple[str, str] | None]:
+    """
+    Matches the rows of a multi-identifier response to the requested identifiers.
+
+    Rows are matched by the attribute key columns the API returns, so that rows dropped or reordered by the server are attributed correctly.
+    Only if no attribute key column is returned are the rows matched by their position in the request.
+
+    Args:
+        identifiers: The attribute key identifiers, in the order they were sent in the request.
+        data: The attribute values of the response, by attribute name.
+    Returns:
+        The attribute key and identifier of every row, or None for rows that match no requested identifier.
+    """
+    requested = [
+        (attribute_key, identifier)
+        for attribute_key, key_identifiers in identifiers.items()
+        for identifier in key_identifiers
+    ]
+    key_columns = [
+        attribute_key for attribute_key in identifiers if attribute_key in data
+    ]
+    if not key_columns:
+        for name, values in data.items():
+            if len(values) != len(requested):
+                raise ValueError(
+                    f"Expected {len(requested)} values for attribute '{name}', received {len(values)}"
+                )
+        return requested if data else []
+
+    row_count = len(data[key_columns[0]])
+    for name, values in data.items():
+        if len(values) != row_count:
+            raise ValueError(
+                f"Expected {row_count} values for attribute '{name}', received {len(values)}"
+            )
+    wanted = set(requested)
+    rows: list[tuple[str, str] | None] = []
+    for index in range(row_count):
+        row = None
+        for attribute_key in key_columns:
+            value = data[attribute_key][index]
+            if value is not None and (attribute_key, str(value)) in wanted:
+                row = (attribute_key, str(value))
+                break
+        rows.append(row)
+    return rows
+
+
+class AttributesFrameBuilder:
+    """
+    Accumulates chunked multi-identifier responses column by column, then builds a DataFrame with one row per identifier.
+    """
+
+    def __init__(self) -> None:
+        self.identifiers: list[str] = []
+        self.columns: dict[str, list[Any]] = {}
+
+    def add(
+        self,
+        attribute_key: str,
+        identifiers: Sequence[str],
+        data: Mapping[str, list[Any]],
+    ) -> None:
+        """
+        Appends a row for every requested identifier with the values of one response, matched by `row_identifiers`.
+        Identifiers missing from the response get missing values.
+        """
+        offset = len(self.identifiers)
+        positions = {
+            identifier: offset + index for index, identifier in enumerate(identifiers)
+        }
+        rows = row_identifiers({attribute_key: list(identifiers)}, data)
+        self.identifiers.extend(identifiers)
+        for name, values in data.items():
+            column = self.columns.get(name)
+            if column is None:
+                # attribute first seen in this chunk, the earlier rows are missing
+                column = self.columns[name] = [None] * offset
+            column.extend([None] * len(identifiers))
+            for row, value in zip(rows, values):
+                if row is not None:
+                    column[positions[row[1]]] = value
+        for column in self.columns.values():
+            if len(column) < len(self.identifiers):
+                column.extend([None] * (len(self.identifiers) - len(column)))
+
+    def build(
+        self,
+        index_name: str,
+        types: Mapping[str, str],
+        dtype_backend: DtypeBackend = "numpy_nullable",
+    ) -> pd.DataFrame:
+        """
+        Builds the DataFrame, converting every column to the dtype of its declared attribute type.
+
+        Args:
+            index_name: The name of the identifier index, usually the attribute key.
+            types: The declared attribute types by attribute name; undeclared columns keep inferred dtypes.
+            dtype_backend: Either nullable numpy-backed dtypes or Arrow-backed dtypes, which require `pyarrow`.
+        """
+        return pd.DataFrame(
+            {
+                name: _column(values, types.get(name), dtype_backend)
+                for name, values in self.columns.items()
+            },
+            index=pd.Index(self.identifiers, name=index_name),
+        )
+
+
+def _column(
+    values: list[Any], attribute_type: str | None, dtype_backend: DtypeBackend
+) -> Any:
+    if attribute_type is None:
+        return values
+    if attribute_type == "unix_timestamp":
+        timestamps = _timestamps(values)
+        if dtype_backend == "pyarrow":
+            return timestamps.astype(_arrow_dtype(attribute_type))
+        return timestamps
+    if dtype_backend == "pyarrow":
+        return pd.array(values, dtype=_arrow_dtype(attribute_type))
+    return pd.array(values, dtype=NUMPY_NULLABLE_DTYPES.get(attribute_type, "object"))
+
+
+def _timestamps(values: list[Any]) -> pd.DatetimeIndex:
+    numeric = all(isinstance(value, Number) for value in values if value is not None)
+    return pd.to_datetime(values, utc=True, unit="s" if numeric else None)
+
+
+def _arrow_dtype(attribute_type: str) -> pd.ArrowDtype:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Arrow-backed attribute frames require pyarrow. Install it with `pip install pyarrow`."
+        ) from e
+
+    is_list = attribute_type.endswith("_list")
+    scalar_type = attribute_type.removesuffix("_list")
+    arrow_type = (
+        pa.timestamp("ns", tz="UTC")
+        if scalar_type == "unix_timestamp"
+        else getattr(pa, PYARROW_TYPES[scalar_type])()
+    )
+    return pd.ArrowDtype(pa.list_(arrow_type) if is_list else arrow_type)
@@ -0,0 +1,101 @@
+import math
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import ContextManager, Protocol
+
+import jwt
+
+
+class TokenStore(Protocol):
+    """
+    Storage for the API access token, shared by every client that uses the same store.
+
+    Implementations must be safe to use from multiple threads. `lock()` guards a token refresh, so that only one holder of the store fetches a new token at a time.
+    """
+
+    def get(self) -> str | None: ...
+
+    def set(self, token: str) -> None: ...
+
+    def lock(self) -> ContextManager[None]: ...
+
+
+class InMemoryTokenStore:
+    """
+    Keeps the token in memory, shared between the clients of one process that use this store.
+    """
+
+    def __init__(self) -> None:
+        self._token: str | None = None
+        self._lock = Lock()
+
+    def get(self) -> str | None:
+        return self._token
+
+    def set(self, token: str) -> None:
+        self._token = token
+
+    def lock(self) -> ContextManager[None]:
+        return _held(self._lock)
+
+
+class FileTokenStore:
+    """
+    Keeps the token in a file so that many worker processes on a host can share one token.
+
+    Writes are atomic and refreshes are serialized across processes with an exclusive `flock` on a sibling `.lock` file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+        self._thread_lock = Lock()
+
+    def get(self) -> str | None:
+        try:
+            return self.path.read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def set(self, token: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(token)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        import fcntl  # POSIX only, so only required when the store is used
+
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._thread_lock, open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def token_expiry(token: str) -> float:
+    """
+    Returns the `exp` claim of a JWT as a UNIX timestamp, or infinity if it has none.
+    The signature is not verified, as the token is only read to decide when to refresh it.
+    """
+    claims = jwt.decode(token, options={"verify_signature": False, "verify_exp": False})
+    exp = claims.get("exp")
+    return float(exp) if exp is not None else math.inf
+
+
+@contextmanager
+def _held(lock: Lock) -> Iterator[None]:
+    with lock:
+        yield
@@ -20,8 +20,10 @@ from .cli_params import (
     ATTRIBUTE_GROUP_NAME,
     ATTRIBUTE_GROUP_VERSION,
     AUTH_MODE,
+    CHECK,
     CHECK_API,
     CHECK_AUTH,
+    COMPILED_TEMPLATES_PATH,
     ORG_ID,
     PROJECT_NAME,
     REPO_PATH,
@@ -29,6 +31,7 @@ from .cli_params import (
     TARGET_TYPE,
     UPDATE,
     VERBOSE,
+    WORKERS,
 )
 
 # Create the main Typer app with metadata
@@ -170,6 +173,9 @@ def generate(
     sandbox_token: SANDBOX_TOKEN = None,
     project_name: PROJECT_NAME = None,
     update: UPDATE = False,
+    workers: WORKERS = 1,
+    check: CHECK = False,
+    compiled_templates_path: COMPILED_TEMPLATES_PATH = None,
     verbose: VERBOSE = False,
 ) -> None:
     """Generate dbt project assets such as data models, macros and config files."""
@@ -187,11 +193,22 @@ def generate(
             repo_path=str(validated_path),
             project_name=project_name,
             update=update,
+            workers=workers,
+            check=check,
+            compiled_templates_path=compiled_templates_path,
         )
         if not success:
-            logger.error("Failed to generate dbt models")
+            logger.error(
+                "Generated dbt models are out of date"
+                if check
+                else "Failed to generate dbt models"
+            )
             raise typer.Exit(code=1)
-        logger.success("✅ Successfully generated dbt models")
+        logger.success(
+            "✅ Generated dbt models are up to date"
+            if check
+            else "✅ Successfully generated dbt models"
+        )
     except Exception as e:
         logger.error(f"Error during model generation: {str(e)}")
         raise typer.Exit(code=1)
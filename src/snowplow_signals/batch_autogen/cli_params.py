@@ -90,11 +90,19 @@ REPO_PATH = Annotated[
 UPDATE = Annotated[
     bool,
     typer.Option(
-        help="Whether to update existing files",
+        help="Whether to regenerate and rewrite every file, even if its inputs and content are unchanged",
         envvar="SNOWPLOW_UPDATE",
     ),
 ]
 
+CHECK = Annotated[
+    bool,
+    typer.Option(
+        help="Only report the generated files that are out of date, without writing them",
+        envvar="SNOWPLOW_CHECK",
+    ),
+]
+
 
 VERBOSE = Annotated[
     bool,
@@ -106,6 +114,23 @@ VERBOSE = Annotated[
     ),
 ]
 
+WORKERS = Annotated[
+    int,
+    typer.Option(
+        help="Number of processes generating projects in parallel",
+        envvar="SNOWPLOW_WORKERS",
+        min=1,
+    ),
+]
+
+COMPILED_TEMPLATES_PATH = Annotated[
+    Optional[str],
+    typer.Option(
+        help="Directory keeping the templates compiled to Python modules between runs, so that later runs skip compiling them",
+        envvar="SNOWPLOW_COMPILED_TEMPLATES_PATH",
+    ),
+]
+
 
 ATTRIBUTE_GROUP_NAME = Annotated[
     Optional[str],
@@ -1,10 +1,18 @@
 import json
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Optional
+from queue import SimpleQueue
+from typing import NamedTuple, Optional
 
 from snowplow_signals.batch_autogen.models.batch_source_config import BatchSourceConfig
-from snowplow_signals.batch_autogen.models.dbt_asset_generator import DbtAssetGenerator
+from snowplow_signals.batch_autogen.models.dbt_asset_generator import (
+    DbtAssetGenerator,
+    precompiled_templates,
+    templates_digest,
+)
 from snowplow_signals.batch_autogen.models.dbt_config_generator import (
     DbtConfigGenerator,
 )
@@ -12,6 +20,11 @@ from snowplow_signals.batch_autogen.models.dbt_project_setup import (
     DbtBaseConfig,
     DbtProjectSetup,
 )
+from snowplow_signals.batch_autogen.utils.manifest import (
+    SDK_VERSION,
+    GeneratedFiles,
+    digest,
+)
 from snowplow_signals.batch_autogen.utils.utils import (
     WarehouseType,
     batch_source_from_path,
@@ -23,6 +36,13 @@ from ..api_client import ApiClient
 logger = get_logger(__name__)
 
 
+class ProjectGenerationResult(NamedTuple):
+    project_name: str
+    success: bool
+    logs: list[logging.LogRecord]
+    """The log records of a project generated in a worker process, emitted by the parent process."""
+
+
 class BatchAutogenClient:
     """Client for generating batch projects (dbt) for Snowplow data"""
 
@@ -67,7 +87,13 @@ class BatchAutogenClient:
         return setup.setup_all_projects()
 
     def generate_models(
-        self, repo_path: str, project_name: Optional[str] = None, update: bool = False
+        self,
+        repo_path: str,
+        project_name: Optional[str] = None,
+        update: bool = False,
+        workers: int = 1,
+        check: bool = False,
+        compiled_templates_path: Optional[str] = None,
     ):
         """
         Generate dbt project assets such as data models, macros and config files.
@@ -76,15 +102,35 @@ class BatchAutogenClient:
             repo_path: Path to the repository where projects are stored
             project_name: Optional name of a specific project to generate models for.
                          If None, models will be generated for all projects.
-            update: Whether to update existing files
+            update: Whether to regenerate and rewrite every file, even if its inputs and content are unchanged
+            workers: Number of processes generating projects in parallel when generating all projects.
+            check: Whether to only report the files that are out of date, without writing them.
+            compiled_templates_path: Optional directory keeping the templates compiled to Python modules between runs, so that later runs skip compiling them.
+
+        Returns:
+            bool: Whether the generation was successful, or in check mode whether every file is up to date
         """
+        templates_path = (
+            precompiled_templates(Path(compiled_templates_path))
+            if compiled_templates_path
+            else None
+        )
         # If project name is specified, process only that project
         if project_name:
             if os.path.exists(os.path.join(repo_path, project_name)):
-                success = self._generate_project_assets(repo_path, project_name, update)
+                success = _generate_project_assets(
+                    repo_path,
+                    project_name,
+                    self.target_type,
+                    update,
+                    check,
+                    templates_path,
+                )
                 if not success:
                     logger.error(
-                        f"Failed to generate models for project: {project_name}"
+                        f"Project is out of date: {project_name}"
+                        if check
+                        else f"Failed to generate models for project: {project_name}"
                     )
                     return False
                 return True
@@ -106,194 +152,81 @@ class BatchAutogenClient:
                 )
                 return False
 
-            success_count = 0
-            for project_dir in project_dirs:
-                success = self._generate_project_assets(repo_path, project_dir, update)
-                if success:
-                    success_count += 1
+            if workers > 1 and len(project_dirs) > 1:
+                results = self._generate_projects_in_pool(
+                    repo_path, project_dirs, update, check, workers, templates_path
+                )
+            else:
+                results = [
+                    ProjectGenerationResult(
+                        project_dir,
+                        _generate_project_assets(
+                            repo_path,
+                            project_dir,
+                            self.target_type,
+                            update,
+                            check,
+                            templates_path,
+                        ),
+                        [],
+                    )
+                    for project_dir in project_dirs
+                ]
 
+            failed = [result.project_name for result in results if not result.success]
+            if failed:
+                logger.error(
+                    f"Projects are out of date: {', '.join(sorted(failed))}"
+                    if check
+                    else f"Failed to generate models for projects: {', '.join(sorted(failed))}"
+                )
+            success_count = len(results) - len(failed)
             logger.info(
                 f"✅ Processed {success_count} out of {len(project_dirs)} projects/attribute groups"
             )
-            return success_count > 0
+            # a check fails on any out of date project
+            return not failed if check else success_count > 0
 
-    def _generate_project_assets(
-        self, repo_path: str, project_name: str, update: bool = False
-    ):
+    def _generate_projects_in_pool(
+        self,
+        repo_path: str,
+        project_dirs: list[str],
+        update: bool,
+        check: bool,
+        workers: int,
+        compiled_templates_path: Path | None = None,
+    ) -> list[ProjectGenerationResult]:
         """
-        Generate dbt project assets for a specific project/attribute group.
-
-        Args:
-            repo_path: Base repository path containing multiple projects
-            project_name: Project/attribute group directory name
-            update: Whether to update existing files
+        Generate the assets of several projects in a pool of worker processes.
 
-        Returns:
-            bool: Whether the generation was successful
+        The log records of each project are emitted together once it finishes, and a failing project does not stop the others.
         """
-        project_path = Path(os.path.join(repo_path, project_name))
-        base_config_path = Path(os.path.join(project_path, "configs/base_config.json"))
-        dbt_config_path = Path(os.path.join(project_path, "configs/dbt_config.json"))
-
-        if not os.path.exists(base_config_path):
-            logger.warning(
-                f"No base_config.json found for project {project_name}, skipping..."
-            )
-            return False
-
-        logger.info(f"Processing project/attribute group: {project_name}")
-
-        # Load base config and generate dbt config
-        with open(base_config_path) as f:
-            data = json.load(f)
-            base_config = DbtBaseConfig.model_validate(data)
-
-        generator = DbtConfigGenerator(
-            base_config_data=base_config, target_type=self.target_type
-        )
-        dbt_config = generator.create_dbt_config()
-
-        # Ensure configs directory exists
-        os.makedirs(os.path.dirname(dbt_config_path), exist_ok=True)
-
-        with open(dbt_config_path, "w") as f:
-            json.dump(dbt_config.model_dump(), f, indent=4)
-
-        logger.success(
-            f"📄 Dbt Config file generated for {project_name}: dbt_config.json"
-        )
-        logger.info(f"Generating dbt project assets for {project_name}...")
-
-        # Define the assets to generate
-        assets = [
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/base/scratch",
-                filename="base_events_this_run",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/base/scratch",
-                filename="base_new_event_limits",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/filtered_events/scratch",
-                filename="filtered_events_this_run",
-                asset_type="model",
-                custom_context=dbt_config.filtered_events.model_dump(),
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/filtered_events",
-                filename="filtered_events",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/daily_aggregates/scratch",
-                filename="daily_aggregates_this_run",
-                asset_type="model",
-                custom_context=dbt_config.daily_agg.model_dump(),
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/daily_aggregates/manifest",
-                filename="daily_aggregation_manifest",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/daily_aggregates/scratch",
-                filename="days_to_process",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/daily_aggregates",
-                filename="daily_aggregates",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="macros",
-                filename="get_limits_for_attributes",
-                asset_type="macro",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="macros",
-                filename="allow_refresh",
-                asset_type="macro",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="macros",
-                filename="get_cluster_by_values",
-                asset_type="macro",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="",
-                filename="dbt_project",
-                asset_type="yml",
-                custom_context={"attribute_key": base_config.attribute_key},
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="",
-                filename="packages",
-                asset_type="yml",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/base/manifest",
-                filename="incremental_manifest",
-                asset_type="model",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/attributes",
-                filename="attributes",
-                asset_type="model",
-                custom_context={
-                    **dbt_config.attributes.model_dump(),
-                    "attribute_key": base_config.attribute_key,
-                },
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="models/base",
-                filename="src_base",
-                asset_type="yml",
-            ),
-            DbtAssetGenerator(
-                project_path=project_path,
-                asset_subpath="snapshots",
-                filename="snapshot",
-                asset_type="snapshot",
-                custom_context={
-                    **dbt_config.attributes.model_dump(),
-                    "attribute_key": base_config.attribute_key,
-                },
-            ),
-        ]
-
-        for asset in assets:
-            try:
-                context = (
-                    asset.custom_context
-                    if asset.custom_context is not None
-                    else dbt_config.model_dump()
-                )
-                asset.generate_asset(update=update, context=context)
-            except Exception as e:
-                logger.error(f"❌ Error generating models for {asset.filename}: {e}")
-                return False
-        logger.success(f"✅ Finished generating models for {project_name}!")
-        return True
+        results = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(project_dirs))) as pool:
+            futures = {
+                pool.submit(
+                    _generate_project_in_worker,
+                    repo_path,
+                    project_dir,
+                    self.target_type,
+                    update,
+                    check,
+                    compiled_templates_path,
+                ): project_dir
+                for project_dir in project_dirs
+            }
+            for future in as_completed(futures):
+                project_dir = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # e.g. the worker process died
+                    logger.error(f"❌ Error generating models for {project_dir}: {e}")
+                    result = ProjectGenerationResult(project_dir, False, [])
+                for record in result.logs:
+                    logging.getLogger(record.name).handle(record)
+                results.append(result)
+        return results
 
     def sync_model(
         self,
@@ -383,3 +316,267 @@ class BatchAutogenClient:
         except Exception as e:
             logger.error(f"\n⚠️ The table {table_name} couldn't be registered.")
             raise e
+
+
+def _generate_project_assets(
+    repo_path: str,
+    project_name: str,
+    target_type: WarehouseType,
+    update: bool = False,
+    check: bool = False,
+    compiled_templates_path: Path | None = None,
+):
+    """
+    Generate dbt project assets for a specific project/attribute group.
+
+    The project is skipped if it was last generated from the same base config, templates and SDK version and none of its files changed since;
+    otherwise only the files whose content changes are rewritten.
+
+    Args:
+        repo_path: Base repository path containing multiple projects
+        project_name: Project/attribute group directory name
+        target_type: Target database type
+        update: Whether to regenerate and rewrite every file, even if its inputs and content are unchanged
+        check: Whether to only report the files that are out of date, without writing them
+        compiled_templates_path: Optional directory of templates precompiled by `compile_templates`
+
+    Returns:
+        bool: Whether the generation was successful, or in check mode whether every file is up to date
+    """
+    project_path = Path(os.path.join(repo_path, project_name))
+    base_config_path = Path(os.path.join(project_path, "configs/base_config.json"))
+    dbt_config_path = Path(os.path.join(project_path, "configs/dbt_config.json"))
+
+    if not os.path.exists(base_config_path):
+        logger.warning(
+            f"No base_config.json found for project {project_name}, skipping..."
+        )
+        return False
+
+    logger.info(f"Processing project/attribute group: {project_name}")
+
+    base_config_data = base_config_path.read_bytes()
+    files = GeneratedFiles(project_path, check=check)
+    inputs = digest(
+        SDK_VERSION, target_type, project_name, base_config_data, templates_digest()
+    )
+    if not update and files.is_current(inputs):
+        logger.info(f"⏭️ {project_name} is up to date, skipping")
+        return True
+
+    # Load base config and generate dbt config
+    base_config = DbtBaseConfig.model_validate(json.loads(base_config_data))
+
+    generator = DbtConfigGenerator(
+        base_config_data=base_config, target_type=target_type
+    )
+    dbt_config = generator.create_dbt_config()
+
+    files.write(
+        dbt_config_path, json.dumps(dbt_config.model_dump(), indent=4), force=update
+    )
+
+    logger.success(f"📄 Dbt Config file generated for {project_name}: dbt_config.json")
+    logger.info(f"Generating dbt project assets for {project_name}...")
+
+    # Define the assets to generate
+    assets = [
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/base/scratch",
+            filename="base_events_this_run",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/base/scratch",
+            filename="base_new_event_limits",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/filtered_events/scratch",
+            filename="filtered_events_this_run",
+            files=files,
+            asset_type="model",
+            custom_context=dbt_config.filtered_events.model_dump(),
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/filtered_events",
+            filename="filtered_events",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/daily_aggregates/scratch",
+            filename="daily_aggregates_this_run",
+            files=files,
+            asset_type="model",
+            custom_context=dbt_config.daily_agg.model_dump(),
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/daily_aggregates/manifest",
+            filename="daily_aggregation_manifest",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/daily_aggregates/scratch",
+            filename="days_to_process",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/daily_aggregates",
+            filename="daily_aggregates",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="macros",
+            filename="get_limits_for_attributes",
+            files=files,
+            asset_type="macro",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="macros",
+            filename="allow_refresh",
+            files=files,
+            asset_type="macro",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="macros",
+            filename="get_cluster_by_values",
+            files=files,
+            asset_type="macro",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="",
+            filename="dbt_project",
+            files=files,
+            asset_type="yml",
+            custom_context={"attribute_key": base_config.attribute_key},
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="",
+            filename="packages",
+            files=files,
+            asset_type="yml",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/base/manifest",
+            filename="incremental_manifest",
+            files=files,
+            asset_type="model",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/attributes",
+            filename="attributes",
+            files=files,
+            asset_type="model",
+            custom_context={
+                **dbt_config.attributes.model_dump(),
+                "attribute_key": base_config.attribute_key,
+            },
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="models/base",
+            filename="src_base",
+            files=files,
+            asset_type="yml",
+        ),
+        DbtAssetGenerator(
+            project_path=project_path,
+            compiled_templates_path=compiled_templates_path,
+            asset_subpath="snapshots",
+            filename="snapshot",
+            files=files,
+            asset_type="snapshot",
+            custom_context={
+                **dbt_config.attributes.model_dump(),
+                "attribute_key": base_config.attribute_key,
+            },
+        ),
+    ]
+
+    for asset in assets:
+        try:
+            context = (
+                asset.custom_context
+                if asset.custom_context is not None
+                else dbt_config.model_dump()
+            )
+            asset.generate_asset(update=update, context=context)
+        except Exception as e:
+            logger.error(f"❌ Error generating models for {asset.filename}: {e}")
+            return False
+
+    if check:
+        for path in files.changed:
+            logger.warning(f"{project_name}/{path} is out of date")
+        return not files.changed
+    files.save(inputs)
+    logger.success(f"✅ Finished generating models for {project_name}!")
+    return True
+
+
+def _generate_project_in_worker(
+    repo_path: str,
+    project_name: str,
+    target_type: WarehouseType,
+    update: bool,
+    check: bool,
+    compiled_templates_path: Path | None = None,
+) -> ProjectGenerationResult:
+    """
+    Generates the assets of a project in a worker process, capturing its log records instead of emitting them,
+    so that the parent process can emit the records of each project together.
+    """
+    records: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root = logging.getLogger()
+    handlers, level = root.handlers, root.level
+    root.handlers = [QueueHandler(records)]
+    root.setLevel(logging.INFO)
+    try:
+        success = _generate_project_assets(
+            repo_path, project_name, target_type, update, check, compiled_templates_path
+        )
+    except Exception as e:
+        logger.error(f"❌ Error generating models for {project_name}: {e}")
+        success = False
+    finally:
+        root.handlers = handlers
+        root.setLevel(level)
+    logs = [records.get() for _ in range(records.qsize())]
+    return ProjectGenerationResult(project_name, success, logs)
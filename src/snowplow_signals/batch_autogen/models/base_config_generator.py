@@ -1,4 +1,6 @@
 import re
+from collections import Counter
+from functools import cache
 from typing import Dict, FrozenSet, Literal, Set
 
 from pydantic import BaseModel
@@ -30,6 +32,18 @@ SQLAggregationLiteral = Literal[
 ]
 
 
+@cache
+def _sql_reserved_words(target_type: WarehouseType) -> frozenset[str]:
+    """Returns the lowercased reserved words of the SQL dialect of a warehouse."""
+    if target_type == "snowflake":
+        reserved_words_dict = Snowflake.Tokenizer.KEYWORDS
+    elif target_type == "bigquery":
+        reserved_words_dict = BigQuery.Tokenizer.KEYWORDS
+    else:
+        reserved_words_dict = Databricks.Tokenizer.KEYWORDS
+    return frozenset(kw.lower() for kw in reserved_words_dict.keys())
+
+
 class DbtBaseConfig(BaseModel):
     events: list[str]
     properties: list[dict[str, str]]
@@ -55,6 +69,14 @@ class BaseConfigGenerator:
         self.events = []
         self.properties = []
         self.periods = set()
+        # indexes of the above, updated incrementally
+        self._seen_events: Set[str] = set()
+        self._property_entries: Counter[FrozenSet] = Counter()
+        # properties before this position have unique cleaned names
+        self._resolved_count = 0
+        self._used_names: Set[str] = set()
+        # the cleaned name of the first resolved property with a given raw name
+        self._cleaned_names: Dict[str, str] = {}
 
     @property
     def sorted_periods(self) -> list:
@@ -88,13 +110,6 @@ class BaseConfigGenerator:
         Output: "device_class"
         """
 
-        if self.target_type == "snowflake":
-            reserved_words_dict = Snowflake.Tokenizer.KEYWORDS
-        elif self.target_type == "bigquery":
-            reserved_words_dict = BigQuery.Tokenizer.KEYWORDS
-        else:
-            reserved_words_dict = Databricks.Tokenizer.KEYWORDS
-        sql_reserved_words = reserved_words_dict.keys()
         if ":" in property:
             suffix = property.split(":")[1]
         elif "." in property:
@@ -104,7 +119,7 @@ class BaseConfigGenerator:
 
         cleaned = re.sub(r"([a-z])([A-Z])", r"\1_\2", suffix).lower()
 
-        if cleaned in (kw.lower() for kw in sql_reserved_words):
+        if cleaned in _sql_reserved_words(self.target_type):
             cleaned += "_col"
 
         return cleaned
@@ -120,18 +135,21 @@ class BaseConfigGenerator:
         if not filtered_entry:
             return
 
-        # Use a set to track unique dictionaries
-        seen: Set[FrozenSet] = {frozenset(d.items()) for d in self.properties}
-
+        # Track the entries of the list to deduplicate without rescanning it
         frozen_entry = frozenset(filtered_entry.items())
-        if frozen_entry not in seen:
+        if not self._property_entries[frozen_entry]:
+            self._property_entries[frozen_entry] += 1
             self.properties.append(filtered_entry)
 
     def resolve_property_name_collisions(self):
-        seen = set()
-        updated = []
+        """Suffixes cleaned property names that are already in use, splitting entries into one property each.
+        Only the properties added since the last call are processed, as the ones before already have unique names.
+        """
+        updated = self.properties[: self._resolved_count]
+        seen = self._used_names
 
-        for entry in self.properties:
+        for entry in self.properties[self._resolved_count :]:
+            self._property_entries[frozenset(entry.items())] -= 1
             for raw_key, cleaned in entry.items():
                 if cleaned in seen:
                     base = cleaned
@@ -141,8 +159,11 @@ class BaseConfigGenerator:
                     cleaned = f"{base}_{i}"
                 seen.add(cleaned)
                 updated.append({raw_key: cleaned})
+                self._property_entries[frozenset({(raw_key, cleaned)})] += 1
+                self._cleaned_names.setdefault(raw_key, cleaned)
 
         self.properties = updated
+        self._resolved_count = len(updated)
 
     def _get_full_event_reference_array(
         self, event_object_list: list[Event]
@@ -251,7 +272,7 @@ class BaseConfigGenerator:
         Through looping through the attributes, events, properties and periods are also extracted.
         """
         # First add events and properties, they are needed for proper column reference for the steps
-        self.events.extend(self._get_full_event_reference_array(attribute.events))
+        self._add_to_events(self._get_full_event_reference_array(attribute.events))
         if attribute.property:
             self.add_to_properties(
                 {attribute.property: self.get_cleaned_property_name(attribute.property)}
@@ -271,14 +292,10 @@ class BaseConfigGenerator:
                 step_type="filtered_events",
                 enabled=False,
                 aggregation=None,
-                column_name=next(
-                    (
-                        v
-                        for d in self.properties
-                        for k, v in d.items()
-                        if k == attribute.property
-                    ),
-                    None,
+                column_name=(
+                    self._cleaned_names.get(attribute.property)
+                    if attribute.property
+                    else None
                 ),  # Get the cleaned column name for a given raw property key from the list of property mappings. Returns None if the key is not found.
                 modeling_criteria=None,
             )
@@ -381,9 +398,6 @@ class BaseConfigGenerator:
             )
         )
 
-        new_events = self._get_full_event_reference_array(attribute.events)
-        # Use dict.fromkeys to maintain order while deduplicating
-        self.events = list(dict.fromkeys(self.events + new_events))
         if attribute.property:
             self.add_to_properties(
                 {attribute.property: self.get_cleaned_property_name(attribute.property)}
@@ -393,6 +407,13 @@ class BaseConfigGenerator:
 
         return steps
 
+    def _add_to_events(self, events: list[str]):
+        """Adds the events that are not already listed, maintaining their order."""
+        for event in events:
+            if event not in self._seen_events:
+                self._seen_events.add(event)
+                self.events.append(event)
+
     def create_base_config(self) -> DbtBaseConfig:
         """
         Process attribute definitions and return the base config format (this would eventually allow for users to make changes, if needed).
@@ -1,9 +1,21 @@
+import shutil
+import tempfile
+from functools import cache
 from pathlib import Path
 from typing import Any, Literal
 
-from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    select_autoescape,
+)
 from pydantic import BaseModel, ConfigDict, Field
 
+from snowplow_signals.batch_autogen.utils.manifest import GeneratedFiles, digest
 from snowplow_signals.batch_autogen.utils.utils import write_file
 from snowplow_signals.cli_logging import get_logger
 
@@ -12,6 +24,78 @@ logger = get_logger(__name__)
 AssetTypeLiteral = Literal["model", "macro", "snapshot", "yml"]
 FileTypeLiteral = Literal["sql", "yml"]
 
+TEMPLATE_PATH = Path(__file__).parent.parent / "templates"
+
+
+@cache
+def _jinja_environment(compiled_templates_path: Path | None = None) -> Environment:
+    """
+    Returns the process-wide Jinja environment, which caches every template once compiled.
+
+    Args:
+        compiled_templates_path: Optional directory of templates precompiled by `compile_templates`, loaded in preference to the template sources
+    """
+    if not TEMPLATE_PATH.exists():
+        raise FileNotFoundError(f"Template directory not found: {TEMPLATE_PATH}")
+
+    loader: BaseLoader = FileSystemLoader([TEMPLATE_PATH])
+    if compiled_templates_path is not None:
+        # templates missing from the precompiled set still load from source
+        loader = ChoiceLoader([ModuleLoader(compiled_templates_path), loader])
+    # the templates ship with the package, so they are not checked for changes once compiled
+    return Environment(loader=loader, autoescape=select_autoescape(), auto_reload=False)
+
+
+@cache
+def templates_digest() -> str:
+    """Returns the digest of the sources of all templates."""
+    return digest(
+        *(
+            part
+            for template in sorted(TEMPLATE_PATH.glob("*.j2"))
+            for part in (template.name, template.read_bytes())
+        )
+    )
+
+
+def compile_templates(target: Path) -> Path:
+    """
+    Precompiles the templates into Python modules, so that generation skips compiling them.
+
+    Args:
+        target: Directory to write the compiled templates to
+    Returns:
+        The directory to pass as `compiled_templates_path` to `DbtAssetGenerator`
+    """
+    target.mkdir(parents=True, exist_ok=True)
+    _jinja_environment().compile_templates(str(target), zip=None, ignore_errors=False)
+    return target
+
+
+def precompiled_templates(cache_path: Path) -> Path:
+    """
+    Returns the directory of the templates of this SDK precompiled under `cache_path`, compiling them on first use.
+    Each set of templates is compiled into its own subdirectory, so a cache shared across SDK versions never serves outdated templates.
+
+    Args:
+        cache_path: Directory keeping the precompiled templates between runs
+    Returns:
+        The directory to pass as `compiled_templates_path` to `DbtAssetGenerator`
+    """
+    target = cache_path / templates_digest()[:16]
+    if target.is_dir():
+        return target
+    cache_path.mkdir(parents=True, exist_ok=True)
+    # compiled next to the target and renamed, so concurrent runs never load a partial set
+    staging = Path(tempfile.mkdtemp(dir=cache_path, prefix=f".{target.name}."))
+    compile_templates(staging)
+    try:
+        staging.rename(target)
+    except OSError:
+        # another run compiled the same templates first
+        shutil.rmtree(staging, ignore_errors=True)
+    return target
+
 
 class DbtAssetGenerator(BaseModel):
     """
@@ -23,6 +107,8 @@ class DbtAssetGenerator(BaseModel):
         filename: Name of the file to generate (without extension)
         asset_type: Type of dbt asset (model, macro, snapshot, or yml)
         custom_context: Optional custom context for template rendering
+        compiled_templates_path: Optional directory of templates precompiled by `compile_templates`
+        files: Optional writer tracking the generated files of the project
     """
 
     model_config = ConfigDict(
@@ -41,6 +127,14 @@ class DbtAssetGenerator(BaseModel):
     custom_context: dict[str, Any] | None = Field(
         default=None, description="Optional custom context for template rendering"
     )
+    compiled_templates_path: Path | None = Field(
+        default=None,
+        description="Optional directory of templates precompiled by `compile_templates`",
+    )
+    files: GeneratedFiles | None = Field(
+        default=None,
+        description="Optional writer tracking the generated files of the project",
+    )
 
     @property
     def project_name(self) -> str:
@@ -48,16 +142,12 @@ class DbtAssetGenerator(BaseModel):
         return self.project_path.name
 
     def _jinja_environment(self) -> Environment:
-        """Creates and configures a Jinja environment for template rendering."""
-        template_path = Path(__file__).parent.parent / "templates"
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template directory not found: {template_path}")
+        """Returns the shared Jinja environment for template rendering."""
+        return _jinja_environment(self.compiled_templates_path)
 
-        loader = FileSystemLoader([template_path])
-        env = Environment(loader=loader, autoescape=select_autoescape())
-        env.globals["project_name"] = self.project_name
-        env.globals["model"] = self
-        return env
+    def _render_context(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Adds the project-specific values to the template context."""
+        return {"project_name": self.project_name, "model": self, **context}
 
     def get_filepath(self) -> Path:
         """Public method to return the constructed filepath."""
@@ -95,7 +185,7 @@ class DbtAssetGenerator(BaseModel):
         Generate a dbt asset using Jinja templating.
 
         Args:
-            update: Whether to update existing files
+            update: Whether to rewrite the file even if its content is unchanged
             context: Template context data for rendering
 
         Raises:
@@ -106,10 +196,12 @@ class DbtAssetGenerator(BaseModel):
         template = self._get_template(env)
 
         try:
-            rendered_content = template.render(**context)
+            rendered_content = template.render(self._render_context(context))
             filepath = self.get_filepath()
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            write_file(filepath, rendered_content)
+            if self.files is not None:
+                self.files.write(filepath, rendered_content, force=update)
+            else:
+                write_file(filepath, rendered_content)
             logger.info(f"📄 {self.asset_type.capitalize()}: {self.filename} generated")
         except Exception as e:
             raise ValueError(f"Failed to generate asset {self.filename}: {str(e)}")
@@ -1,5 +1,6 @@
-import json
-import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Literal
 
 import typer
@@ -16,10 +17,17 @@ from snowplow_signals.cli_logging import get_logger
 
 from ...api_client import ApiClient
 from ...models import AttributeGroupResponse
-from ..utils.utils import WarehouseType, filter_latest_model_version_by_name
+from ...registry_client import RegistryClient
+from ..utils.utils import (
+    WarehouseType,
+    filter_latest_model_version_by_name,
+    write_json,
+)
 
 logger = get_logger(__name__)
 
+DEFAULT_MAX_WORKERS = 8
+
 
 class DbtProjectSetup:
     """
@@ -35,12 +43,14 @@ class DbtProjectSetup:
         repo_path: Annotated[str, typer.Option()] = "customer_repo",
         attribute_group_name: str | None = None,
         attribute_group_version: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         self.api_client = api_client
         self.repo_path = repo_path
         self.attribute_group_name = attribute_group_name
         self.attribute_group_version = attribute_group_version
         self.target_type = target_type
+        self.max_workers = max_workers
 
     def create_project_directories(
         self,
@@ -49,18 +59,10 @@ class DbtProjectSetup:
         batch_source_config: dict,
     ):
         # Create project-specific output directory
-        project_output_dir = os.path.join(self.repo_path, setup_project_name, "configs")
-        if not os.path.exists(project_output_dir):
-            os.makedirs(project_output_dir)
-        base_config_path = os.path.join(project_output_dir, "base_config.json")
-        with open(base_config_path, "w") as f:
-            json.dump(base_config.model_dump(), f, indent=4)
+        project_output_dir = Path(self.repo_path, setup_project_name, "configs")
+        write_json(project_output_dir / "base_config.json", base_config.model_dump())
         logger.success(f"📄 Base config file generated for {setup_project_name}")
-        batch_source_config_path = os.path.join(
-            project_output_dir, "batch_source_config.json"
-        )
-        with open(batch_source_config_path, "w") as f:
-            json.dump(batch_source_config, f, indent=4)
+        write_json(project_output_dir / "batch_source_config.json", batch_source_config)
         logger.success(
             f"📄 Batch source config file generated for {setup_project_name}"
         )
@@ -92,70 +94,72 @@ class DbtProjectSetup:
         )
 
     def setup_all_projects(self):
-        """Sets up dbt files for one or all projects."""
+        """Sets up dbt files for one or all projects, up to `max_workers` at a time."""
 
         attribute_groups = self._get_attribute_groups()
-        for attribute_group in attribute_groups:
-            # Skip attribute groups that have no attributes (i.e., only sync existing tables)
-            if (not attribute_group.attributes) and attribute_group.fields:
-                logger.info(
-                    f"Skipping batch attribute group '{attribute_group.name}_{attribute_group.version}' as it has no attributes and only fields."
-                )
-                continue
-            group_project_name = f"{attribute_group.name}_{attribute_group.version}"
-            project_config = self._get_attribute_group_project_config(attribute_group)
-            batch_source_config = self._get_default_batch_source_config(
-                attribute_group
-            ).model_dump(mode="json", exclude_none=True)
-            self.create_project_directories(
-                group_project_name, project_config, batch_source_config
-            )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(self._setup_project, attribute_group)
+                for attribute_group in attribute_groups
+            ]
+        # raises the error of the first failing project, once all are done
+        for future in futures:
+            future.result()
 
         return True
 
-    def _fetch_attribute_groups(self) -> list[AttributeGroupResponse]:
-        attribute_groups = self.api_client.make_request(
-            method="GET",
-            endpoint="registry/attribute_groups/",
-            params={"offline": True, "property_syntax": self.target_type},
+    def _setup_project(self, attribute_group: AttributeGroupResponse) -> None:
+        """Generates and writes the configs of the project of an attribute group."""
+        # Skip attribute groups that have no attributes (i.e., only sync existing tables)
+        if (not attribute_group.attributes) and attribute_group.fields:
+            logger.info(
+                f"Skipping batch attribute group '{attribute_group.name}_{attribute_group.version}' as it has no attributes and only fields."
+            )
+            return
+        group_project_name = f"{attribute_group.name}_{attribute_group.version}"
+        project_config = self._get_attribute_group_project_config(attribute_group)
+        batch_source_config = self._get_default_batch_source_config(
+            attribute_group
+        ).model_dump(mode="json", exclude_none=True)
+        self.create_project_directories(
+            group_project_name, project_config, batch_source_config
         )
-        return [
-            AttributeGroupResponse.model_validate(group) for group in attribute_groups
-        ]
+
+    def _fetch_attribute_groups(self) -> Iterator[AttributeGroupResponse]:
+        groups = RegistryClient(self.api_client).iter_attribute_groups(
+            offline=True,
+            name_prefix=self.attribute_group_name,
+            property_syntax=self.target_type,
+        )
+        for group in groups:
+            logger.debug(f"Received attribute group: {group.model_dump_json()}")
+            yield group
 
     def _get_attribute_groups(self) -> list[AttributeGroupResponse]:
         logger.info("🔗 Fetching attribute groups from API")
-        all_attribute_groups = self._fetch_attribute_groups()
-        logger.debug(
-            f"Received API response: {[group.model_dump_json() for group in all_attribute_groups]}"
-        )
-        if len(all_attribute_groups) == 0:
-            raise ValueError("No attribute groups available.")
-        latest_groups = filter_latest_model_version_by_name(all_attribute_groups)
-        # Filter by project name if specified
-        if self.attribute_group_name:
-            if not self.attribute_group_version:
-                project_groups = [
-                    group
-                    for group in latest_groups
-                    if group.name == self.attribute_group_name
-                ]
-                if not project_groups:
-                    raise ValueError(
-                        f"No project/attribute group found with name: {self.attribute_group_name}"
-                    )
-                return project_groups
-            else:
-                project_groups = [
-                    group
-                    for group in all_attribute_groups
-                    if group.name == self.attribute_group_name
-                    and group.version == self.attribute_group_version
-                ]
-                if not project_groups:
-                    raise ValueError(
-                        f"No project/attribute group found with name: {self.attribute_group_name} and version: {self.attribute_group_version}"
-                    )
-                return project_groups
-        else:
+        # groups are consumed as they are fetched, only the matching ones are kept
+        groups = self._fetch_attribute_groups()
+        if not self.attribute_group_name:
+            latest_groups = filter_latest_model_version_by_name(groups)
+            if not latest_groups:
+                raise ValueError("No attribute groups available.")
             return latest_groups
+
+        # the name prefix filter also matches longer names
+        groups = (group for group in groups if group.name == self.attribute_group_name)
+        if not self.attribute_group_version:
+            project_groups = filter_latest_model_version_by_name(groups)
+            if not project_groups:
+                raise ValueError(
+                    f"No project/attribute group found with name: {self.attribute_group_name}"
+                )
+            return project_groups
+
+        project_groups = [
+            group for group in groups if group.version == self.attribute_group_version
+        ]
+        if not project_groups:
+            raise ValueError(
+                f"No project/attribute group found with name: {self.attribute_group_name} and version: {self.attribute_group_version}"
+            )
+        return project_groups
@@ -0,0 +1,117 @@
+import hashlib
+from importlib.metadata import version
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from snowplow_signals.batch_autogen.utils.utils import write_file
+from snowplow_signals.cli_logging import get_logger
+
+logger = get_logger(__name__)
+
+SDK_VERSION = version("snowplow-signals")
+MANIFEST_PATH = "configs/.generation_manifest.json"
+
+
+def digest(*parts: str | bytes) -> str:
+    """
+    Returns the SHA-256 hex digest of the given parts, each length-prefixed so that the boundaries between them count.
+    """
+    sha = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        sha.update(len(data).to_bytes(8, "big"))
+        sha.update(data)
+    return sha.hexdigest()
+
+
+class GenerationManifest(BaseModel):
+    """
+    The record of the last generation of a dbt project, stored in the project at `MANIFEST_PATH`.
+    """
+
+    inputs: str = ""
+    """The digest of everything the generated files derive from."""
+    files: dict[str, str] = {}
+    """The digest of the content of each generated file, by path relative to the project."""
+
+
+class GeneratedFiles:
+    """
+    Writes the generated files of a dbt project, leaving files whose content is unchanged untouched,
+    and records them in the manifest of the project so that a later generation from the same inputs can be skipped.
+
+    In check mode nothing is written; the files that would change are collected in `changed` instead.
+    """
+
+    def __init__(self, project_path: Path, check: bool = False):
+        """
+        Args:
+            project_path: Path to the dbt project root
+            check: Whether to only report the files that would change, without writing them
+        """
+        self.project_path = project_path
+        self.check = check
+        self.manifest = self._load_manifest()
+        self.changed: list[str] = []
+        self._files: dict[str, str] = {}
+
+    def is_current(self, inputs: str) -> bool:
+        """
+        Returns whether the project was last generated from the given inputs and none of its files changed since.
+        """
+        if not self.manifest.files or self.manifest.inputs != inputs:
+            return False
+        return all(
+            self._content_digest(self.project_path / path) == file_digest
+            for path, file_digest in self.manifest.files.items()
+        )
+
+    def write(self, file_path: Path, content: str, force: bool = False) -> None:
+        """
+        Write a generated file, unless it already has the given content.
+
+        Args:
+            file_path: The path to the file to write to
+            content: The content to write to the file
+            force: Whether to rewrite the file even if its content is unchanged
+        """
+        path = file_path.relative_to(self.project_path).as_posix()
+        content_digest = digest(content)
+        self._files[path] = content_digest
+        if not force and self._content_digest(file_path) == content_digest:
+            return
+        self.changed.append(path)
+        if not self.check:
+            write_file(file_path, content)
+
+    def save(self, inputs: str) -> None:
+        """
+        Record the files written since this object was created as generated from the given inputs.
+        """
+        if self.check:
+            return
+        self.manifest = GenerationManifest(inputs=inputs, files=self._files)
+        write_file(
+            self.project_path / MANIFEST_PATH, self.manifest.model_dump_json(indent=4)
+        )
+
+    def _load_manifest(self) -> GenerationManifest:
+        try:
+            return GenerationManifest.model_validate_json(
+                (self.project_path / MANIFEST_PATH).read_bytes()
+            )
+        except FileNotFoundError:
+            return GenerationManifest()
+        except ValidationError:
+            logger.warning(
+                f"Ignoring the invalid generation manifest of {self.project_path.name}"
+            )
+            return GenerationManifest()
+
+    @staticmethod
+    def _content_digest(file_path: Path) -> str | None:
+        try:
+            return digest(file_path.read_text())
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
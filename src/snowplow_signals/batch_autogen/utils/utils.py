@@ -1,7 +1,11 @@
 import datetime
 import json
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Literal, Protocol, TypeVar
+from typing import Any, Dict, Literal, Protocol, TextIO, TypeVar
+from uuid import uuid4
 
 from pydantic import ValidationError
 
@@ -15,20 +19,50 @@ logger = get_logger(__name__)
 WarehouseType = Literal["snowflake", "bigquery", "databricks"]
 
 
+@contextmanager
+def _atomic_open(file_path: Path) -> Iterator[TextIO]:
+    """
+    Opens a temporary file that replaces `file_path` once closed without error,
+    so that readers never see a partially written file.
+    Creates any necessary directories if they do not exist.
+    """
+    if not file_path.parent.exists():
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = file_path.with_name(f".{file_path.name}.{uuid4().hex}.tmp")
+    try:
+        with open(temp_path, "w") as f:
+            yield f
+        os.replace(temp_path, file_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
 def write_file(file_path: Path, content: str) -> None:
     """
     Write string content to a file.
     Creates the file and any necessary directories if they do not exist.
+    The file is replaced at once, so that readers never see a partially written file.
     Args:
         file_path (Path): The path to the file to write to.
         content (Optional[str]): The content to write to the file.
     """
-    if not file_path.parent.exists():
-        file_path.parent.mkdir(parents=True)
-    with open(file_path, "w") as f:
+    with _atomic_open(file_path) as f:
         f.write(content)
 
 
+def write_json(file_path: Path, data: Any) -> None:
+    """
+    Write data to a file as indented JSON, encoding it in chunks straight to the file rather than building the whole document in memory first.
+    Creates the file and any necessary directories if they do not exist.
+    The file is replaced at once, so that readers never see a partially written file.
+    Args:
+        file_path (Path): The path to the file to write to.
+        data (Any): The JSON-serializable data to write.
+    """
+    with _atomic_open(file_path) as f:
+        json.dump(data, f, indent=4)
+
+
 class VersionedModel(Protocol):
     name: str
     version: Any
@@ -37,7 +71,7 @@ class VersionedModel(Protocol):
 T = TypeVar("T", bound=VersionedModel)
 
 
-def filter_latest_model_version_by_name(data: list[T]) -> list[T]:
+def filter_latest_model_version_by_name(data: Iterable[T]) -> list[T]:
     latest_versions: Dict[str, T] = {}
     for item in data:
         name = item.name
@@ -1,66 +1,95 @@
+from collections.abc import AsyncIterator, Iterator
+from datetime import timedelta
 from typing import Literal
 
-from .api_client import ApiClient
-from .interventions_subscription import InterventionsSubscription
+from .api_client import ApiClient, AsyncApiClient
+from .interventions_subscription import (
+    DEFAULT_HANDLER_TIMEOUT,
+    DEFAULT_MAX_BUFFER_SIZE,
+    DEFAULT_MAX_CONCURRENT_HANDLERS,
+    AsyncInterventionsSubscription,
+    InterventionsSubscription,
+    OverflowPolicy,
+)
 from .models import (
     AttributeKeyIdentifiers,
     InterventionInstance,
     RuleInterventionInput,
     RuleInterventionOutput,
 )
+from .pagination import DEFAULT_PAGE_SIZE, aiter_items, iter_items, list_params
+from .registry_cache import RegistryCache, async_cached_get, cached_get
+
+INTERVENTIONS_ENDPOINT = "registry/interventions/"
 
 
 class InterventionsClient:
-    def __init__(self, api_client: ApiClient):
+    def __init__(self, api_client: ApiClient, cache: RegistryCache | None = None):
+        """
+        Args:
+            api_client: The client sending the requests.
+            cache: A snapshot the interventions are read through; writes through this client invalidate it.
+        """
         self.api_client = api_client
+        self.cache = cache
 
     def get(self, name: str, *, version: int | None = None) -> RuleInterventionOutput:
-        response = self.api_client.make_request(
-            method="GET",
-            endpoint=(
-                f"registry/interventions/{name}/versions/{version}"
-                if version
-                else f"registry/interventions/{name}"
-            ),
+        response = cached_get(
+            self.api_client, self.cache, _intervention_endpoint(name, version)
         )
         return RuleInterventionOutput(**response)
 
     def list(self) -> list[RuleInterventionOutput]:
-        response = self.api_client.make_request(
-            method="GET",
-            endpoint="registry/interventions/",
-        )
+        response = cached_get(self.api_client, self.cache, INTERVENTIONS_ENDPOINT)
         return [RuleInterventionOutput(**intervention) for intervention in response]
 
+    def iter(
+        self,
+        *,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[RuleInterventionOutput]:
+        """
+        Lists the interventions of the Signals registry, all versions, lazily, fetching a page at a time and validating each intervention as it is consumed.
+
+        Args:
+            name_prefix: Only list interventions whose name starts with this prefix.
+            published: Only list published, or unpublished, interventions.
+            page_size: The number of interventions fetched per request.
+        """
+        for item in iter_items(
+            self.api_client,
+            INTERVENTIONS_ENDPOINT,
+            list_params(name_prefix=name_prefix, is_published=published),
+            page_size,
+        ):
+            yield RuleInterventionOutput.model_validate(item)
+
     def delete(self, name: str, version: int) -> dict[str, bool]:
         response = self.api_client.make_request(
             method="DELETE",
             endpoint=f"registry/interventions/{name}/versions/{version}",
         )
+        _invalidate(self.cache)
         return response
 
     def update(self, intervention: RuleInterventionInput) -> RuleInterventionOutput:
         response = self.api_client.make_request(
             method="PUT",
             endpoint=f"registry/interventions/{intervention.name}/versions/{intervention.version}",
-            data=intervention.model_dump(
-                mode="json",
-                exclude_none=True,
-                by_alias=True,
-            ),
+            data=_model_dump(intervention),
         )
+        _invalidate(self.cache)
         return RuleInterventionOutput(**response)
 
     def create(self, intervention: RuleInterventionInput) -> RuleInterventionOutput:
         response = self.api_client.make_request(
             method="POST",
             endpoint="registry/interventions/",
-            data=intervention.model_dump(
-                mode="json",
-                exclude_none=True,
-                by_alias=True,
-            ),
+            data=_model_dump(intervention),
         )
+        _invalidate(self.cache)
         return RuleInterventionOutput(**response)
 
     def publish(
@@ -70,14 +99,142 @@ class InterventionsClient:
             method="POST",
             endpoint="interventions",
             params=targets.root,
-            data=intervention.model_dump(
-                mode="json",
-                exclude_none=True,
-                by_alias=True,
-            ),
+            data=_model_dump(intervention),
         )
 
         return response.get("status", "failure")
 
     def subscribe(self, targets: AttributeKeyIdentifiers) -> InterventionsSubscription:
         return InterventionsSubscription(self.api_client, targets)
+
+
+class AsyncInterventionsClient:
+    """
+    Asyncio counterpart of `InterventionsClient`.
+    """
+
+    def __init__(self, api_client: AsyncApiClient, cache: RegistryCache | None = None):
+        self.api_client = api_client
+        self.cache = cache
+
+    async def get(
+        self, name: str, *, version: int | None = None
+    ) -> RuleInterventionOutput:
+        response = await async_cached_get(
+            self.api_client, self.cache, _intervention_endpoint(name, version)
+        )
+        return RuleInterventionOutput(**response)
+
+    async def list(self) -> list[RuleInterventionOutput]:
+        response = await async_cached_get(
+            self.api_client, self.cache, INTERVENTIONS_ENDPOINT
+        )
+        return [RuleInterventionOutput(**intervention) for intervention in response]
+
+    async def iter(
+        self,
+        *,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[RuleInterventionOutput]:
+        """
+        Lists the interventions of the Signals registry, all versions, lazily, fetching a page at a time and validating each intervention as it is consumed.
+
+        Args:
+            name_prefix: Only list interventions whose name starts with this prefix.
+            published: Only list published, or unpublished, interventions.
+            page_size: The number of interventions fetched per request.
+        """
+        async for item in aiter_items(
+            self.api_client,
+            INTERVENTIONS_ENDPOINT,
+            list_params(name_prefix=name_prefix, is_published=published),
+            page_size,
+        ):
+            yield RuleInterventionOutput.model_validate(item)
+
+    async def delete(self, name: str, version: int) -> dict[str, bool]:
+        response = await self.api_client.make_request(
+            method="DELETE",
+            endpoint=f"registry/interventions/{name}/versions/{version}",
+        )
+        _invalidate(self.cache)
+        return response
+
+    async def update(
+        self, intervention: RuleInterventionInput
+    ) -> RuleInterventionOutput:
+        response = await self.api_client.make_request(
+            method="PUT",
+            endpoint=f"registry/interventions/{intervention.name}/versions/{intervention.version}",
+            data=_model_dump(intervention),
+        )
+        _invalidate(self.cache)
+        return RuleInterventionOutput(**response)
+
+    async def create(
+        self, intervention: RuleInterventionInput
+    ) -> RuleInterventionOutput:
+        response = await self.api_client.make_request(
+            method="POST",
+            endpoint="registry/interventions/",
+            data=_model_dump(intervention),
+        )
+        _invalidate(self.cache)
+        return RuleInterventionOutput(**response)
+
+    async def publish(
+        self, intervention: InterventionInstance, targets: AttributeKeyIdentifiers
+    ) -> Literal["undelivered", "success", "failure"]:
+        response = await self.api_client.make_request(
+            method="POST",
+            endpoint="interventions",
+            params=targets.root,
+            data=_model_dump(intervention),
+        )
+
+        return response.get("status", "failure")
+
+    def subscribe(
+        self,
+        targets: AttributeKeyIdentifiers,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        overflow: OverflowPolicy = "block",
+        handler_timeout: timedelta | None = DEFAULT_HANDLER_TIMEOUT,
+        max_concurrent_handlers: int = DEFAULT_MAX_CONCURRENT_HANDLERS,
+    ) -> AsyncInterventionsSubscription:
+        """
+        Returns a subscription for interventions published to the given targets; see `AsyncInterventionsSubscription` for the options.
+        """
+        return AsyncInterventionsSubscription(
+            self.api_client,
+            targets,
+            max_buffer_size=max_buffer_size,
+            overflow=overflow,
+            handler_timeout=handler_timeout,
+            max_concurrent_handlers=max_concurrent_handlers,
+        )
+
+
+def _invalidate(cache: RegistryCache | None) -> None:
+    if cache is not None:
+        cache.invalidate(INTERVENTIONS_ENDPOINT)
+
+
+def _intervention_endpoint(name: str, version: int | None) -> str:
+    return (
+        f"registry/interventions/{name}/versions/{version}"
+        if version
+        else f"registry/interventions/{name}"
+    )
+
+
+def _model_dump(
+    intervention: RuleInterventionInput | InterventionInstance,
+) -> dict:
+    return intervention.model_dump(
+        mode="json",
+        exclude_none=True,
+        by_alias=True,
+    )
@@ -0,0 +1,350 @@
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from datetime import timedelta
+from queue import Empty, Queue
+from threading import Condition, Event, Lock, Thread
+from typing import Self
+
+from .api_client import ApiClient
+from .cli_logging import get_logger
+from .interventions_subscription import _deliver, _parse_event
+from .models import AttributeKeyIdentifiers, InterventionInstance
+from .resilience import ReconnectPolicy
+from .sse import DEFAULT_RECONNECT_POLICY, EventStream, ServerSentEvent
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_IDLE_TIMEOUT = timedelta(seconds=30)
+DEFAULT_REOPEN_DELAY = timedelta(milliseconds=50)
+
+_Target = tuple[str, str]
+
+
+class MultiplexedSubscription(AbstractContextManager, Iterable):
+    """
+    A subscription for interventions published to the given targets, received over the shared connections of an `InterventionsMultiplexer`.
+
+    Offers the same buffer, iteration and handler interface as `InterventionsSubscription`, without a connection or thread of its own.
+    Upon exiting the `with` statement or upon calling `close()`, its targets are removed from the shared connections.
+    """
+
+    def __init__(
+        self,
+        multiplexer: "InterventionsMultiplexer",
+        targets: AttributeKeyIdentifiers,
+        buffer=True,
+    ) -> None:
+        self.targets = targets
+        self._multiplexer = multiplexer
+        self._queue: Queue[InterventionInstance] | None = Queue() if buffer else None
+        self._handlers: dict[Callable[[InterventionInstance], object], bool] = {}
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[InterventionInstance]:
+        """
+        Iterate over any locally buffered interventions, waiting up to .1 seconds for new ones to arrive, and then stop iterating.
+        """
+
+        def iterate() -> InterventionInstance | None:
+            try:
+                return self.get(block=True, timeout=0.1)
+            except Empty:
+                return None
+
+        return iter(iterate, None)
+
+    def get(self, block=True, timeout=None) -> InterventionInstance:
+        """
+        Get an already retrieved intervention from the buffer, or block waiting for a new intervention to be retrieved and enter the buffer.
+        If buffering is disabled, raises a `TypeError`.
+
+        Args:
+            block: If True (the default) block until an intervention is available in the buffer, else only return an already available intervention (or raise `queue.Empty` if none).
+            timeout: If `block` is True, wait at most `timeout` seconds before failing with `queue.Empty`; if `None`, wait indefinitely. Ignored if `block` is False.
+        """
+        if self._queue is None:
+            raise TypeError("Buffering required to iterate over subscription")
+        return self._queue.get(block, timeout)
+
+    def add_handler(
+        self, handler: Callable[[InterventionInstance], object], ignore_fail=True
+    ) -> None:
+        """
+        Register a new handler to receive interventions.
+
+        Args:
+            handler: The handler function to be added to the subscription.
+            ignore_fail: If True, exceptions thrown by the handler will be swallowed.
+        """
+        self._handlers.setdefault(handler, ignore_fail)
+
+    def remove_handler(self, handler: Callable[[InterventionInstance], object]) -> bool:
+        """
+        De-register a previously added intervention handler.
+
+        Args:
+            handler: The handler function to be removed from the subscription.
+        Returns:
+            True if the handler was removed; False if the handler was not already registered.
+        """
+        return self._handlers.pop(handler, None) is not None
+
+    def close(self) -> None:
+        """
+        Stop receiving interventions, removing the targets of this subscription from the shared connections.
+        """
+        self._multiplexer.unsubscribe(self)
+
+    def _deliver(self, intervention: InterventionInstance) -> None:
+        try:
+            _deliver(intervention, self._queue, self._handlers)
+        except Exception:
+            # a failing handler must not end the connection shared with other subscriptions
+            logger.warning("Intervention handler failed", exc_info=True)
+
+
+class _Connection:
+    """
+    One long-lived stream requesting the interventions of every target assigned to it, reopened whenever the targets change.
+    A change aborts the open connection at once; the changes made within `reopen_delay` of it are merged into a single reconnection.
+    """
+
+    def __init__(self, multiplexer: "InterventionsMultiplexer", index: int) -> None:
+        self._multiplexer = multiplexer
+        self._stream = EventStream(
+            multiplexer.api_client,
+            "interventions",
+            reconnect_policy=multiplexer.reconnect_policy,
+            read_timeout=multiplexer.idle_timeout,
+        )
+        self._changed = Condition()
+        self._targets: dict[_Target, int] = {}
+        # set to end the iteration of the stream, so that it is reopened with the current targets
+        self._generation = Event()
+        self._closed = False
+        self._thread = Thread(
+            target=self._run,
+            name=f"SignalsInterventionsMultiplexer-{id(multiplexer)}-{index}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._stream.connected
+
+    def add(self, target: _Target) -> None:
+        with self._changed:
+            self._targets[target] = self._targets.get(target, 0) + 1
+            if self._targets[target] == 1:
+                self._reopen()
+
+    def remove(self, target: _Target) -> None:
+        with self._changed:
+            self._targets[target] -= 1
+            if self._targets[target] == 0:
+                del self._targets[target]
+                self._reopen()
+
+    def close(self) -> None:
+        with self._changed:
+            self._closed = True
+            self._reopen()
+
+    def _reopen(self) -> None:
+        self._generation.set()
+        self._changed.notify_all()
+        self._stream.interrupt()
+
+    def _run(self) -> None:
+        failures = 0
+        while True:
+            with self._changed:
+                self._changed.wait_for(
+                    lambda: self._closed
+                    or (bool(self._targets) and self._generation.is_set())
+                )
+                # changes made together, as by one subscription with several targets, reopen the stream once
+                self._changed.wait_for(
+                    lambda: self._closed,
+                    self._multiplexer.reopen_delay.total_seconds(),
+                )
+                if self._closed:
+                    return
+                if not self._targets:
+                    continue
+                generation = self._generation = Event()
+                self._stream.params = _merge(self._targets)
+
+            try:
+                for event in self._stream.events(generation):
+                    self._dispatch(event)
+            except Exception:
+                # e.g. a rejected request, which the stream does not retry itself
+                failures += 1
+                delay = (
+                    self._multiplexer.reconnect_policy or DEFAULT_RECONNECT_POLICY
+                ).backoff(failures)
+                logger.warning(
+                    f"Interventions stream failed, reopening in {delay:.2f}s",
+                    exc_info=True,
+                )
+                with self._changed:
+                    self._changed.wait_for(
+                        lambda: self._closed or self._generation.is_set(), delay
+                    )
+                    self._generation.set()
+            else:
+                failures = 0
+
+    def _dispatch(self, event: ServerSentEvent) -> None:
+        try:
+            intervention = _parse_event(event)
+        except ValueError:
+            logger.warning(f"Ignoring an invalid intervention: {event.data}")
+            return
+        self._multiplexer._dispatch(intervention)
+
+
+class InterventionsMultiplexer(AbstractContextManager):
+    """
+    Receives interventions for many subscriptions over a fixed number of shared connections.
+
+    Each target, an Attribute Key and identifier, is assigned to one of `max_connections` streams by hashing,
+    and each stream requests the merged targets of all its subscriptions from a single thread.
+    Subscribing or unsubscribing a target aborts its stream and reopens it with the new merged targets after `reopen_delay`,
+    so that the targets changed within that delay, e.g. by subscriptions opened together, cost a single reconnection.
+    Streams that drop reconnect according to `reconnect_policy`, resuming after the last received event if the server supports it.
+    A stream that fails for good, e.g. because its request was rejected after the credentials expired, is reopened after the backoff of `reconnect_policy`, or of the default policy if it is None.
+    Incoming interventions are delivered to the subscriptions of their `target_attribute_key`;
+    interventions without a target attribute key cannot be attributed to a subscription and are dropped.
+    Threads and sockets are bounded by `max_connections` however many subscriptions are open.
+    """
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: timedelta = DEFAULT_IDLE_TIMEOUT,
+        reconnect_policy: ReconnectPolicy | None = DEFAULT_RECONNECT_POLICY,
+        reopen_delay: timedelta = DEFAULT_REOPEN_DELAY,
+    ) -> None:
+        """
+        Args:
+            api_client: The client opening the streams.
+            max_connections: The number of streams the targets are spread over.
+            idle_timeout: How long a stream may stay silent before it is reopened.
+            reconnect_policy: How dropped streams are reopened, or None for streams that end without an error to wait for the targets to change instead.
+            reopen_delay: How long a stream waits after its targets change before reopening, merging the changes made meanwhile.
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+
+        self.api_client = api_client
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.reconnect_policy = reconnect_policy
+        self.reopen_delay = reopen_delay
+        self._lock = Lock()
+        self._connections: dict[int, _Connection] = {}
+        self._subscriptions: dict[_Target, list[MultiplexedSubscription]] = {}
+        self._closed = False
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def connections(self) -> int:
+        """
+        The number of open streams.
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+        return sum(connection.is_connected for connection in connections)
+
+    def subscribe(
+        self, targets: AttributeKeyIdentifiers, buffer=True
+    ) -> MultiplexedSubscription:
+        """
+        Start receiving interventions published to the given targets.
+
+        Args:
+            targets: Mapping of Attribute Keys to the identifiers to receive interventions for.
+            buffer: Whether received interventions are buffered for `get()` and iteration, as in `InterventionsSubscription`.
+        """
+        subscription = MultiplexedSubscription(self, targets, buffer)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Multiplexer is closed")
+            for target in _targets(targets):
+                self._subscriptions.setdefault(target, []).append(subscription)
+                self._connection(target).add(target)
+        return subscription
+
+    def unsubscribe(self, subscription: MultiplexedSubscription) -> bool:
+        """
+        Stop delivering interventions to a subscription.
+
+        Returns:
+            True if the subscription was removed; False if it was not subscribed.
+        """
+        with self._lock:
+            removed = False
+            for target in _targets(subscription.targets):
+                subscriptions = self._subscriptions.get(target, [])
+                if subscription not in subscriptions:
+                    continue
+                removed = True
+                subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._subscriptions[target]
+                self._connection(target).remove(target)
+            return removed
+
+    def close(self) -> None:
+        """
+        Close every stream and drop all subscriptions.
+        """
+        with self._lock:
+            self._closed = True
+            self._subscriptions.clear()
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _connection(self, target: _Target) -> _Connection:
+        # a stable hash, so that a target keeps its connection across restarts
+        index = zlib.crc32("\0".join(target).encode()) % self.max_connections
+        connection = self._connections.get(index)
+        if connection is None:
+            connection = self._connections[index] = _Connection(self, index)
+        return connection
+
+    def _dispatch(self, intervention: InterventionInstance) -> None:
+        target = intervention.target_attribute_key
+        if target is None:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions.get((target.name, target.id), ()))
+        for subscription in subscriptions:
+            subscription._deliver(intervention)
+
+
+def _targets(targets: AttributeKeyIdentifiers) -> set[_Target]:
+    return {
+        (name, identifier)
+        for name, identifiers in (targets.root or {}).items()
+        for identifier in identifiers
+    }
+
+
+def _merge(targets: Iterable[_Target]) -> dict[str, list[str]]:
+    merged: dict[str, list[str]] = {}
+    for name, identifier in sorted(targets):
+        merged.setdefault(name, []).append(identifier)
+    return merged
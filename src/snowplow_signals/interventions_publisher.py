@@ -0,0 +1,362 @@
+import asyncio
+import time
+from queue import Empty, Full, Queue
+from threading import Condition, Lock, Thread
+from typing import Literal, NamedTuple, Self
+
+from pydantic import BaseModel
+
+from .cli_logging import get_logger
+from .interventions_client import AsyncInterventionsClient, InterventionsClient
+from .metrics import Histogram, HistogramSnapshot
+from .models import AttributeKeyIdentifiers, InterventionInstance
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_MAX_CONCURRENCY = 8
+
+DELIVERY_TIME_MS_BOUNDS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+DeliveryStatus = Literal["success", "undelivered", "failure"]
+
+
+class _PendingIntervention(NamedTuple):
+    intervention: InterventionInstance
+    targets: AttributeKeyIdentifiers
+    enqueued_at: float
+
+
+class InterventionsPublisherStats(BaseModel):
+    queued: int
+    """The interventions waiting to be sent."""
+    in_flight: int
+    """The interventions being sent."""
+    success: int
+    """The interventions delivered to at least one subscriber."""
+    undelivered: int
+    """The interventions the API accepted but no subscriber received."""
+    failure: int
+    """The interventions the API failed to deliver."""
+    errors: int
+    """The interventions whose request failed, e.g. on a connection error."""
+    delivery_times_ms: HistogramSnapshot
+    """The time from queueing an intervention to receiving its delivery status."""
+
+
+class _PublisherCounters:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counts: dict[DeliveryStatus | Literal["errors"], int] = {
+            "success": 0,
+            "undelivered": 0,
+            "failure": 0,
+            "errors": 0,
+        }
+        self._delivery_times_ms = Histogram(DELIVERY_TIME_MS_BOUNDS)
+
+    def _record(
+        self,
+        pending: _PendingIntervention,
+        status: str,
+    ) -> None:
+        self._delivery_times_ms.observe((time.monotonic() - pending.enqueued_at) * 1000)
+        if status not in self._counts:
+            logger.warning(
+                f"Counting the unknown delivery status {status!r} as a failure"
+            )
+            status = "failure"
+        with self._lock:
+            self._counts[status] += 1
+
+    def _stats(self, queued: int, in_flight: int) -> InterventionsPublisherStats:
+        with self._lock:
+            return InterventionsPublisherStats(
+                queued=queued,
+                in_flight=in_flight,
+                **self._counts,
+                delivery_times_ms=self._delivery_times_ms.snapshot(),
+            )
+
+
+class InterventionsPublisher(_PublisherCounters):
+    """
+    Publishes interventions in the background from a bounded queue.
+
+    A pool of worker threads sends the queued interventions concurrently, reusing the pooled keep-alive connections of the API client.
+    When the queue is full, `publish` blocks, or raises `queue.Full`, until workers catch up, so producers cannot outrun delivery without bound.
+    """
+
+    def __init__(
+        self,
+        interventions_client: InterventionsClient,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Args:
+            interventions_client: The client sending the interventions, e.g. `signals.interventions`.
+            max_queue_size: The number of interventions that can wait to be sent.
+            max_concurrency: The number of interventions sent at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        super().__init__()
+        self.interventions_client = interventions_client
+        self._queue: Queue[_PendingIntervention | None] = Queue(max_queue_size)
+        self._idle = Condition()
+        self._unfinished = 0
+        self._closed = False
+        self._workers = [
+            Thread(
+                target=self._run,
+                name=f"SignalsInterventionsPublisher-{id(self)}-{index}",
+                daemon=True,
+            )
+            for index in range(max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def publish(
+        self,
+        intervention: InterventionInstance,
+        targets: AttributeKeyIdentifiers,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Queues an intervention to be published to the given targets.
+
+        Args:
+            intervention: The intervention payload to publish.
+            targets: Mapping of Attribute Keys to identifiers to send the intervention to.
+            block: If True (the default) wait for room in the queue, else raise `queue.Full` at once if it is full.
+            timeout: If `block` is True, wait at most `timeout` seconds before raising `queue.Full`; if `None`, wait indefinitely.
+        """
+        with self._idle:
+            if self._closed:
+                raise RuntimeError("Publisher is closed")
+            self._unfinished += 1
+        try:
+            self._queue.put(
+                _PendingIntervention(intervention, targets, time.monotonic()),
+                block,
+                timeout,
+            )
+        except Full:
+            self._finish()
+            raise
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until every queued intervention has been sent.
+
+        Args:
+            timeout: Wait at most `timeout` seconds; if `None`, wait indefinitely.
+        Returns:
+            True if every intervention was sent, False if the timeout expired first.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Stops accepting interventions, sends the queued ones and stops the workers.
+
+        Args:
+            timeout: Wait at most `timeout` seconds for the queued interventions to be sent, after which those not yet being sent are abandoned; if `None`, wait indefinitely.
+        Returns:
+            True if every intervention was sent before the workers stopped.
+        """
+        with self._idle:
+            if self._closed:
+                return self._unfinished == 0
+            self._closed = True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = self.flush(timeout)
+        if not flushed:
+            self._abandon_queued()
+        for index in range(len(self._workers)):
+            remaining = (
+                None if deadline is None else max(0, deadline - time.monotonic())
+            )
+            try:
+                self._queue.put(None, timeout=remaining)
+            except Full:
+                # the workers are busy sending, so make room by abandoning the interventions queued meanwhile
+                self._abandon_queued()
+                try:
+                    self._queue.put_nowait(None)
+                except Full:
+                    logger.warning(
+                        f"{len(self._workers) - index} publisher workers are still sending and are left to stop with the process"
+                    )
+                    break
+        return flushed
+
+    def stats(self) -> InterventionsPublisherStats:
+        """
+        Returns the delivery status counters and the delivery times of the published interventions.
+        """
+        with self._idle:
+            unfinished = self._unfinished
+        queued = self._queue.qsize()
+        return self._stats(queued=queued, in_flight=max(0, unfinished - queued))
+
+    def _run(self) -> None:
+        while True:
+            pending = self._queue.get()
+            if pending is None:
+                return
+            try:
+                status = self.interventions_client.publish(
+                    pending.intervention, pending.targets
+                )
+            except Exception:
+                logger.warning("Failed to publish an intervention", exc_info=True)
+                self._record(pending, "errors")
+            else:
+                self._record(pending, status)
+            finally:
+                self._finish()
+
+    def _abandon_queued(self) -> None:
+        abandoned = 0
+        stop_markers = 0
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except Empty:
+                break
+            if pending is None:
+                stop_markers += 1
+                continue
+            abandoned += 1
+            self._finish()
+        for _ in range(stop_markers):
+            self._queue.put_nowait(None)
+        if abandoned:
+            logger.warning(f"Abandoned {abandoned} unsent interventions on close")
+
+    def _finish(self) -> None:
+        with self._idle:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._idle.notify_all()
+
+
+class AsyncInterventionsPublisher(_PublisherCounters):
+    """
+    Asyncio counterpart of `InterventionsPublisher`, sending the queued interventions from worker tasks on the running event loop.
+    """
+
+    def __init__(
+        self,
+        interventions_client: AsyncInterventionsClient,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Args:
+            interventions_client: The client sending the interventions, e.g. `signals.interventions`.
+            max_queue_size: The number of interventions that can wait to be sent.
+            max_concurrency: The number of interventions sent at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        super().__init__()
+        self.interventions_client = interventions_client
+        self.max_concurrency = max_concurrency
+        self._queue: asyncio.Queue[_PendingIntervention] = asyncio.Queue(max_queue_size)
+        self._workers: list[asyncio.Task] = []
+        self._in_flight = 0
+        self._closed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def publish(
+        self, intervention: InterventionInstance, targets: AttributeKeyIdentifiers
+    ) -> None:
+        """
+        Queues an intervention to be published to the given targets, waiting for room in the queue if it is full.
+        """
+        self._start()
+        await self._queue.put(
+            _PendingIntervention(intervention, targets, time.monotonic())
+        )
+
+    def publish_nowait(
+        self, intervention: InterventionInstance, targets: AttributeKeyIdentifiers
+    ) -> None:
+        """
+        Queues an intervention to be published to the given targets, raising `asyncio.QueueFull` if the queue is full.
+        """
+        self._start()
+        self._queue.put_nowait(
+            _PendingIntervention(intervention, targets, time.monotonic())
+        )
+
+    async def flush(self) -> None:
+        """
+        Waits until every queued intervention has been sent.
+        """
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """
+        Stops accepting interventions, sends the queued ones and stops the worker tasks.
+        """
+        self._closed = True
+        await self.flush()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def stats(self) -> InterventionsPublisherStats:
+        """
+        Returns the delivery status counters and the delivery times of the published interventions.
+        """
+        return self._stats(queued=self._queue.qsize(), in_flight=self._in_flight)
+
+    def _start(self) -> None:
+        if self._closed:
+            raise RuntimeError("Publisher is closed")
+        # workers are created lazily, as the publisher may be created outside the event loop
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(
+                    self._run(), name=f"SignalsInterventionsPublisher-{id(self)}"
+                )
+                for _ in range(self.max_concurrency)
+            ]
+
+    async def _run(self) -> None:
+        while True:
+            pending = await self._queue.get()
+            self._in_flight += 1
+            try:
+                status = await self.interventions_client.publish(
+                    pending.intervention, pending.targets
+                )
+            except Exception:
+                logger.warning("Failed to publish an intervention", exc_info=True)
+                self._record(pending, "errors")
+            else:
+                self._record(pending, status)
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
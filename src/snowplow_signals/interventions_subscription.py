@@ -1,15 +1,42 @@
+import asyncio
 import atexit
-from collections.abc import Callable, Generator, Iterable, Iterator
-from contextlib import AbstractContextManager, closing
+import inspect
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, closing
+from datetime import timedelta
 from queue import Empty, Queue
-from threading import Event, Thread
-from typing import Self
+from threading import Event, Thread, current_thread
+from typing import Literal, Self
 
-from .api_client import ApiClient
+from .api_client import ApiClient, AsyncApiClient
+from .cli_logging import get_logger
 from .models import (
     AttributeKeyIdentifiers,
     InterventionInstance,
 )
+from .resilience import ReconnectPolicy
+from .sse import (
+    DEFAULT_RECONNECT_POLICY,
+    AsyncEventStream,
+    EventStream,
+    EventStreamStats,
+    ServerSentEvent,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BUFFER_SIZE = 1000
+DEFAULT_HANDLER_TIMEOUT = timedelta(seconds=10)
+DEFAULT_MAX_CONCURRENT_HANDLERS = 100
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
 
 
 class InterventionsSubscription(AbstractContextManager, Iterable):
@@ -21,6 +48,7 @@ class InterventionsSubscription(AbstractContextManager, Iterable):
     Callbacks to handle interventions can be registered if you require multiple consumers for a single subscription.
     If you want to use callbacks exclusively and not have buffering, disable it with the `buffer` parameter to not use queuing.
     With buffering enabled, you can iterate over any buffered interventions via iteration.
+    When the connection drops, the subscription reconnects according to `reconnect_policy`, resuming after the last received event if the server supports it.
     Upon exiting the `with` statement or upon calling `stop()`, aborts the request.
     The same subscription can be restarted if required, but not started multiple times concurrently.
     When started, subscription instances are registered in the class-level `InterventionSubscription.instances` set.
@@ -30,10 +58,17 @@ class InterventionsSubscription(AbstractContextManager, Iterable):
     instances: set[Self] = set()
 
     def __init__(
-        self, api_client: ApiClient, targets: AttributeKeyIdentifiers, buffer=True
+        self,
+        api_client: ApiClient,
+        targets: AttributeKeyIdentifiers,
+        buffer=True,
+        reconnect_policy: ReconnectPolicy | None = DEFAULT_RECONNECT_POLICY,
     ) -> None:
         self.targets = targets
         self.api_client = api_client
+        self._stream = EventStream(
+            api_client, "interventions", targets.root, reconnect_policy=reconnect_policy
+        )
         self._queue: Queue[InterventionInstance] | None = Queue() if buffer else None
         self._close: Event = Event()
         self._handlers: dict[Callable[[InterventionInstance], object], bool] = {}
@@ -78,18 +113,11 @@ class InterventionsSubscription(AbstractContextManager, Iterable):
         self.instances.add(self)
         self._close.clear()
 
-        stream = self.api_client.make_stream_request(
-            method="GET",
-            endpoint="interventions",
-            params=self.targets.root,
-            headers={"Accept": "text/event-stream"},
-        )
-
         self._thread = Thread(
             target=self._pipe,
             name=f"SignalsInterventions-{id(self)}",
             daemon=True,
-            args=(stream, self._close),
+            args=(self._stream.events(self._close),),
         )
 
         self._thread.start()
@@ -137,28 +165,288 @@ class InterventionsSubscription(AbstractContextManager, Iterable):
         """
         self._close.set()
         self.instances.discard(self)
+        thread = self._thread
+        if (
+            thread is not None
+            and thread is not current_thread()
+            and not self._stream.connected
+        ):
+            # only waits for a thread about to reconnect, which stops at once
+            thread.join()
+
+    def stats(self) -> EventStreamStats:
+        """
+        Returns the reconnection metrics of the stream of interventions.
+        """
+        return self._stream.stats()
+
+    def _pipe(self, events: Generator[ServerSentEvent]) -> None:
+        with closing(events):
+            for event in events:
+                _deliver(_parse_event(event), self._queue, self._handlers)
 
-    def _pipe(self, stream: Generator[str | None], closed: Event) -> None:
-        with closing(stream):
-            for event in stream:
-                if closed.is_set():
-                    break
 
-                if event and event.startswith("data: "):
-                    intervention = InterventionInstance.model_validate_json(
-                        event[len("data: ") :]
+class AsyncInterventionsSubscription(AbstractAsyncContextManager, AsyncIterator):
+    """
+    Asyncio counterpart of `InterventionsSubscription`.
+
+    Upon calling `start()` from a running event loop, or use in an `async with` statement, requests interventions for the given targets in a background task.
+    Interventions are buffered locally in a bounded `asyncio.Queue` and can be consumed with `async for` or `await get()`; iteration ends once the subscription is stopped or gives up reconnecting.
+    When the buffer is full, the `overflow` policy either blocks reading the stream until a consumer catches up, drops the oldest buffered intervention, or drops the new one.
+    Disable buffering with the `buffer` parameter if you only use handlers.
+    Handlers may be plain functions or coroutine functions. Each intervention is passed to every handler in its own task,
+    so that a slow handler does not delay the others, and handlers are abandoned after `handler_timeout`.
+    Plain functions run in a worker thread so that they cannot block the event loop; one that times out is no longer awaited but cannot be interrupted.
+    At most `max_concurrent_handlers` handler calls run at once; beyond that, reading the stream waits for a running call to finish.
+    When the connection drops, the subscription reconnects according to `reconnect_policy`, resuming after the last received event if the server supports it.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncApiClient,
+        targets: AttributeKeyIdentifiers,
+        reconnect_policy: ReconnectPolicy | None = DEFAULT_RECONNECT_POLICY,
+        buffer=True,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        overflow: OverflowPolicy = "block",
+        handler_timeout: timedelta | None = DEFAULT_HANDLER_TIMEOUT,
+        max_concurrent_handlers: int = DEFAULT_MAX_CONCURRENT_HANDLERS,
+    ) -> None:
+        """
+        Args:
+            api_client: The client opening the stream.
+            targets: Mapping of Attribute Keys to identifiers to receive interventions for.
+            reconnect_policy: How the stream is reopened after the connection drops, or None to end the subscription instead.
+            buffer: Whether received interventions are buffered for iteration and `get()`.
+            max_buffer_size: The number of interventions the buffer holds.
+            overflow: What happens to a received intervention when the buffer is full: "block", "drop_oldest" or "drop_newest".
+            handler_timeout: How long a handler may take per intervention before it is abandoned, or None to wait indefinitely.
+            max_concurrent_handlers: The number of handler calls that may run at once.
+        """
+        if max_buffer_size < 1:
+            raise ValueError("max_buffer_size must be at least 1")
+        if max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1")
+
+        self.targets = targets
+        self.api_client = api_client
+        self.overflow = overflow
+        self.handler_timeout = handler_timeout
+        self.dropped = 0
+        """The interventions dropped because the buffer was full."""
+        self._stream = AsyncEventStream(
+            api_client, "interventions", targets.root, reconnect_policy=reconnect_policy
+        )
+        self._queue: asyncio.Queue[InterventionInstance | None] | None = (
+            asyncio.Queue(max_buffer_size) if buffer else None
+        )
+        self._ended = False
+        self._end_marker: asyncio.Task | None = None
+        self._handlers: dict[Callable[[InterventionInstance], object], bool] = {}
+        self._handler_tasks: set[asyncio.Task] = set()
+        self._handler_slots = asyncio.Semaphore(max_concurrent_handlers)
+        self._error: Exception | None = None
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> InterventionInstance:
+        if self._queue is None:
+            raise TypeError("Buffering required to iterate over subscription")
+        if self._ended and self._queue.empty():
+            raise StopAsyncIteration
+        intervention = await self._queue.get()
+        if intervention is None:
+            # re-queue the end marker so later consumers also stop
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+        return intervention
+
+    def start(self) -> None:
+        """
+        Send request to the Signals API for interventions, and start a background task to dispatch them to the local buffer or registered handlers.
+        Must be called with a running event loop.
+        """
+        if self._task and not self._task.done():
+            raise RuntimeError("Subscription already running")
+
+        # drop the end marker left behind by a previous run, keeping buffered interventions
+        self._ended = False
+        if self._end_marker is not None:
+            self._end_marker.cancel()
+            self._end_marker = None
+        if self._queue is not None:
+            pending = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+            for intervention in pending:
+                if intervention is not None:
+                    self._queue.put_nowait(intervention)
+
+        self._task = asyncio.create_task(
+            self._pipe(self._stream.events()), name=f"SignalsInterventions-{id(self)}"
+        )
+
+    async def get(self, timeout: float | None = None) -> InterventionInstance:
+        """
+        Get an already retrieved intervention from the buffer, or wait for a new intervention to arrive.
+
+        Args:
+            timeout: Wait at most `timeout` seconds before failing with `TimeoutError`; if `None`, wait indefinitely.
+        """
+        async with asyncio.timeout(timeout):
+            return await self.__anext__()
+
+    def add_handler(
+        self, handler: Callable[[InterventionInstance], object], ignore_fail=True
+    ) -> None:
+        """
+        Register a new handler to receive interventions.
+
+        Args:
+            handler: The handler function or coroutine function to be added to the subscription.
+            ignore_fail: If True, exceptions thrown by the handler will be swallowed.
+        """
+        self._handlers.setdefault(handler, ignore_fail)
+
+    def remove_handler(self, handler: Callable[[InterventionInstance], object]) -> bool:
+        """
+        De-register a previously added intervention handler.
+
+        Args:
+            handler: The handler function to be removed from the subscription.
+        Returns:
+            True if the handler was removed; False if the handler was not already registered.
+        """
+        return self._handlers.pop(handler, None) is not None
+
+    async def stop(self) -> None:
+        """
+        Abort the request to the API that is awaiting new interventions and wait for the background task and running handlers to finish.
+        Raises the first exception of a handler registered with `ignore_fail=False`, which stops the subscription.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        if self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def stats(self) -> EventStreamStats:
+        """
+        Returns the reconnection metrics of the stream of interventions.
+        """
+        return self._stream.stats()
+
+    async def _pipe(self, events: AsyncGenerator[ServerSentEvent]) -> None:
+        try:
+            async for event in events:
+                intervention = _parse_event(event)
+                for handler, ignore_fail in list(self._handlers.items()):
+                    await self._handler_slots.acquire()
+                    task = asyncio.create_task(
+                        self._handle(handler, ignore_fail, intervention)
                     )
+                    self._handler_tasks.add(task)
+                    task.add_done_callback(self._handler_done)
+
+                if self._queue is not None:
+                    await self._buffer(self._queue, intervention)
+        finally:
+            await events.aclose()
+            self._ended = True
+            # consumers waiting on an empty buffer are woken by the end marker, the others stop once it is drained
+            if self._queue is not None:
+                if self._queue.full():
+                    # queue the marker behind the buffered interventions once a consumer makes room
+                    self._end_marker = asyncio.create_task(self._queue.put(None))
+                else:
+                    self._queue.put_nowait(None)
+
+    async def _buffer(
+        self,
+        queue: asyncio.Queue[InterventionInstance | None],
+        intervention: InterventionInstance,
+    ) -> None:
+        if self.overflow == "block" or not queue.full():
+            await queue.put(intervention)
+            return
+        self.dropped += 1
+        if self.overflow == "drop_oldest":
+            queue.get_nowait()
+            queue.put_nowait(intervention)
+
+    def _handler_done(self, task: asyncio.Task) -> None:
+        self._handler_tasks.discard(task)
+        self._handler_slots.release()
+
+    async def _handle(
+        self,
+        handler: Callable[[InterventionInstance], object],
+        ignore_fail: bool,
+        intervention: InterventionInstance,
+    ) -> None:
+        timeout = (
+            self.handler_timeout.total_seconds()
+            if self.handler_timeout is not None
+            else None
+        )
+        try:
+            async with asyncio.timeout(timeout):
+                if _is_coroutine_function(handler):
+                    await handler(intervention)
+                else:
+                    result = await asyncio.to_thread(handler, intervention)
+                    if inspect.isawaitable(result):
+                        await result
+        except Exception as e:
+            if isinstance(e, TimeoutError):
+                logger.warning(f"Intervention handler {handler!r} timed out")
+            if ignore_fail:
+                return
+            if self._error is None:
+                self._error = e
+            if self._task is not None:
+                self._task.cancel()
+
+
+def _deliver(
+    intervention: InterventionInstance,
+    queue: Queue[InterventionInstance] | None,
+    handlers: dict[Callable[[InterventionInstance], object], bool],
+) -> None:
+    if queue is not None:
+        queue.put(intervention)
+
+    for handler, ignore_fail in list(handlers.items()):
+        try:
+            handler(intervention)
+        except Exception:
+            if not ignore_fail:
+                raise
+            continue
+
+
+def _is_coroutine_function(handler: Callable) -> bool:
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        getattr(handler, "__call__", None)
+    )
 
-                    if self._queue:
-                        self._queue.put(intervention)
 
-                    for handler, ignore_fail in self._handlers.items():
-                        try:
-                            handler(intervention)
-                        except Exception:
-                            if not ignore_fail:
-                                raise
-                            continue
+def _parse_event(event: ServerSentEvent) -> InterventionInstance:
+    return InterventionInstance.model_validate_json(event.data)
 
 
 atexit.register(InterventionsSubscription.cleanup)
@@ -0,0 +1,41 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+from threading import Lock
+
+from pydantic import BaseModel
+
+
+class HistogramSnapshot(BaseModel):
+    bounds: list[float]
+    """Inclusive upper bounds of the buckets; the last bucket counts every value above the last bound."""
+    counts: list[int]
+    count: int
+    sum: float
+
+
+class Histogram:
+    """
+    A thread-safe histogram with fixed bucket upper bounds.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = sorted(bounds)
+        self._lock = Lock()
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.bounds, value)] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            return HistogramSnapshot(
+                bounds=list(self.bounds),
+                counts=list(self._counts),
+                count=self._count,
+                sum=self._sum,
+            )
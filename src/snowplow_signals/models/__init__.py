@@ -43,6 +43,7 @@ from .model import InterventionInstance as InterventionInstance
 from .model import (
     InterventionReference,
     LinkAttributeKey,
+    PublishResponse,
     RuleInterventionInput,
     RuleInterventionOutput,
     SelectivePublishRequest,
@@ -54,6 +55,7 @@ from .model import (
 from .model import (
     TestAttributeGroupRequest,
     UnpublishRequest,
+    UnpublishResponse,
 )
 from .service import Service
 
@@ -93,6 +95,8 @@ InterventionReference
 AttributeKeyReference
 SelectivePublishRequest
 UnpublishRequest
+PublishResponse
+UnpublishResponse
 AttributeWithStringProperty
 CriteriaWithStringProperty
 CriterionWithStringProperty
@@ -0,0 +1,88 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from .api_client import ApiClient, AsyncApiClient
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def list_params(**filters: Any) -> dict[str, Any]:
+    """
+    Returns the query parameters of the filters that are set.
+    """
+    return {name: value for name, value in filters.items() if value is not None}
+
+
+def iter_items(
+    api_client: ApiClient,
+    endpoint: str,
+    params: dict[str, Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Any]:
+    """
+    Lists a registry collection page by page with `limit` and `offset`, fetching a page only once the previous one has been consumed.
+
+    Args:
+        api_client: The client sending the requests.
+        endpoint: The collection endpoint.
+        params: The filters, sent as query parameters with every page.
+        page_size: The number of items requested per page.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    offset = 0
+    first: Any = None
+    while True:
+        page = api_client.make_request(
+            method="GET",
+            endpoint=endpoint,
+            params={**params, "limit": page_size, "offset": offset},
+        )
+        if _repeats(page, first, offset):
+            return
+        yield from page
+        if _is_last(page, page_size):
+            return
+        if offset == 0:
+            first = page[0]
+        offset += len(page)
+
+
+async def aiter_items(
+    api_client: AsyncApiClient,
+    endpoint: str,
+    params: dict[str, Any],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[Any]:
+    """
+    Asyncio counterpart of `iter_items`.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    offset = 0
+    first: Any = None
+    while True:
+        page = await api_client.make_request(
+            method="GET",
+            endpoint=endpoint,
+            params={**params, "limit": page_size, "offset": offset},
+        )
+        if _repeats(page, first, offset):
+            return
+        for item in page:
+            yield item
+        if _is_last(page, page_size):
+            return
+        if offset == 0:
+            first = page[0]
+        offset += len(page)
+
+
+def _is_last(page: list, page_size: int) -> bool:
+    # an API that does not paginate returns the whole collection at once, however long
+    return len(page) != page_size
+
+
+def _repeats(page: list, first: Any, offset: int) -> bool:
+    # an API that ignores the offset returns the first page again
+    return offset > 0 and bool(page) and page[0] == first
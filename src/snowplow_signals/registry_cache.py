@@ -0,0 +1,227 @@
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Any, NamedTuple
+
+import httpx
+
+from .api_client import (
+    ApiClient,
+    AsyncApiClient,
+    ConditionalResponse,
+    SignalsAPIError,
+    _is_unavailable,
+)
+from .cli_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_REGISTRY_MAX_AGE = timedelta(minutes=5)
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class RegistryCacheEntry(NamedTuple):
+    body: Any
+    """The decoded JSON response of the registry endpoint."""
+    etag: str | None
+    """The `ETag` the API sent with the response, used to revalidate it."""
+    fetched_at: float
+    """When the response was last fetched or revalidated, in seconds since the epoch."""
+
+
+class RegistryCache:
+    """
+    A thread-safe snapshot of registry reads, kept in memory and optionally in a file that survives restarts.
+
+    Entries younger than `max_age` are served without a request. Older entries are revalidated with a conditional request,
+    so an unchanged definition costs a 304 Not Modified rather than a full read, and keep being served while the API is unavailable.
+    Pass an instance as `registry_cache` to `Signals` to read attribute groups, services and interventions through it.
+    """
+
+    def __init__(
+        self,
+        max_age: timedelta = DEFAULT_REGISTRY_MAX_AGE,
+        path: str | os.PathLike[str] | None = None,
+        warm_from_file: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            max_age: How long entries are served without revalidation.
+            path: A JSON file the snapshot is loaded from on creation and saved to whenever an entry changes; revalidations that find an entry unchanged are not saved.
+            warm_from_file: Whether the entries loaded from `path` are served without revalidation for `max_age`, however old they are, so that starting up does not wait on the registry.
+            clock: Wall clock returning seconds since the epoch, for testing.
+        """
+        self.max_age = max_age
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: dict[str, RegistryCacheEntry] = {}
+        # snapshots are numbered so that a slow save never overwrites a newer one
+        self._save_lock = Lock()
+        self._version = 0
+        self._saved_version = 0
+        if self.path is not None:
+            self._load(self.path, warm_from_file)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, endpoint: str) -> RegistryCacheEntry | None:
+        """
+        Returns the entry of an endpoint, fresh or not, or None if it was never fetched.
+        """
+        with self._lock:
+            return self._entries.get(endpoint)
+
+    def is_fresh(self, entry: RegistryCacheEntry) -> bool:
+        return self._clock() - entry.fetched_at < self.max_age.total_seconds()
+
+    def store(self, endpoint: str, body: Any, etag: str | None) -> None:
+        with self._lock:
+            previous = self._entries.get(endpoint)
+            self._entries[endpoint] = RegistryCacheEntry(body, etag, self._clock())
+            if self.path is None or (
+                previous is not None
+                and previous.etag == etag
+                and (previous.body is body or previous.body == body)
+            ):
+                return
+            version, entries = self._snapshot()
+        self._save(self.path, version, entries)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """
+        Removes the entries of all endpoints starting with the prefix; the default clears the cache.
+
+        Returns:
+            The number of removed entries.
+        """
+        with self._lock:
+            endpoints = [
+                endpoint for endpoint in self._entries if endpoint.startswith(prefix)
+            ]
+            for endpoint in endpoints:
+                del self._entries[endpoint]
+            if not endpoints or self.path is None:
+                return len(endpoints)
+            version, entries = self._snapshot()
+        self._save(self.path, version, entries)
+        return len(endpoints)
+
+    def _load(self, path: Path, warm: bool) -> None:
+        try:
+            snapshot = json.loads(path.read_text())
+            if snapshot.get("version") != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"unsupported version {snapshot.get('version')}")
+            now = self._clock()
+            self._entries = {
+                endpoint: RegistryCacheEntry(
+                    entry["body"],
+                    entry.get("etag"),
+                    now if warm else entry["fetched_at"],
+                )
+                for endpoint, entry in snapshot["entries"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable registry snapshot {path}: {e}")
+
+    def _snapshot(self) -> tuple[int, dict[str, RegistryCacheEntry]]:
+        # called with the lock held; the entries are immutable, so a shallow copy is enough to save them without it
+        self._version += 1
+        return self._version, dict(self._entries)
+
+    def _save(
+        self, path: Path, version: int, entries: dict[str, RegistryCacheEntry]
+    ) -> None:
+        snapshot = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "entries": {
+                endpoint: entry._asdict() for endpoint, entry in entries.items()
+            },
+        }
+        with self._save_lock:
+            if version <= self._saved_version:
+                return
+            try:
+                # written next to the snapshot and renamed, so readers never see a partial file
+                with tempfile.NamedTemporaryFile(
+                    "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+                ) as file:
+                    json.dump(snapshot, file)
+                os.replace(file.name, path)
+            except OSError as e:
+                logger.warning(f"Failed to save the registry snapshot {path}: {e}")
+            self._saved_version = version
+
+
+def cached_get(
+    api_client: ApiClient, cache: RegistryCache | None, endpoint: str
+) -> Any:
+    """
+    Reads a registry endpoint through the cache, if any.
+    """
+    if cache is None:
+        return api_client.make_request(method="GET", endpoint=endpoint)
+    entry = cache.lookup(endpoint)
+    if entry is not None and cache.is_fresh(entry):
+        return entry.body
+    try:
+        response = api_client.make_conditional_request(
+            endpoint, entry.etag if entry is not None else None
+        )
+    except (SignalsAPIError, httpx.TransportError) as e:
+        return _serve_stale(endpoint, entry, e)
+    return _store(cache, endpoint, entry, response)
+
+
+async def async_cached_get(
+    api_client: AsyncApiClient, cache: RegistryCache | None, endpoint: str
+) -> Any:
+    """
+    Asyncio counterpart of `cached_get`.
+    """
+    if cache is None:
+        return await api_client.make_request(method="GET", endpoint=endpoint)
+    entry = cache.lookup(endpoint)
+    if entry is not None and cache.is_fresh(entry):
+        return entry.body
+    try:
+        response = await api_client.make_conditional_request(
+            endpoint, entry.etag if entry is not None else None
+        )
+    except (SignalsAPIError, httpx.TransportError) as e:
+        return _serve_stale(endpoint, entry, e)
+    return _store(cache, endpoint, entry, response)
+
+
+def _store(
+    cache: RegistryCache,
+    endpoint: str,
+    entry: RegistryCacheEntry | None,
+    response: ConditionalResponse,
+) -> Any:
+    # a 304 Not Modified only answers a request made with the ETag of an entry
+    body = response.body
+    if body is None and entry is not None:
+        body = entry.body
+    cache.store(endpoint, body, response.etag)
+    return body
+
+
+def _serve_stale(
+    endpoint: str, entry: RegistryCacheEntry | None, error: Exception
+) -> Any:
+    if entry is None or not _is_unavailable(error):
+        raise error
+    logger.warning(
+        f"Serving the cached {endpoint}, the Signals API is unavailable: {error}"
+    )
+    return entry.body
@@ -1,215 +1,1005 @@
+import asyncio
+import os
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterator,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import NamedTuple
+
 from pydantic import BaseModel
 
-from .api_client import ApiClient, SignalsAPIError
+from .api_client import ApiClient, AsyncApiClient, SignalsAPIError
 from .models import (
     AttributeGroup,
+    AttributeGroupReference,
     AttributeGroupResponse,
     AttributeKey,
+    AttributeKeyOutput,
+    AttributeKeyReference,
+    InterventionReference,
+    PublishResponse,
     RuleIntervention,
+    SelectivePublishRequest,
+    Service,
+    ServiceReference,
+    UnpublishRequest,
+    UnpublishResponse,
+)
+from .pagination import DEFAULT_PAGE_SIZE, aiter_items, iter_items, list_params
+from .registry_cache import RegistryCache, async_cached_get, cached_get
+from .registry_export import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    EXPORTED_COLLECTIONS,
+    read_batches,
+    write_objects,
+)
+from .registry_plan import RegistryChange, RegistryKey, RegistryPlan, build_plan
+
+RegistryObject = AttributeGroup | Service | AttributeKey | RuleIntervention
+
+# Attribute keys are dependencies of attribute groups, which are dependencies of services.
+PUBLISH_ORDER: tuple[type[RegistryObject], ...] = (
+    AttributeKey,
+    AttributeGroup,
     Service,
+    RuleIntervention,
 )
 
+DEFAULT_MAX_PUBLISH_WORKERS = 8
+# the statuses with which the API rejects creating an object that already exists
+ALREADY_EXISTS_STATUSES = (400, 409)
+# up to this many objects of a collection are planned by fetching each of them, instead of listing the whole collection
+MAX_PLAN_LOOKUPS = 10
+
+
+class RegistryObjectResult(NamedTuple):
+    object: RegistryObject
+    """The object as sent to the registry."""
+    response: RegistryObject | None
+    """The object as stored by the registry, or None if it failed."""
+    error: BaseException | None
+    """Why the object failed, or None if it was created or updated."""
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class RegistryImportSummary(NamedTuple):
+    imported: int
+    """The number of objects created or updated."""
+    failed: list[RegistryObjectResult]
+    """The outcomes of the objects that could not be imported."""
+
+
+class RegistryDependencyError(Exception):
+    """
+    Fails an object that was not sent to the registry because one of its dependencies failed.
+    """
+
+    def __init__(self, dependency: RegistryObject):
+        super().__init__(
+            f"Dependency {type(dependency).__name__} '{dependency.name}' failed"
+        )
+        self.dependency = dependency
+
 
 class RegistryClient:
-    def __init__(self, api_client: ApiClient):
+    def __init__(self, api_client: ApiClient, cache: RegistryCache | None = None):
+        """
+        Args:
+            api_client: The client sending the requests.
+            cache: A snapshot the attribute groups and services are read through; writes through this client invalidate it.
+        """
         self.api_client = api_client
+        self.cache = cache
 
     def create_or_update(
-        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
-    ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
-        updated_objects: list[
-            AttributeGroup | Service | AttributeKey | RuleIntervention
-        ] = []
-
-        # First publish all attribute keys in case they are dependencies of attribute groups
-        for object in objects:
-            if isinstance(object, AttributeKey):
-                updated_objects.append(
-                    self._create_or_update_attribute_key(attribute_key=object)
-                )
+        self,
+        objects: list[RegistryObject],
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> list[RegistryObject]:
+        """
+        Creates or updates the objects in the Signals registry, sending independent objects concurrently.
+        If any object fails, the first error in publish order is raised once the other objects are done.
 
-        # Publish all attribute groups in case they are dependencies of services
-        for object in objects:
-            if isinstance(object, AttributeGroup):
-                updated_objects.append(
-                    self._create_or_update_attribute_group(attribute_group=object)
-                )
+        Args:
+            objects: The objects to create or update.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            The objects as stored by the registry, attribute keys first, then attribute groups, services and interventions.
+        """
+        return raise_first_error(self.create_or_update_all(objects, max_workers))
 
-        for object in objects:
-            if isinstance(object, Service):
-                updated_objects.append(self._create_or_update_service(service=object))
+    def create_or_update_all(
+        self,
+        objects: list[RegistryObject],
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> list[RegistryObjectResult]:
+        """
+        Creates or updates the objects in the Signals registry through a bounded pool of workers.
+        An object is only sent once the objects it depends on in the same call have been stored, and is failed without being sent if any of them failed.
 
-        for object in objects:
-            if isinstance(object, RuleIntervention):
-                updated_objects.append(
-                    self._create_or_update_intervention(intervention=object)
-                )
+        Args:
+            objects: The objects to create or update.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            The outcome of every object, attribute keys first, then attribute groups, services and interventions.
+        """
+        run = _PublishRun(_sort_for_publish(objects))
+        return self._send_all(
+            run, lambda index: self._create_or_update(run.objects[index]), max_workers
+        )
 
-        return updated_objects
+    def plan(self, objects: list[RegistryObject]) -> RegistryPlan:
+        """
+        Compares the objects against the current state of the Signals registry.
+        Only the collections the objects belong to are read: objects are fetched one by one if there are at most `MAX_PLAN_LOOKUPS` of a collection, else the collection is listed page by page.
 
-    def delete(
-        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
-    ) -> None:
+        Args:
+            objects: The objects to create or update.
+        Returns:
+            The plan of creates and updates, which can be printed to review it and passed to `apply`.
         """
-        Deletes the provided objects from the Signals registry.
+        objects = _sort_for_publish(objects)
+        current: dict[RegistryKey, dict] = {}
+        for endpoint, members in _group_by_collection(objects).items():
+            if len(members) <= MAX_PLAN_LOOKUPS:
+                for object in members:
+                    existing = self._get_existing(object)
+                    if existing is not None:
+                        current[_registry_key(object)] = existing
+            else:
+                items = list(iter_items(self.api_client, endpoint, {}))
+                current.update(_index_registry_objects(endpoint, items))
+        return build_plan(objects, current, _registry_key)
+
+    def apply(
+        self,
+        plan: RegistryPlan,
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> list[RegistryObjectResult]:
+        """
+        Sends the creates and updates of a plan, concurrently and in dependency order like `create_or_update_all`.
+        Unchanged objects are not sent.
+
+        Args:
+            plan: The plan returned by `plan`.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            The outcome of every object of the plan; unchanged objects succeed with the local object as their response.
+        """
+        run = _PublishRun(
+            [change.object for change in plan.changes], stored=_unchanged(plan)
+        )
+        return self._send_all(
+            run, lambda index: self._apply_change(plan.changes[index]), max_workers
+        )
+
+    def publish(self, objects: list[RegistryObject]) -> PublishResponse:
+        """
+        Publishes objects that already exist in the Signals registry to the compute engines with a single request, referencing them by name and version instead of sending their definitions.
+        """
+        response = self.api_client.make_request(
+            method="POST",
+            endpoint="engines/publish",
+            data=_model_dump(SelectivePublishRequest(**_references(objects))),
+        )
+        _invalidate(self.cache, objects)
+        return PublishResponse.model_validate(response)
+
+    def unpublish(self, objects: list[RegistryObject]) -> UnpublishResponse:
+        """
+        Unpublishes objects that already exist in the Signals registry from the compute engines with a single request, referencing them by name and version instead of sending their definitions.
+        """
+        response = self.api_client.make_request(
+            method="POST",
+            endpoint="engines/unpublish",
+            data=_model_dump(UnpublishRequest(**_references(objects))),
+        )
+        _invalidate(self.cache, objects)
+        return UnpublishResponse.model_validate(response)
+
+    def export(self, path: str | os.PathLike[str]) -> int:
         """
-        for object in objects:
-            if isinstance(object, RuleIntervention):
-                self._delete_intervention(intervention=object)
+        Writes every attribute key, attribute group, service and intervention of the Signals registry, all versions, to a JSON-lines file.
+        Collections are fetched a page at a time and each page is written as soon as it is fetched, so only one page is held in memory.
 
-        for object in objects:
-            if isinstance(object, Service):
-                self._delete_service(service=object)
+        Args:
+            path: The file to write, replaced if it exists.
+        Returns:
+            The number of exported objects.
+        """
+        count = 0
+        with open(path, "w") as file:
+            for kind, endpoint, _ in EXPORTED_COLLECTIONS:
+                count += write_objects(
+                    file, kind, iter_items(self.api_client, endpoint, {})
+                )
+        return count
 
-        for object in objects:
-            if isinstance(object, AttributeGroup):
-                self._delete_attribute_group(attribute_group=object)
+    def import_(
+        self,
+        path: str | os.PathLike[str],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> RegistryImportSummary:
+        """
+        Creates or updates the objects of a file written by `export`, reading it incrementally.
+        Every batch is sent concurrently like `create_or_update_all`, and as the file is in publish order, the objects of a batch only depend on the batches before it.
 
-        for object in objects:
-            if isinstance(object, AttributeKey):
-                self._delete_attribute_key(attribute_key=object)
+        Args:
+            path: The file written by `export`.
+            batch_size: The maximum number of objects read and sent at a time.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            How many objects were imported, and the outcomes of the ones that failed.
+        """
+        imported = 0
+        failed: list[RegistryObjectResult] = []
+        for batch in read_batches(path, batch_size):
+            for result in self.create_or_update_all(batch, max_workers):
+                if result.succeeded:
+                    imported += 1
+                else:
+                    failed.append(result)
+        return RegistryImportSummary(imported, failed)
+
+    def delete(self, objects: list[RegistryObject]) -> None:
+        """
+        Deletes the provided objects from the Signals registry.
+        """
+        for object in _sort_for_delete(objects):
+            self.api_client.make_request(
+                method="DELETE",
+                endpoint=_object_endpoint(object),
+            )
+        _invalidate(self.cache, objects)
 
     def get_attribute_group(
         self, name: str, version: int | None = None
     ) -> AttributeGroupResponse:
-        if version is not None:
-            response = self.api_client.make_request(
-                method="GET",
-                endpoint=(f"registry/attribute_groups/{name}/versions/{version}"),
-            )
-        else:
-            response = self.api_client.make_request(
-                method="GET",
-                endpoint=(f"registry/attribute_groups/{name}"),
-            )
+        response = cached_get(
+            self.api_client, self.cache, _attribute_group_endpoint(name, version)
+        )
 
         return AttributeGroupResponse.model_validate(response)
 
     def get_service(self, name: str) -> Service:
-        response = self.api_client.make_request(
-            method="GET",
-            endpoint=(f"registry/services/{name}"),
-        )
+        response = cached_get(self.api_client, self.cache, f"registry/services/{name}")
         return Service.model_validate(response)
 
-    def _create_or_update_attribute_group(
-        self, attribute_group: AttributeGroup
-    ) -> AttributeGroup:
+    def iter_attribute_keys(
+        self,
+        *,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[AttributeKeyOutput]:
+        """
+        Lists the attribute keys of the Signals registry lazily, fetching a page at a time and validating each key as it is consumed.
+
+        Args:
+            name_prefix: Only list keys whose name starts with this prefix.
+            published: Only list published, or unpublished, keys.
+            page_size: The number of keys fetched per request.
+        """
+        for item in iter_items(
+            self.api_client,
+            "registry/attribute_keys/",
+            list_params(name_prefix=name_prefix, is_published=published),
+            page_size,
+        ):
+            yield AttributeKeyOutput.model_validate(item)
+
+    def iter_attribute_groups(
+        self,
+        *,
+        offline: bool | None = None,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        property_syntax: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[AttributeGroupResponse]:
+        """
+        Lists the attribute groups of the Signals registry, all versions, lazily, fetching a page at a time and validating each group as it is consumed.
+
+        Args:
+            offline: Only list groups calculated in the warehouse, or in real time.
+            name_prefix: Only list groups whose name starts with this prefix.
+            published: Only list published, or unpublished, groups.
+            property_syntax: The warehouse syntax the API renders attribute properties in.
+            page_size: The number of groups fetched per request.
+        """
+        for item in iter_items(
+            self.api_client,
+            "registry/attribute_groups/",
+            list_params(
+                offline=offline,
+                name_prefix=name_prefix,
+                is_published=published,
+                property_syntax=property_syntax,
+            ),
+            page_size,
+        ):
+            yield AttributeGroupResponse.model_validate(item)
+
+    def iter_services(
+        self,
+        *,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Service]:
+        """
+        Lists the services of the Signals registry lazily, fetching a page at a time and validating each service as it is consumed.
+
+        Args:
+            name_prefix: Only list services whose name starts with this prefix.
+            published: Only list published, or unpublished, services.
+            page_size: The number of services fetched per request.
+        """
+        for item in iter_items(
+            self.api_client,
+            "registry/services/",
+            list_params(name_prefix=name_prefix, is_published=published),
+            page_size,
+        ):
+            yield Service.model_validate(item)
+
+    def _get_existing(self, object: RegistryObject) -> dict | None:
         try:
-            response = self.api_client.make_request(
-                method="POST",
-                endpoint="registry/attribute_groups/",
-                data=self._model_dump(attribute_group),
+            return self.api_client.make_request(
+                method="GET", endpoint=_object_endpoint(object)
             )
         except SignalsAPIError as e:
-            if e.status_code == 400:
-                response = self.api_client.make_request(
-                    method="PUT",
-                    endpoint=(
-                        f"registry/attribute_groups/{attribute_group.name}/versions/{attribute_group.version}"
-                    ),
-                    data=self._model_dump(attribute_group),
-                )
-            else:
-                raise e
-
-        return AttributeGroup.model_validate(response)
+            if e.status_code == 404:
+                return None
+            raise
 
-    def _create_or_update_service(self, service: Service) -> Service:
+    def _create_or_update(self, object: RegistryObject) -> RegistryObject:
         try:
             response = self.api_client.make_request(
                 method="POST",
-                endpoint="registry/services/",
-                data=self._model_dump(service),
+                endpoint=_collection_endpoint(object),
+                data=_model_dump(object),
             )
         except SignalsAPIError as e:
-            if e.status_code == 400:
+            if e.status_code in ALREADY_EXISTS_STATUSES:
                 response = self.api_client.make_request(
                     method="PUT",
-                    endpoint=(f"registry/services/{service.name}"),
-                    data=self._model_dump(service),
+                    endpoint=_object_endpoint(object),
+                    data=_model_dump(object),
                 )
             else:
                 raise e
 
+        _invalidate(self.cache, [object])
+        return _object_type(object).model_validate(response)
+
+    def _send_all(
+        self,
+        run: "_PublishRun",
+        send: Callable[[int], RegistryObject],
+        max_workers: int,
+    ) -> list[RegistryObjectResult]:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="SignalsPublish"
+        ) as executor:
+
+            def submit(indexes: list[int]) -> None:
+                for index in indexes:
+                    pending[executor.submit(send, index)] = index
+
+            pending: dict[Future[RegistryObject], int] = {}
+            submit(run.ready())
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        submit(run.succeed(index, future.result()))
+                    else:
+                        run.fail(index, error)
+        return run.results()
+
+    def _apply_change(self, change: RegistryChange) -> RegistryObject:
+        object = change.object
+        if change.action == "create":
+            # falls back to an update if the object was created since the plan
+            return self._create_or_update(object)
+        response = self.api_client.make_request(
+            method="PUT", endpoint=_object_endpoint(object), data=_model_dump(object)
+        )
+        _invalidate(self.cache, [object])
+        return _object_type(object).model_validate(response)
+
+
+class AsyncRegistryClient:
+    """
+    Asyncio counterpart of `RegistryClient`.
+    """
+
+    def __init__(self, api_client: AsyncApiClient, cache: RegistryCache | None = None):
+        self.api_client = api_client
+        self.cache = cache
+
+    async def create_or_update(
+        self,
+        objects: list[RegistryObject],
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> list[RegistryObject]:
+        """
+        Creates or updates the objects in the Signals registry, sending independent objects concurrently.
+        If any object fails, the first error in publish order is raised once the other objects are done.
+
+        Args:
+            objects: The objects to create or update.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            The objects as stored by the registry, attribute keys first, then attribute groups, services and interventions.
+        """
+        return raise_first_error(await self.create_or_update_all(objects, max_workers))
+
+    async def create_or_update_all(
+        self,
+        objects: list[RegistryObject],
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> list[RegistryObjectResult]:
+        """
+        Creates or updates the objects in the Signals registry, with at most `max_workers` requests in flight.
+        An object is only sent once the objects it depends on in the same call have been stored, and is failed without being sent if any of them failed.
+
+        Args:
+            objects: The objects to create or update.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            The outcome of every object, attribute keys first, then attribute groups, services and interventions.
+        """
+        run = _PublishRun(_sort_for_publish(objects))
+        return await self._send_all(
+            run, lambda index: self._create_or_update(run.objects[index]), max_workers
+        )
+
+    async def plan(self, objects: list[RegistryObject]) -> RegistryPlan:
+        """
+        Compares the objects against the current state of the Signals registry, like `RegistryClient.plan`, reading the collections concurrently.
+        """
+        objects = _sort_for_publish(objects)
+
+        async def read_collection(
+            endpoint: str, members: list[RegistryObject]
+        ) -> dict[RegistryKey, dict]:
+            if len(members) <= MAX_PLAN_LOOKUPS:
+                existing = await asyncio.gather(
+                    *(self._get_existing(object) for object in members)
+                )
+                return {
+                    _registry_key(object): found
+                    for object, found in zip(members, existing)
+                    if found is not None
+                }
+            items = [item async for item in aiter_items(self.api_client, endpoint, {})]
+            return _index_registry_objects(endpoint, items)
+
+        current: dict[RegistryKey, dict] = {}
+        for collection in await asyncio.gather(
+            *(
+                read_collection(endpoint, members)
+                for endpoint, members in _group_by_collection(objects).items()
+            )
+        ):
+            current.update(collection)
+        return build_plan(objects, current, _registry_key)
+
+    async def apply(
+        self,
+        plan: RegistryPlan,
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> list[RegistryObjectResult]:
+        """
+        Sends the creates and updates of a plan, concurrently and in dependency order like `create_or_update_all`.
+        Unchanged objects are not sent.
+
+        Args:
+            plan: The plan returned by `plan`.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            The outcome of every object of the plan; unchanged objects succeed with the local object as their response.
+        """
+        run = _PublishRun(
+            [change.object for change in plan.changes], stored=_unchanged(plan)
+        )
+        return await self._send_all(
+            run, lambda index: self._apply_change(plan.changes[index]), max_workers
+        )
+
+    async def publish(self, objects: list[RegistryObject]) -> PublishResponse:
+        """
+        Publishes objects that already exist in the Signals registry to the compute engines with a single request, referencing them by name and version instead of sending their definitions.
+        """
+        response = await self.api_client.make_request(
+            method="POST",
+            endpoint="engines/publish",
+            data=_model_dump(SelectivePublishRequest(**_references(objects))),
+        )
+        _invalidate(self.cache, objects)
+        return PublishResponse.model_validate(response)
+
+    async def unpublish(self, objects: list[RegistryObject]) -> UnpublishResponse:
+        """
+        Unpublishes objects that already exist in the Signals registry from the compute engines with a single request, referencing them by name and version instead of sending their definitions.
+        """
+        response = await self.api_client.make_request(
+            method="POST",
+            endpoint="engines/unpublish",
+            data=_model_dump(UnpublishRequest(**_references(objects))),
+        )
+        _invalidate(self.cache, objects)
+        return UnpublishResponse.model_validate(response)
+
+    async def export(self, path: str | os.PathLike[str]) -> int:
+        """
+        Writes every attribute key, attribute group, service and intervention of the Signals registry, all versions, to a JSON-lines file.
+        Collections are fetched a page at a time and each page is written as soon as it is fetched, so only one page is held in memory.
+
+        Args:
+            path: The file to write, replaced if it exists.
+        Returns:
+            The number of exported objects.
+        """
+        count = 0
+        with open(path, "w") as file:
+            for kind, endpoint, _ in EXPORTED_COLLECTIONS:
+                async for object in aiter_items(self.api_client, endpoint, {}):
+                    count += write_objects(file, kind, [object])
+        return count
+
+    async def import_(
+        self,
+        path: str | os.PathLike[str],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_PUBLISH_WORKERS,
+    ) -> RegistryImportSummary:
+        """
+        Creates or updates the objects of a file written by `export`, reading it incrementally.
+        Every batch is sent concurrently like `create_or_update_all`, and as the file is in publish order, the objects of a batch only depend on the batches before it.
+
+        Args:
+            path: The file written by `export`.
+            batch_size: The maximum number of objects read and sent at a time.
+            max_workers: The maximum number of concurrent requests.
+        Returns:
+            How many objects were imported, and the outcomes of the ones that failed.
+        """
+        imported = 0
+        failed: list[RegistryObjectResult] = []
+        for batch in read_batches(path, batch_size):
+            for result in await self.create_or_update_all(batch, max_workers):
+                if result.succeeded:
+                    imported += 1
+                else:
+                    failed.append(result)
+        return RegistryImportSummary(imported, failed)
+
+    async def delete(self, objects: list[RegistryObject]) -> None:
+        """
+        Deletes the provided objects from the Signals registry.
+        """
+        for object in _sort_for_delete(objects):
+            await self.api_client.make_request(
+                method="DELETE",
+                endpoint=_object_endpoint(object),
+            )
+        _invalidate(self.cache, objects)
+
+    async def get_attribute_group(
+        self, name: str, version: int | None = None
+    ) -> AttributeGroupResponse:
+        response = await async_cached_get(
+            self.api_client, self.cache, _attribute_group_endpoint(name, version)
+        )
+
+        return AttributeGroupResponse.model_validate(response)
+
+    async def get_service(self, name: str) -> Service:
+        response = await async_cached_get(
+            self.api_client, self.cache, f"registry/services/{name}"
+        )
         return Service.model_validate(response)
 
-    def _create_or_update_intervention(
-        self, intervention: RuleIntervention
-    ) -> RuleIntervention:
+    async def iter_attribute_keys(
+        self,
+        *,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[AttributeKeyOutput]:
+        """
+        Lists the attribute keys of the Signals registry lazily, fetching a page at a time and validating each key as it is consumed.
+
+        Args:
+            name_prefix: Only list keys whose name starts with this prefix.
+            published: Only list published, or unpublished, keys.
+            page_size: The number of keys fetched per request.
+        """
+        async for item in aiter_items(
+            self.api_client,
+            "registry/attribute_keys/",
+            list_params(name_prefix=name_prefix, is_published=published),
+            page_size,
+        ):
+            yield AttributeKeyOutput.model_validate(item)
+
+    async def iter_attribute_groups(
+        self,
+        *,
+        offline: bool | None = None,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        property_syntax: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[AttributeGroupResponse]:
+        """
+        Lists the attribute groups of the Signals registry, all versions, lazily, fetching a page at a time and validating each group as it is consumed.
+
+        Args:
+            offline: Only list groups calculated in the warehouse, or in real time.
+            name_prefix: Only list groups whose name starts with this prefix.
+            published: Only list published, or unpublished, groups.
+            property_syntax: The warehouse syntax the API renders attribute properties in.
+            page_size: The number of groups fetched per request.
+        """
+        async for item in aiter_items(
+            self.api_client,
+            "registry/attribute_groups/",
+            list_params(
+                offline=offline,
+                name_prefix=name_prefix,
+                is_published=published,
+                property_syntax=property_syntax,
+            ),
+            page_size,
+        ):
+            yield AttributeGroupResponse.model_validate(item)
+
+    async def iter_services(
+        self,
+        *,
+        name_prefix: str | None = None,
+        published: bool | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Service]:
+        """
+        Lists the services of the Signals registry lazily, fetching a page at a time and validating each service as it is consumed.
+
+        Args:
+            name_prefix: Only list services whose name starts with this prefix.
+            published: Only list published, or unpublished, services.
+            page_size: The number of services fetched per request.
+        """
+        async for item in aiter_items(
+            self.api_client,
+            "registry/services/",
+            list_params(name_prefix=name_prefix, is_published=published),
+            page_size,
+        ):
+            yield Service.model_validate(item)
+
+    async def _get_existing(self, object: RegistryObject) -> dict | None:
         try:
-            response = self.api_client.make_request(
-                method="POST",
-                endpoint="registry/interventions/",
-                data=self._model_dump(intervention),
+            return await self.api_client.make_request(
+                method="GET", endpoint=_object_endpoint(object)
             )
         except SignalsAPIError as e:
-            if e.status_code == 400:
-                response = self.api_client.make_request(
-                    method="PUT",
-                    endpoint=(
-                        f"registry/interventions/{intervention.name}/versions/{intervention.version}"
-                    ),
-                    data=self._model_dump(intervention),
-                )
-            else:
-                raise e
+            if e.status_code == 404:
+                return None
+            raise
 
-        return RuleIntervention.model_validate(response)
-
-    def _create_or_update_attribute_key(
-        self, attribute_key: AttributeKey
-    ) -> AttributeKey:
+    async def _create_or_update(self, object: RegistryObject) -> RegistryObject:
         try:
-            response = self.api_client.make_request(
+            response = await self.api_client.make_request(
                 method="POST",
-                endpoint="registry/attribute_keys/",
-                data=self._model_dump(attribute_key),
+                endpoint=_collection_endpoint(object),
+                data=_model_dump(object),
             )
         except SignalsAPIError as e:
-            if e.status_code == 400:
-                response = self.api_client.make_request(
+            if e.status_code in ALREADY_EXISTS_STATUSES:
+                response = await self.api_client.make_request(
                     method="PUT",
-                    endpoint=(f"registry/attribute_keys/{attribute_key.name}"),
-                    data=self._model_dump(attribute_key),
+                    endpoint=_object_endpoint(object),
+                    data=_model_dump(object),
                 )
             else:
                 raise e
 
-        return AttributeKey.model_validate(response)
+        _invalidate(self.cache, [object])
+        return _object_type(object).model_validate(response)
 
-    def _delete_attribute_group(self, attribute_group: AttributeGroup) -> None:
+    async def _send_all(
+        self,
+        run: "_PublishRun",
+        send: Callable[[int], Awaitable[RegistryObject]],
+        max_workers: int,
+    ) -> list[RegistryObjectResult]:
+        ready = deque(run.ready())
+        pending: dict[asyncio.Task[RegistryObject], int] = {}
+        while ready or pending:
+            while ready and len(pending) < max_workers:
+                index = ready.popleft()
+                pending[asyncio.ensure_future(send(index))] = index
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                error = task.exception()
+                if error is None:
+                    ready.extend(run.succeed(index, task.result()))
+                else:
+                    run.fail(index, error)
+        return run.results()
 
-        self.api_client.make_request(
-            method="DELETE",
-            endpoint=(
-                f"registry/attribute_groups/{attribute_group.name}/versions/{attribute_group.version}"
-            ),
+    async def _apply_change(self, change: RegistryChange) -> RegistryObject:
+        object = change.object
+        if change.action == "create":
+            # falls back to an update if the object was created since the plan
+            return await self._create_or_update(object)
+        response = await self.api_client.make_request(
+            method="PUT", endpoint=_object_endpoint(object), data=_model_dump(object)
         )
+        _invalidate(self.cache, [object])
+        return _object_type(object).model_validate(response)
 
-    def _delete_service(self, service: Service) -> None:
-        self.api_client.make_request(
-            method="DELETE",
-            endpoint=(f"registry/services/{service.name}"),
-        )
 
-    def _delete_intervention(self, intervention: RuleIntervention) -> None:
-        self.api_client.make_request(
-            method="DELETE",
-            endpoint=(
-                f"registry/interventions/{intervention.name}/versions/{intervention.version}"
-            ),
-        )
+def _sort_for_publish(objects: list[RegistryObject]) -> list[RegistryObject]:
+    return [
+        object
+        for object_type in PUBLISH_ORDER
+        for object in objects
+        if isinstance(object, object_type)
+    ]
 
-    def _delete_attribute_key(self, attribute_key: AttributeKey) -> None:
-        self.api_client.make_request(
-            method="DELETE",
-            endpoint=(f"registry/attribute_keys/{attribute_key.name}"),
-        )
 
-    def _model_dump(self, model: BaseModel) -> dict:
-        return model.model_dump(
-            mode="json",
-            exclude_none=True,
-            by_alias=True,
-        )
+def _publish_dependencies(objects: list[RegistryObject]) -> list[set[int]]:
+    """
+    Returns the indexes of the objects each object depends on, among the given objects.
+
+    Attribute groups depend on their attribute key and services on their attribute groups.
+    Interventions depend on their target attribute keys and, as their criteria may reference any attribute, on every attribute group.
+    """
+    keys = {
+        object.name: index
+        for index, object in enumerate(objects)
+        if isinstance(object, AttributeKey)
+    }
+    groups = {
+        (object.name, object.version): index
+        for index, object in enumerate(objects)
+        if isinstance(object, AttributeGroup)
+    }
+
+    dependencies: list[set[int]] = []
+    for object in objects:
+        if isinstance(object, AttributeGroup):
+            names = [object.attribute_key.name]
+            dependencies.append({keys[name] for name in names if name in keys})
+        elif isinstance(object, Service):
+            links = [(group.name, group.version) for group in object.attribute_groups]
+            dependencies.append({groups[link] for link in links if link in groups})
+        elif isinstance(object, RuleIntervention):
+            names = [key.name for key in object.target_attribute_keys or []]
+            dependencies.append(
+                {keys[name] for name in names if name in keys} | set(groups.values())
+            )
+        else:
+            dependencies.append(set())
+    return dependencies
+
+
+class _PublishRun:
+    """
+    Tracks which objects of a concurrent create or update are ready to be sent, and their outcomes.
+    """
+
+    def __init__(self, objects: list[RegistryObject], stored: Collection[int] = ()):
+        """
+        Args:
+            objects: The objects, in publish order.
+            stored: The indexes of the objects that are already up to date in the registry and are not sent.
+        """
+        self.objects = objects
+        dependencies = _publish_dependencies(self.objects)
+        self._waiting_on = [len(indexes) for indexes in dependencies]
+        self._dependents: list[list[int]] = [[] for _ in self.objects]
+        for index, indexes in enumerate(dependencies):
+            for dependency in indexes:
+                self._dependents[dependency].append(index)
+        self._results: dict[int, RegistryObjectResult] = {}
+        for index in stored:
+            self.succeed(index, self.objects[index])
+
+    def ready(self) -> list[int]:
+        return [
+            index
+            for index, count in enumerate(self._waiting_on)
+            if count == 0 and index not in self._results
+        ]
+
+    def succeed(self, index: int, response: RegistryObject) -> list[int]:
+        """
+        Records a stored object.
+
+        Returns:
+            The indexes of the objects that became ready to be sent.
+        """
+        self._results[index] = RegistryObjectResult(self.objects[index], response, None)
+        ready = []
+        for dependent in self._dependents[index]:
+            self._waiting_on[dependent] -= 1
+            if self._waiting_on[dependent] == 0 and dependent not in self._results:
+                ready.append(dependent)
+        return ready
+
+    def fail(self, index: int, error: BaseException) -> None:
+        """
+        Records a failed object, failing everything that depends on it.
+        """
+        self._results[index] = RegistryObjectResult(self.objects[index], None, error)
+        failed = deque([index])
+        while failed:
+            dependency = failed.popleft()
+            for dependent in self._dependents[dependency]:
+                if dependent not in self._results:
+                    self._results[dependent] = RegistryObjectResult(
+                        self.objects[dependent],
+                        None,
+                        RegistryDependencyError(self.objects[dependency]),
+                    )
+                    failed.append(dependent)
+
+    def results(self) -> list[RegistryObjectResult]:
+        return [self._results[index] for index in range(len(self.objects))]
+
+
+def _unchanged(plan: RegistryPlan) -> list[int]:
+    return [
+        index
+        for index, change in enumerate(plan.changes)
+        if change.action == "unchanged"
+    ]
+
+
+def _group_by_collection(
+    objects: list[RegistryObject],
+) -> dict[str, list[RegistryObject]]:
+    collections: dict[str, list[RegistryObject]] = {}
+    for object in objects:
+        collections.setdefault(_collection_endpoint(object), []).append(object)
+    return collections
+
+
+def _registry_key(object: RegistryObject) -> RegistryKey:
+    versioned = isinstance(object, (AttributeGroup, RuleIntervention))
+    return (
+        _collection_endpoint(object),
+        object.name,
+        object.version if versioned else None,
+    )
+
+
+def _index_registry_objects(
+    endpoint: str, response: list[dict]
+) -> dict[RegistryKey, dict]:
+    versioned = endpoint in (
+        "registry/attribute_groups/",
+        "registry/interventions/",
+    )
+    return {
+        (
+            endpoint,
+            object["name"],
+            object.get("version", 1) if versioned else None,
+        ): object
+        for object in response
+    }
+
+
+def _references(objects: list[RegistryObject]) -> dict[str, list | None]:
+    # empty lists become None so that they are left out of the request
+    return {
+        "attribute_keys": [
+            AttributeKeyReference(name=object.name)
+            for object in objects
+            if isinstance(object, AttributeKey)
+        ]
+        or None,
+        "attribute_groups": [
+            AttributeGroupReference(name=object.name, version=object.version)
+            for object in objects
+            if isinstance(object, AttributeGroup)
+        ]
+        or None,
+        "services": [
+            ServiceReference(name=object.name)
+            for object in objects
+            if isinstance(object, Service)
+        ]
+        or None,
+        "interventions": [
+            InterventionReference(name=object.name, version=object.version)
+            for object in objects
+            if isinstance(object, RuleIntervention)
+        ]
+        or None,
+    }
+
+
+def raise_first_error(results: list[RegistryObjectResult]) -> list[RegistryObject]:
+    """
+    Returns the stored objects of successful results, or raises the error of the first failed one.
+    """
+    for result in results:
+        if result.error is not None:
+            raise result.error
+    return [result.response for result in results if result.response is not None]
+
+
+def _invalidate(cache: RegistryCache | None, objects: list[RegistryObject]) -> None:
+    if cache is None:
+        return
+    for endpoint in dict.fromkeys(_collection_endpoint(object) for object in objects):
+        cache.invalidate(endpoint)
+
+
+def _sort_for_delete(objects: list[RegistryObject]) -> list[RegistryObject]:
+    return [
+        object
+        for object_type in reversed(PUBLISH_ORDER)
+        for object in objects
+        if isinstance(object, object_type)
+    ]
+
+
+def _object_type(object: RegistryObject) -> type[RegistryObject]:
+    return next(
+        object_type for object_type in PUBLISH_ORDER if isinstance(object, object_type)
+    )
+
+
+def _attribute_group_endpoint(name: str, version: int | None) -> str:
+    if version is not None:
+        return f"registry/attribute_groups/{name}/versions/{version}"
+    return f"registry/attribute_groups/{name}"
+
+
+def _collection_endpoint(object: RegistryObject) -> str:
+    if isinstance(object, AttributeKey):
+        return "registry/attribute_keys/"
+    if isinstance(object, AttributeGroup):
+        return "registry/attribute_groups/"
+    if isinstance(object, Service):
+        return "registry/services/"
+    return "registry/interventions/"
+
+
+def _object_endpoint(object: RegistryObject) -> str:
+    if isinstance(object, AttributeKey):
+        return f"registry/attribute_keys/{object.name}"
+    if isinstance(object, AttributeGroup):
+        return f"registry/attribute_groups/{object.name}/versions/{object.version}"
+    if isinstance(object, Service):
+        return f"registry/services/{object.name}"
+    return f"registry/interventions/{object.name}/versions/{object.version}"
+
+
+def _model_dump(model: BaseModel) -> dict:
+    return model.model_dump(
+        mode="json",
+        exclude_none=True,
+        by_alias=True,
+    )
@@ -0,0 +1,60 @@
+import json
+import os
+from collections.abc import Iterable, Iterator
+from typing import IO, TYPE_CHECKING
+
+from .models import AttributeGroup, AttributeKey, RuleIntervention, Service
+
+if TYPE_CHECKING:
+    from .registry_client import RegistryObject
+
+# In publish order, so that importing a file front to back stores every dependency before its dependents.
+EXPORTED_COLLECTIONS: tuple[tuple[str, str, type], ...] = (
+    ("attribute_key", "registry/attribute_keys/", AttributeKey),
+    ("attribute_group", "registry/attribute_groups/", AttributeGroup),
+    ("service", "registry/services/", Service),
+    ("intervention", "registry/interventions/", RuleIntervention),
+)
+
+DEFAULT_IMPORT_BATCH_SIZE = 500
+
+
+def write_objects(file: IO[str], kind: str, objects: Iterable[dict]) -> int:
+    """
+    Appends registry objects, as returned by the API, to a JSON-lines export file, one object per line.
+
+    Returns:
+        The number of written objects.
+    """
+    count = 0
+    for object in objects:
+        file.write(json.dumps({"kind": kind, "object": object}) + "\n")
+        count += 1
+    return count
+
+
+def read_batches(
+    path: str | os.PathLike[str], batch_size: int
+) -> Iterator[list["RegistryObject"]]:
+    """
+    Reads a JSON-lines export file incrementally, yielding its objects validated through their models in batches of at most `batch_size`.
+    """
+    models = {kind: model for kind, _, model in EXPORTED_COLLECTIONS}
+    batch: list["RegistryObject"] = []
+    with open(path) as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                model = models[record["kind"]]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(
+                    f"Invalid registry export record on line {line_number} of {path}: {e}"
+                ) from e
+            batch.append(model.model_validate(record["object"]))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
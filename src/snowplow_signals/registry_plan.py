@@ -0,0 +1,118 @@
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from pydantic import ValidationError
+
+from .models import AttributeGroup, RuleIntervention
+
+if TYPE_CHECKING:
+    from .registry_client import RegistryObject
+
+RegistryChangeAction = Literal["create", "update", "unchanged"]
+RegistryKey = tuple[str, str, int | None]
+"""The collection endpoint, name and version (for versioned objects) identifying a registry object."""
+
+
+class RegistryChange(NamedTuple):
+    action: RegistryChangeAction
+    object: "RegistryObject"
+    """The local object."""
+    changes: dict[str, tuple[Any, Any]]
+    """The top-level fields that differ from the registry, mapped to their current and desired values. Empty unless the action is 'update'."""
+
+
+class RegistryPlan:
+    """
+    The creates and updates needed to bring the Signals registry in line with a set of local objects, in publish order.
+    Printing a plan shows what will change.
+    """
+
+    def __init__(self, changes: list[RegistryChange]):
+        self.changes = changes
+
+    @property
+    def creates(self) -> list[RegistryChange]:
+        return [change for change in self.changes if change.action == "create"]
+
+    @property
+    def updates(self) -> list[RegistryChange]:
+        return [change for change in self.changes if change.action == "update"]
+
+    @property
+    def unchanged(self) -> list[RegistryChange]:
+        return [change for change in self.changes if change.action == "unchanged"]
+
+    @property
+    def has_changes(self) -> bool:
+        return any(change.action != "unchanged" for change in self.changes)
+
+    def __str__(self) -> str:
+        lines = []
+        for change in self.changes:
+            if change.action == "unchanged":
+                continue
+            symbol = "+" if change.action == "create" else "~"
+            lines.append(f"{symbol} {change.action} {_describe(change.object)}")
+            for field, (current, desired) in change.changes.items():
+                lines.append(f"    {field}: {current!r} -> {desired!r}")
+        lines.append(
+            f"Plan: {len(self.creates)} to create, {len(self.updates)} to update, {len(self.unchanged)} unchanged."
+        )
+        return "\n".join(lines)
+
+
+def build_plan(
+    objects: list["RegistryObject"],
+    current: Mapping[RegistryKey, dict],
+    registry_key: Callable[["RegistryObject"], RegistryKey],
+) -> RegistryPlan:
+    """
+    Compares local objects, in publish order, against the current registry objects.
+
+    Args:
+        objects: The local objects, in publish order.
+        current: The registry objects as returned by the API, keyed like `registry_key`.
+        registry_key: Returns the key of a local object in `current`.
+    """
+    changes = []
+    for object in objects:
+        existing = current.get(registry_key(object))
+        if existing is None:
+            changes.append(RegistryChange("create", object, {}))
+            continue
+        diff = _diff(_normalize_existing(object, existing), normalize(object))
+        changes.append(RegistryChange("update" if diff else "unchanged", object, diff))
+    return RegistryPlan(changes)
+
+
+def normalize(object: "RegistryObject") -> dict:
+    """
+    Dumps an object the way it is sent to the registry, with references to other objects reduced to their names.
+    """
+    dump = object.model_dump(mode="json", exclude_none=True, by_alias=True)
+    if isinstance(object, AttributeGroup):
+        dump["attribute_key"] = {"name": object.attribute_key.name}
+    return dump
+
+
+def _normalize_existing(object: "RegistryObject", existing: dict) -> dict:
+    # validating through the local model drops the fields only the API computes and fills in the same defaults
+    try:
+        return normalize(type(object).model_validate(existing))
+    except ValidationError:
+        return existing
+
+
+def _diff(current: dict, desired: dict) -> dict[str, tuple[Any, Any]]:
+    return {
+        field: (current.get(field), desired.get(field))
+        for field in dict.fromkeys([*desired, *current])
+        if current.get(field) != desired.get(field)
+    }
+
+
+def _describe(object: "RegistryObject") -> str:
+    description = f"{type(object).__name__} '{object.name}'"
+    if isinstance(object, (AttributeGroup, RuleIntervention)):
+        description += f" v{object.version}"
+    return description
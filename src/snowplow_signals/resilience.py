@@ -0,0 +1,204 @@
+import random
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from threading import Lock
+from typing import Literal
+
+from pydantic import BaseModel
+
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class RetryPolicy(BaseModel):
+    """
+    How failed requests to the Signals API are retried.
+
+    Only idempotent requests are retried, on connection errors, timeouts and the `retry_statuses`.
+    Waits grow exponentially with full jitter, unless the API sends a `Retry-After` header, which is honoured.
+    Retries are limited by a budget shared by all requests of a client, so that retries cannot multiply the load on an API that is already struggling.
+    """
+
+    max_attempts: int = 3
+    """The maximum number of attempts per request, including the first one."""
+    initial_backoff: timedelta = timedelta(milliseconds=100)
+    """The upper bound of the wait before the first retry; it doubles on every attempt."""
+    max_backoff: timedelta = timedelta(seconds=10)
+    """The longest wait between attempts. A longer `Retry-After` is not waited for and fails the request instead."""
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    """The response status codes that are retried."""
+    budget_ratio: float = 0.2
+    """The fraction of requests that may be retried, on top of the `budget_capacity` reserve."""
+    budget_capacity: float = 10.0
+    """The maximum number of retries that can be saved up while requests succeed."""
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """
+        Returns how many seconds to wait before retrying the given attempt, or None if the wait would exceed `max_backoff`.
+
+        Args:
+            attempt: The number of the failed attempt, starting at 1.
+            retry_after: The delay in seconds requested by the API's `Retry-After` header, if any.
+        """
+        max_backoff = self.max_backoff.total_seconds()
+        if retry_after is not None:
+            return retry_after if retry_after <= max_backoff else None
+        ceiling = self.initial_backoff.total_seconds() * 2 ** (attempt - 1)
+        return random.uniform(0, min(ceiling, max_backoff))
+
+
+class ReconnectPolicy(BaseModel):
+    """
+    How event streams from the Signals API are reopened after the connection drops.
+
+    Streams reconnect on connection errors, on the `retry_statuses` of `RetryPolicy` and when the server closes the stream.
+    Waits grow exponentially with consecutive failed attempts, with jitter so that clients dropped together do not reconnect together.
+    """
+
+    initial_backoff: timedelta = timedelta(seconds=1)
+    """The wait before the first reconnection, unless the server set another one with the `retry` field of the stream; it doubles on every consecutive failed attempt."""
+    max_backoff: timedelta = timedelta(seconds=30)
+    """The longest wait between attempts."""
+    max_attempts: int | None = None
+    """The number of consecutive failed attempts after which the stream gives up, or None to reconnect indefinitely."""
+
+    def backoff(self, attempt: int, retry: timedelta | None = None) -> float:
+        """
+        Returns how many seconds to wait before the given reconnection attempt.
+
+        Args:
+            attempt: The number of consecutive attempts, starting at 1.
+            retry: The reconnection time sent by the server, if any.
+        """
+        base = (retry if retry is not None else self.initial_backoff).total_seconds()
+        delay = min(base * 2 ** (attempt - 1), self.max_backoff.total_seconds())
+        return random.uniform(delay / 2, delay)
+
+
+class RetryBudget:
+    """
+    A thread-safe token bucket limiting retries to a fraction of the requests sent.
+
+    Every request deposits `ratio` tokens, up to `capacity`, and every retry withdraws one.
+    """
+
+    def __init__(self, ratio: float, capacity: float):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._lock = Lock()
+        self._balance = capacity
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes one retry from the budget.
+
+        Returns:
+            True if the budget allowed the retry.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class CircuitBreakerPolicy(BaseModel):
+    """
+    When requests to an endpoint fail fast instead of reaching the Signals API.
+    """
+
+    failure_threshold: int = 5
+    """The number of consecutive failures that opens the circuit."""
+    reset_timeout: timedelta = timedelta(seconds=30)
+    """How long the circuit stays open before a single trial request is let through."""
+
+
+class CircuitBreaker:
+    """
+    A thread-safe circuit breaker for one endpoint.
+
+    Opens after `failure_threshold` consecutive failures, rejecting requests until `reset_timeout` has passed.
+    It then lets one trial request through, closing again if it succeeds and reopening if it fails.
+    """
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.policy = policy
+        self._clock = clock
+        self._lock = Lock()
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Returns whether a request may be sent now.
+        """
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if (
+                self._state == "open"
+                and self._clock() - self._opened_at
+                >= self.policy.reset_timeout.total_seconds()
+            ):
+                # only the caller that moves the circuit to half open sends the trial request
+                self._state = "half_open"
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+
+    def record_abandoned(self) -> None:
+        """
+        Records a request that ended without an outcome, e.g. because it was cancelled.
+        If it was the trial request, the circuit reopens so that the next request is let through as a new trial.
+        """
+        with self._lock:
+            if self._state == "half_open":
+                self._state = "open"
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == "half_open"
+                or self._failures >= self.policy.failure_threshold
+            ):
+                self._state = "open"
+                self._opened_at = self._clock()
+
+
+def endpoint_group(endpoint: str) -> str:
+    """
+    Returns the part of an endpoint that identifies it independently of the objects it addresses, e.g. `registry/attribute_groups` for `registry/attribute_groups/my_group/versions/1`.
+    """
+    return "/".join(endpoint.strip("/").split("/")[:2])
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a `Retry-After` header given in seconds. HTTP dates are not used by the Signals API and are ignored.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
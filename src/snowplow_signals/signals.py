@@ -1,11 +1,26 @@
+import asyncio
+from collections.abc import Mapping, Sequence
 from datetime import timedelta
-from typing import Any, Literal
+from typing import Any, Literal, Self
 
+import httpx
 import pandas as pd
 
-from .api_client import ApiClient
-from .attributes_client import AttributesClient
-from .interventions_client import InterventionsClient
+from .api_client import (
+    DEFAULT_TIMEOUT_SECONDS,
+    DEFAULT_TOKEN_REFRESH_SKEW,
+    ApiClient,
+    AsyncApiClient,
+)
+from .attributes_cache import AttributesCache
+from .attributes_client import (
+    AsyncAttributesClient,
+    AttributesClient,
+    BatchAttributes,
+)
+from .attributes_frame import DtypeBackend, attribute_types
+from .auth import TokenStore
+from .interventions_client import AsyncInterventionsClient, InterventionsClient
 from .models import (
     AttributeGroup,
     AttributeGroupResponse,
@@ -17,8 +32,16 @@ from .models import (
     Service,
     TestAttributeGroupRequest,
 )
-from .registry_client import RegistryClient
-from .testing_client import TestingClient
+from .registry_cache import RegistryCache
+from .registry_client import (
+    AsyncRegistryClient,
+    RegistryClient,
+    RegistryObject,
+    raise_first_error,
+)
+from .registry_plan import RegistryChange, RegistryPlan
+from .resilience import CircuitBreakerPolicy, RetryPolicy
+from .testing_client import AsyncTestingClient, TestingClient
 
 
 class BaseSignalsWithApiClient:
@@ -28,49 +51,119 @@ class BaseSignalsWithApiClient:
         self,
         *,
         api_client: ApiClient,
+        attributes_cache: AttributesCache | None = None,
+        registry_cache: RegistryCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
     ):
         self.api_client = api_client
 
-        self.interventions = InterventionsClient(api_client=self.api_client)
-        self.registry = RegistryClient(api_client=self.api_client)
-        self.attributes = AttributesClient(api_client=self.api_client)
+        self.interventions = InterventionsClient(
+            api_client=self.api_client, cache=registry_cache
+        )
+        self.registry = RegistryClient(api_client=self.api_client, cache=registry_cache)
+        self.attributes = AttributesClient(
+            api_client=self.api_client,
+            cache=attributes_cache,
+            coalesce_requests=coalesce_requests,
+            serve_stale_on_error=serve_stale_on_error,
+            fast_decode=fast_decode,
+        )
         self.testing = TestingClient(api_client=self.api_client)
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP client and releases its pooled connections.
+        """
+        self.api_client.close()
+
     def publish(
-        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
+        self,
+        objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention],
+        only_changes: bool = False,
     ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
         """
         Creates or updates the provided objects in the Signals registry and publishes them to the compute engines.
 
         Args:
             objects: The list of objects to publish.
+            only_changes: Whether to compare the objects against the registry first, which costs a read per object, or a listing per kind of object with more than `MAX_PLAN_LOOKUPS` of them.
+                Objects that only differ from the registry by their published state are then published together with a single request, and objects already published as defined are not sent.
         Returns:
             The list of updated objects
         """
-        to_update = [
-            object.model_copy(update={"is_published": True}) for object in objects
-        ]
-
-        updated_objects = self.registry.create_or_update(objects=to_update)
-        return updated_objects
+        to_update = _with_published_state(objects, is_published=True)
+        if not only_changes:
+            return self.registry.create_or_update(objects=to_update)
+
+        plan = self.registry.plan(to_update)
+        toggled, plan = _split_published_state_changes(plan)
+        # the toggled objects may reference objects the plan creates, so those go first
+        applied = raise_first_error(self.registry.apply(plan))
+        if toggled:
+            self.registry.publish(toggled)
+        return applied
 
     def unpublish(
-        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
+        self,
+        objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention],
+        only_changes: bool = False,
     ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
         """
         Creates or updates the provided objects in the Signals registry and unpublishes them from the compute engines.
 
         Args:
             objects: The list of objects to unpublish.
+            only_changes: Whether to compare the objects against the registry first, which costs a read per object, or a listing per kind of object with more than `MAX_PLAN_LOOKUPS` of them.
+                Objects that only differ from the registry by their published state are then unpublished together with a single request, and objects already unpublished as defined are not sent.
         Returns:
             The list of unpublished objects
         """
-        to_update = [
-            object.model_copy(update={"is_published": False}) for object in objects
-        ]
+        to_update = _with_published_state(objects, is_published=False)
+        if not only_changes:
+            return self.registry.create_or_update(objects=to_update)
+
+        plan = self.registry.plan(to_update)
+        toggled, plan = _split_published_state_changes(plan)
+        # the toggled objects may reference objects the plan creates, so those go first
+        applied = raise_first_error(self.registry.apply(plan))
+        if toggled:
+            self.registry.unpublish(toggled)
+        return applied
+
+    def plan_publish(
+        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
+    ) -> RegistryPlan:
+        """
+        Plans the publication of the provided objects, comparing them against the current Signals registry without changing it.
+        Print the plan to review what will change, then pass it to `apply`.
 
-        updated_objects = self.registry.create_or_update(objects=to_update)
-        return updated_objects
+        Args:
+            objects: The list of objects to publish.
+        Returns:
+            The plan of objects to create and update.
+        """
+        return self.registry.plan(_with_published_state(objects, is_published=True))
+
+    def apply(
+        self, plan: RegistryPlan
+    ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
+        """
+        Sends only the creates and updates of a plan to the Signals registry, skipping unchanged objects.
+
+        Args:
+            plan: The plan returned by `plan_publish`.
+        Returns:
+            The list of objects, as updated by the registry for the ones that changed.
+        """
+        return raise_first_error(self.registry.apply(plan))
 
     def delete(
         self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
@@ -148,6 +241,84 @@ class BaseSignalsWithApiClient:
             identifier=identifier,
         )
 
+    def get_group_attributes_batch(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves the attributes of an attribute group for many identifiers at once.
+        Identifiers are sent in as few requests as possible, chunked to respect the per-request limit.
+
+        Args:
+            name: The name of the attribute group.
+            version: The version of the attribute group.
+            attributes: The list of attributes to retrieve.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return self.attributes.get_group_attributes_batch(
+            name=name,
+            version=version,
+            attributes=attributes,
+            identifiers=identifiers,
+        )
+
+    def get_service_attributes_batch(
+        self,
+        name: str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves the attributes of a service for many identifiers at once.
+        Identifiers are sent in as few requests as possible, chunked to respect the per-request limit.
+
+        Args:
+            name: The name of the Service.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return self.attributes.get_service_attributes_batch(
+            name=name,
+            identifiers=identifiers,
+        )
+
+    def get_service_attributes_frame(
+        self,
+        name: str,
+        attribute_key: str,
+        identifiers: Sequence[str],
+        dtype_backend: DtypeBackend = "numpy_nullable",
+    ) -> pd.DataFrame:
+        """
+        Retrieves the attributes of a service for many identifiers of one attribute key as a DataFrame, for offline scoring.
+        The column dtypes follow the attribute types declared by the service's attribute groups, which are read from the registry.
+
+        Args:
+            name: The name of the Service.
+            attribute_key: The name of the attribute key the identifiers belong to.
+            identifiers: The identifiers to retrieve attributes for.
+            dtype_backend: 'numpy_nullable' for nullable pandas dtypes, or 'pyarrow' for Arrow-backed dtypes, which requires `pyarrow`.
+        Returns:
+            A DataFrame indexed by identifier, with one column per attribute.
+        """
+        service = self.registry.get_service(name)
+        types = attribute_types(
+            self.registry.get_attribute_group(group.name, group.version)
+            for group in service.attribute_groups
+        )
+        return self.attributes.get_service_attributes_frame(
+            name=name,
+            attribute_key=attribute_key,
+            identifiers=identifiers,
+            attribute_types=types,
+            dtype_backend=dtype_backend,
+        )
+
     def test(
         self,
         attribute_group: AttributeGroup,
@@ -164,11 +335,11 @@ class BaseSignalsWithApiClient:
             app_ids: The list of app ids to extract features for.
             window: The time window to extract features from.
         """
-        request = TestAttributeGroupRequest(
+        request = _build_test_request(
             attribute_group=attribute_group,
             attribute_key_ids=attribute_key_ids,
+            app_ids=app_ids,
             window=window,
-            app_ids=app_ids,  # pyright: ignore[reportArgumentType] AppID is already a string, validation happens at runtime
         )
         return self.testing.test_attribute_group(request=request)
 
@@ -186,16 +357,24 @@ class BaseSignalsWithApiClient:
         """
         return self.interventions.publish(intervention, targets)
 
-    def pull_interventions(self, targets: AttributeKeyIdentifiers):
+    def pull_interventions(
+        self, targets: AttributeKeyIdentifiers, invalidate_attributes_cache=False
+    ):
         """
         Return a subscription for interventions targeting the given Attribute Key targets.
 
         Args:
             targets: Mapping of Attribute Keys to identifiers to receive interventions for.
+            invalidate_attributes_cache: If True, received interventions evict the cached attributes of their target identifier.
         Returns:
             A subscription object that can be started or used as a context manager to receive interventions.
         """
-        return self.interventions.subscribe(targets)
+        subscription = self.interventions.subscribe(targets)
+        if invalidate_attributes_cache and self.attributes.cache is not None:
+            subscription.add_handler(
+                self.attributes.cache.invalidate_intervention_target
+            )
+        return subscription
 
 
 class Signals(BaseSignalsWithApiClient):
@@ -208,6 +387,19 @@ class Signals(BaseSignalsWithApiClient):
         api_key: str,
         api_key_id: str,
         org_id: str,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        attributes_cache: AttributesCache | None = None,
+        registry_cache: RegistryCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        token_store: TokenStore | None = None,
+        token_refresh_skew: timedelta = DEFAULT_TOKEN_REFRESH_SKEW,
     ):
         super().__init__(
             api_client=ApiClient(
@@ -216,7 +408,20 @@ class Signals(BaseSignalsWithApiClient):
                 api_key_id=api_key_id,
                 org_id=org_id,
                 auth_mode="bdp",
-            )
+                limits=limits,
+                http2=http2,
+                timeout=timeout,
+                endpoint_timeouts=endpoint_timeouts,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker,
+                token_store=token_store,
+                token_refresh_skew=token_refresh_skew,
+            ),
+            attributes_cache=attributes_cache,
+            registry_cache=registry_cache,
+            coalesce_requests=coalesce_requests,
+            serve_stale_on_error=serve_stale_on_error,
+            fast_decode=fast_decode,
         )
 
 
@@ -228,9 +433,498 @@ class SignalsSandbox(BaseSignalsWithApiClient):
         *,
         api_url: str,
         sandbox_token: str,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        attributes_cache: AttributesCache | None = None,
+        registry_cache: RegistryCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
     ):
         super().__init__(
             api_client=ApiClient(
-                api_url=api_url, auth_mode="sandbox", sandbox_token=sandbox_token
+                api_url=api_url,
+                auth_mode="sandbox",
+                sandbox_token=sandbox_token,
+                limits=limits,
+                http2=http2,
+                timeout=timeout,
+                endpoint_timeouts=endpoint_timeouts,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker,
+            ),
+            attributes_cache=attributes_cache,
+            registry_cache=registry_cache,
+            coalesce_requests=coalesce_requests,
+            serve_stale_on_error=serve_stale_on_error,
+            fast_decode=fast_decode,
+        )
+
+
+class AsyncBaseSignalsWithApiClient:
+    """Internal base class for asyncio Signals clients that use an AsyncApiClient"""
+
+    def __init__(
+        self,
+        *,
+        api_client: AsyncApiClient,
+        attributes_cache: AttributesCache | None = None,
+        registry_cache: RegistryCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+    ):
+        self.api_client = api_client
+
+        self.interventions = AsyncInterventionsClient(
+            api_client=self.api_client, cache=registry_cache
+        )
+        self.registry = AsyncRegistryClient(
+            api_client=self.api_client, cache=registry_cache
+        )
+        self.attributes = AsyncAttributesClient(
+            api_client=self.api_client,
+            cache=attributes_cache,
+            coalesce_requests=coalesce_requests,
+            serve_stale_on_error=serve_stale_on_error,
+            fast_decode=fast_decode,
+        )
+        self.testing = AsyncTestingClient(api_client=self.api_client)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP client and releases its pooled connections.
+        """
+        await self.api_client.aclose()
+
+    async def publish(
+        self,
+        objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention],
+        only_changes: bool = False,
+    ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
+        """
+        Creates or updates the provided objects in the Signals registry and publishes them to the compute engines.
+
+        Args:
+            objects: The list of objects to publish.
+            only_changes: Whether to compare the objects against the registry first, which costs a read per object, or a listing per kind of object with more than `MAX_PLAN_LOOKUPS` of them.
+                Objects that only differ from the registry by their published state are then published together with a single request, and objects already published as defined are not sent.
+        Returns:
+            The list of updated objects
+        """
+        to_update = _with_published_state(objects, is_published=True)
+        if not only_changes:
+            return await self.registry.create_or_update(objects=to_update)
+
+        plan = await self.registry.plan(to_update)
+        toggled, plan = _split_published_state_changes(plan)
+        # the toggled objects may reference objects the plan creates, so those go first
+        applied = raise_first_error(await self.registry.apply(plan))
+        if toggled:
+            await self.registry.publish(toggled)
+        return applied
+
+    async def unpublish(
+        self,
+        objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention],
+        only_changes: bool = False,
+    ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
+        """
+        Creates or updates the provided objects in the Signals registry and unpublishes them from the compute engines.
+
+        Args:
+            objects: The list of objects to unpublish.
+            only_changes: Whether to compare the objects against the registry first, which costs a read per object, or a listing per kind of object with more than `MAX_PLAN_LOOKUPS` of them.
+                Objects that only differ from the registry by their published state are then unpublished together with a single request, and objects already unpublished as defined are not sent.
+        Returns:
+            The list of unpublished objects
+        """
+        to_update = _with_published_state(objects, is_published=False)
+        if not only_changes:
+            return await self.registry.create_or_update(objects=to_update)
+
+        plan = await self.registry.plan(to_update)
+        toggled, plan = _split_published_state_changes(plan)
+        # the toggled objects may reference objects the plan creates, so those go first
+        applied = raise_first_error(await self.registry.apply(plan))
+        if toggled:
+            await self.registry.unpublish(toggled)
+        return applied
+
+    async def plan_publish(
+        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
+    ) -> RegistryPlan:
+        """
+        Plans the publication of the provided objects, comparing them against the current Signals registry without changing it.
+        Print the plan to review what will change, then pass it to `apply`.
+
+        Args:
+            objects: The list of objects to publish.
+        Returns:
+            The plan of objects to create and update.
+        """
+        return await self.registry.plan(
+            _with_published_state(objects, is_published=True)
+        )
+
+    async def apply(
+        self, plan: RegistryPlan
+    ) -> list[AttributeGroup | Service | AttributeKey | RuleIntervention]:
+        """
+        Sends only the creates and updates of a plan to the Signals registry, skipping unchanged objects.
+
+        Args:
+            plan: The plan returned by `plan_publish`.
+        Returns:
+            The list of objects, as updated by the registry for the ones that changed.
+        """
+        return raise_first_error(await self.registry.apply(plan))
+
+    async def delete(
+        self, objects: list[AttributeGroup | Service | AttributeKey | RuleIntervention]
+    ) -> None:
+        """
+        Deletes the provided objects from the Signals registry.
+        Make sure to unpublish the objects first.
+
+        Args:
+            objects: The list of objects to delete.
+        """
+        await self.registry.delete(objects=objects)
+
+    async def get_attribute_group(
+        self, name: str, version: int | None = None
+    ) -> AttributeGroupResponse:
+        """
+        Returns an Attribute Group from the Signals registry by name.
+        If no version is provided, returns the latest one.
+
+        Args:
+            name: The name of the Attribute Group.
+            version: The version of the Attribute Group.
+        Returns:
+            The Attribute Group
+        """
+        return await self.registry.get_attribute_group(name, version)
+
+    async def get_group_attributes(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        attribute_key: str,
+        identifier: str,
+    ) -> dict[str, Any]:
+        """
+        Retrieves the attributes for a given attribute group by name and version.
+
+        Args:
+            name: The name of the attribute group.
+            version: The version of the attribute group.
+            attribute_key: The attribute_key name to retrieve attributes for.
+            identifier: The attribute key identifier to retrieve attributes for.
+            attributes: The list of attributes to retrieve.
+        """
+        return await self.attributes.get_group_attributes(
+            name=name,
+            version=version,
+            attributes=attributes,
+            attribute_key=attribute_key,
+            identifier=identifier,
+        )
+
+    async def get_service_attributes(
+        self,
+        name: str,
+        attribute_key: str,
+        identifier: str,
+    ) -> dict[str, Any]:
+        """
+        Retrieves the attributes for a given service by name.
+
+        Args:
+            name: The name of the Service.
+            attribute_key: The attribute_key to retrieve attributes for.
+            identifier: The attribute key identifier to retrieve attributes for.
+        """
+        return await self.attributes.get_service_attributes(
+            name=name,
+            attribute_key=attribute_key,
+            identifier=identifier,
+        )
+
+    async def get_group_attributes_batch(
+        self,
+        name: str,
+        version: int,
+        attributes: list[str] | str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves the attributes of an attribute group for many identifiers at once.
+        Identifiers are sent in as few requests as possible, chunked to respect the per-request limit.
+
+        Args:
+            name: The name of the attribute group.
+            version: The version of the attribute group.
+            attributes: The list of attributes to retrieve.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return await self.attributes.get_group_attributes_batch(
+            name=name,
+            version=version,
+            attributes=attributes,
+            identifiers=identifiers,
+        )
+
+    async def get_service_attributes_batch(
+        self,
+        name: str,
+        identifiers: Mapping[str, Sequence[str]],
+    ) -> BatchAttributes:
+        """
+        Retrieves the attributes of a service for many identifiers at once.
+        Identifiers are sent in as few requests as possible, chunked to respect the per-request limit.
+
+        Args:
+            name: The name of the Service.
+            identifiers: Mapping of attribute key names to the identifiers to retrieve attributes for.
+        Returns:
+            The attributes keyed by attribute key name, then by identifier.
+        """
+        return await self.attributes.get_service_attributes_batch(
+            name=name,
+            identifiers=identifiers,
+        )
+
+    async def get_service_attributes_frame(
+        self,
+        name: str,
+        attribute_key: str,
+        identifiers: Sequence[str],
+        dtype_backend: DtypeBackend = "numpy_nullable",
+    ) -> pd.DataFrame:
+        """
+        Retrieves the attributes of a service for many identifiers of one attribute key as a DataFrame, for offline scoring.
+        The column dtypes follow the attribute types declared by the service's attribute groups, which are read from the registry.
+
+        Args:
+            name: The name of the Service.
+            attribute_key: The name of the attribute key the identifiers belong to.
+            identifiers: The identifiers to retrieve attributes for.
+            dtype_backend: 'numpy_nullable' for nullable pandas dtypes, or 'pyarrow' for Arrow-backed dtypes, which requires `pyarrow`.
+        Returns:
+            A DataFrame indexed by identifier, with one column per attribute.
+        """
+        service = await self.registry.get_service(name)
+        attribute_groups = await asyncio.gather(
+            *(
+                self.registry.get_attribute_group(group.name, group.version)
+                for group in service.attribute_groups
             )
         )
+        return await self.attributes.get_service_attributes_frame(
+            name=name,
+            attribute_key=attribute_key,
+            identifiers=identifiers,
+            attribute_types=attribute_types(attribute_groups),
+            dtype_backend=dtype_backend,
+        )
+
+    async def test(
+        self,
+        attribute_group: AttributeGroup,
+        attribute_key_ids: list[AttributeKeyId] = [],
+        app_ids: list[str] = [],
+        window: timedelta = timedelta(hours=1),
+    ) -> pd.DataFrame:
+        """
+        Tests the attribute group by extracting the features from the latest window of events in the atomic events table in warehouse.
+
+        Args:
+            attribute_group: The attribute group to test.
+            attribute_key_ids: The list of attribute key ids (e.g., domain_userid values) to extract features for. If empty, random 10 IDs will be used.
+            app_ids: The list of app ids to extract features for.
+            window: The time window to extract features from.
+        """
+        request = _build_test_request(
+            attribute_group=attribute_group,
+            attribute_key_ids=attribute_key_ids,
+            app_ids=app_ids,
+            window=window,
+        )
+        return await self.testing.test_attribute_group(request=request)
+
+    async def push_intervention(
+        self, targets: AttributeKeyIdentifiers, intervention: InterventionInstance
+    ):
+        """
+        Publish the given intervention to any active subscribers for the given lists of Attribute Keys.
+
+        Args:
+            targets: Mapping of Attribute Keys to identifiers to send the intervention to.
+            intervention: The intervention payload to publish to the target subscribers.
+        Returns:
+            Status detailing if the intervention was received by any subscribers.
+        """
+        return await self.interventions.publish(intervention, targets)
+
+    def pull_interventions(
+        self, targets: AttributeKeyIdentifiers, invalidate_attributes_cache=False
+    ):
+        """
+        Return an asyncio subscription for interventions targeting the given Attribute Key targets.
+
+        Args:
+            targets: Mapping of Attribute Keys to identifiers to receive interventions for.
+            invalidate_attributes_cache: If True, received interventions evict the cached attributes of their target identifier.
+        Returns:
+            A subscription object that can be started or used as an async context manager and async iterator to receive interventions.
+        """
+        subscription = self.interventions.subscribe(targets)
+        if invalidate_attributes_cache and self.attributes.cache is not None:
+            subscription.add_handler(
+                self.attributes.cache.invalidate_intervention_target
+            )
+        return subscription
+
+
+class AsyncSignals(AsyncBaseSignalsWithApiClient):
+    """Asyncio interface to interact with Snowplow Signals AI"""
+
+    def __init__(
+        self,
+        *,
+        api_url: str,
+        api_key: str,
+        api_key_id: str,
+        org_id: str,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        attributes_cache: AttributesCache | None = None,
+        registry_cache: RegistryCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+        token_store: TokenStore | None = None,
+        token_refresh_skew: timedelta = DEFAULT_TOKEN_REFRESH_SKEW,
+    ):
+        super().__init__(
+            api_client=AsyncApiClient(
+                api_url=api_url,
+                api_key=api_key,
+                api_key_id=api_key_id,
+                org_id=org_id,
+                auth_mode="bdp",
+                limits=limits,
+                http2=http2,
+                timeout=timeout,
+                endpoint_timeouts=endpoint_timeouts,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker,
+                token_store=token_store,
+                token_refresh_skew=token_refresh_skew,
+            ),
+            attributes_cache=attributes_cache,
+            registry_cache=registry_cache,
+            coalesce_requests=coalesce_requests,
+            serve_stale_on_error=serve_stale_on_error,
+            fast_decode=fast_decode,
+        )
+
+
+class AsyncSignalsSandbox(AsyncBaseSignalsWithApiClient):
+    """Asyncio interface to interact with Snowplow Signals AI in SANDBOX mode"""
+
+    def __init__(
+        self,
+        *,
+        api_url: str,
+        sandbox_token: str,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        attributes_cache: AttributesCache | None = None,
+        registry_cache: RegistryCache | None = None,
+        coalesce_requests: bool = False,
+        serve_stale_on_error: bool = False,
+        fast_decode: bool = False,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT_SECONDS,
+        endpoint_timeouts: Mapping[str, float | httpx.Timeout] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreakerPolicy | None = None,
+    ):
+        super().__init__(
+            api_client=AsyncApiClient(
+                api_url=api_url,
+                auth_mode="sandbox",
+                sandbox_token=sandbox_token,
+                limits=limits,
+                http2=http2,
+                timeout=timeout,
+                endpoint_timeouts=endpoint_timeouts,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker,
+            ),
+            attributes_cache=attributes_cache,
+            registry_cache=registry_cache,
+            coalesce_requests=coalesce_requests,
+            serve_stale_on_error=serve_stale_on_error,
+            fast_decode=fast_decode,
+        )
+
+
+def _with_published_state(
+    objects: list[RegistryObject], is_published: bool
+) -> list[RegistryObject]:
+    return [
+        object.model_copy(update={"is_published": is_published}) for object in objects
+    ]
+
+
+def _split_published_state_changes(
+    plan: RegistryPlan,
+) -> tuple[list[RegistryObject], RegistryPlan]:
+    """
+    Separates the existing objects whose only change is their published state, which can be flipped by reference, from the rest of the plan.
+
+    Returns:
+        The objects to flip, and the plan with them marked as unchanged.
+    """
+    toggled: list[RegistryObject] = []
+    changes: list[RegistryChange] = []
+    for change in plan.changes:
+        if change.action == "update" and change.changes.keys() == {"is_published"}:
+            toggled.append(change.object)
+            change = RegistryChange("unchanged", change.object, {})
+        changes.append(change)
+    return toggled, RegistryPlan(changes)
+
+
+def _build_test_request(
+    attribute_group: AttributeGroup,
+    attribute_key_ids: list[AttributeKeyId],
+    app_ids: list[str],
+    window: timedelta,
+) -> TestAttributeGroupRequest:
+    return TestAttributeGroupRequest(
+        attribute_group=attribute_group,
+        attribute_key_ids=attribute_key_ids,
+        window=window,
+        app_ids=app_ids,  # pyright: ignore[reportArgumentType] AppID is already a string, validation happens at runtime
+    )
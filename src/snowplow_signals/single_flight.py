@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent calls with the same key across threads: the first caller runs the function and the others wait for and share its result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[K, Future[V]] = {}
+        self.coalesced = 0
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        """
+        Runs `fn`, unless a call with the same key is already in flight, in which case waits for that call instead.
+
+        Args:
+            key: The key identifying identical calls.
+            fn: The function to run if no identical call is in flight.
+        Returns:
+            The result of the in-flight call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key)
+            call.set_exception(e)
+            raise
+        self._forget(key)
+        call.set_result(result)
+        return result
+
+    def _forget(self, key: K) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight(Generic[K, V]):
+    """
+    Asyncio counterpart of `SingleFlight`, coalescing concurrent calls with the same key on one event loop.
+    The shared call runs in its own task, so cancelling one waiter does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Future[V]] = {}
+        self.coalesced = 0
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """
+        Awaits `fn`, unless a call with the same key is already in flight, in which case awaits that call instead.
+
+        Args:
+            key: The key identifying identical calls.
+            fn: The coroutine function to run if no identical call is in flight.
+        Returns:
+            The result of the in-flight call.
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+        else:
+            call = self._calls[key] = asyncio.ensure_future(fn())
+            call.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(call)
+
+    def _forget(self, key: K, call: asyncio.Future[V]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
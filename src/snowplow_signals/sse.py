@@ -0,0 +1,382 @@
+import asyncio
+import socket
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import aclosing, closing
+from datetime import timedelta
+from threading import Event
+from typing import NamedTuple
+
+import httpx
+from pydantic import BaseModel
+
+from .api_client import ApiClient, AsyncApiClient, SignalsAPIError, _is_unavailable
+from .cli_logging import get_logger
+from .metrics import Histogram, HistogramSnapshot
+from .resilience import ReconnectPolicy
+
+logger = get_logger(__name__)
+
+DEFAULT_RECONNECT_POLICY = ReconnectPolicy()
+
+DISCONNECTED_MS_BOUNDS = (10, 100, 500, 1000, 5000, 10_000, 30_000, 60_000, 300_000)
+
+
+class ServerSentEvent(NamedTuple):
+    data: str
+    """The data lines of the event, joined by newlines."""
+    event: str = "message"
+    """The event type."""
+    id: str | None = None
+    """The last event ID the server sent on the stream, if any."""
+
+
+class SSEDecoder:
+    """
+    Decodes the lines of a `text/event-stream` response into events, following the WHATWG server-sent events specification.
+
+    The last event ID and the reconnection time persist across connections, so that a reconnected stream can resume from them.
+    """
+
+    def __init__(self) -> None:
+        self.last_event_id = ""
+        self.retry: timedelta | None = None
+        self._data: list[str] = []
+        self._event = ""
+
+    def decode(self, line: str) -> ServerSentEvent | None:
+        """
+        Processes one line of the stream.
+
+        Returns:
+            The dispatched event if the line completes one, else None.
+        """
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self.retry = timedelta(milliseconds=int(value))
+        return None
+
+    def reset(self) -> None:
+        """
+        Discards an incomplete event, as when the connection drops in the middle of it.
+        """
+        self._data = []
+        self._event = ""
+
+    def _dispatch(self) -> ServerSentEvent | None:
+        data, event = self._data, self._event
+        self.reset()
+        if not data:
+            return None
+        return ServerSentEvent(
+            data="\n".join(data),
+            event=event or "message",
+            id=self.last_event_id or None,
+        )
+
+
+class EventStreamStats(BaseModel):
+    connections: int
+    """The connections that received at least one line."""
+    reconnects: int
+    """The reconnection attempts after the stream dropped."""
+    gaps: int
+    """The reconnections without an event ID to resume from, across which events may have been lost."""
+    idle_reopens: int
+    """The connections reopened after receiving nothing for the read timeout, which count neither as new connections nor as reconnects."""
+    disconnected_ms: HistogramSnapshot
+    """The time from the stream dropping to receiving the first line of the next connection."""
+
+
+class _BaseEventStream:
+    def __init__(
+        self,
+        endpoint: str,
+        params: Mapping[str, str | list[str]] | None,
+        headers: dict[str, str] | None,
+        reconnect_policy: ReconnectPolicy | None,
+        clock: Callable[[], float],
+    ) -> None:
+        self.endpoint = endpoint
+        self.params = params
+        """The query parameters, read on every connection, so that a change takes effect on the next reconnection."""
+        self.headers = headers or {}
+        self.reconnect_policy = reconnect_policy
+        self.decoder = SSEDecoder()
+        self.connected = False
+        """Whether the stream is connected, rather than waiting to reconnect."""
+        self._received = False
+        self._idle_reopen = False
+        self._clock = clock
+        self._connections = 0
+        self._reconnects = 0
+        self._gaps = 0
+        self._idle_reopens = 0
+        self._attempt = 0
+        self._disconnected_at: float | None = None
+        self._disconnected_ms = Histogram(DISCONNECTED_MS_BOUNDS)
+
+    def stats(self) -> EventStreamStats:
+        return EventStreamStats(
+            connections=self._connections,
+            reconnects=self._reconnects,
+            gaps=self._gaps,
+            idle_reopens=self._idle_reopens,
+            disconnected_ms=self._disconnected_ms.snapshot(),
+        )
+
+    def _request_headers(self) -> dict[str, str]:
+        headers = {"Accept": "text/event-stream", **self.headers}
+        if self.decoder.last_event_id:
+            headers["Last-Event-ID"] = self.decoder.last_event_id
+        return headers
+
+    def _on_connect(self) -> None:
+        self.connected = True
+        # a connection reopened while idle continues the previous one
+        if not self._idle_reopen:
+            self._received = False
+        self._idle_reopen = False
+
+    def _on_idle(self) -> None:
+        self.decoder.reset()
+        self._idle_reopens += 1
+        self._idle_reopen = True
+
+    def _on_line(self, line: str) -> ServerSentEvent | None:
+        if not self._received:
+            # only a connection that delivers something counts as established
+            self._received = True
+            self._connections += 1
+            self._attempt = 0
+            if self._disconnected_at is not None:
+                self._disconnected_ms.observe(
+                    (self._clock() - self._disconnected_at) * 1000
+                )
+                self._disconnected_at = None
+        return self.decoder.decode(line)
+
+    def _on_disconnect(self, error: Exception | None) -> float | None:
+        """
+        Records a dropped connection.
+
+        Returns:
+            How many seconds to wait before reconnecting, or None if the stream gives up.
+        """
+        self.connected = False
+        self.decoder.reset()
+        if error is not None and not _is_unavailable(error):
+            raise error
+        if self.reconnect_policy is None:
+            if error is not None:
+                raise error
+            return None
+
+        if self._disconnected_at is None:
+            self._disconnected_at = self._clock()
+        self._attempt += 1
+        max_attempts = self.reconnect_policy.max_attempts
+        if max_attempts is not None and self._attempt > max_attempts:
+            logger.warning(
+                f"Giving up on the {self.endpoint} stream after {max_attempts} attempts"
+            )
+            if error is not None:
+                raise error
+            return None
+
+        delay = self.reconnect_policy.backoff(self._attempt, self.decoder.retry)
+        logger.info(
+            f"The {self.endpoint} stream dropped"
+            + (f" ({error})" if error is not None else "")
+            + f", reconnecting in {delay:.2f}s"
+        )
+        return delay
+
+    def _on_reconnect(self) -> None:
+        self._reconnects += 1
+        if not self.decoder.last_event_id:
+            self._gaps += 1
+
+
+class EventStream(_BaseEventStream):
+    """
+    A server-sent event stream from the Signals API that reconnects automatically when the connection drops.
+
+    On reconnection it sends the `Last-Event-ID` header, so that a server supporting it resumes after the last received event.
+    Without an event ID to resume from, events sent while disconnected are lost; such reconnections are counted as gaps in `stats()`.
+    The same stream can be iterated again after it stopped, resuming from the last event ID.
+    """
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        endpoint: str,
+        params: Mapping[str, str | list[str]] | None = None,
+        headers: dict[str, str] | None = None,
+        reconnect_policy: ReconnectPolicy | None = DEFAULT_RECONNECT_POLICY,
+        read_timeout: timedelta | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            api_client: The client opening the connections.
+            endpoint: The endpoint, relative to `/api/v1/`.
+            params: Query parameters.
+            headers: Additional request headers.
+            reconnect_policy: How the stream is reopened after the connection drops, or None to end the stream instead.
+            read_timeout: If set, the connection is reopened at once after receiving nothing for this long, giving `events` a chance to stop.
+            clock: Monotonic clock in seconds, for testing.
+        """
+        super().__init__(endpoint, params, headers, reconnect_policy, clock)
+        self.api_client = api_client
+        self.read_timeout = read_timeout
+        self._response: httpx.Response | None = None
+
+    def events(self, closed: Event | None = None) -> Iterator[ServerSentEvent]:
+        """
+        Yields the events of the stream, reconnecting whenever the connection drops.
+
+        Args:
+            closed: Ends the iteration once set, after the next received line, or at once while waiting to reconnect or after calling `interrupt()`.
+        """
+        closed = closed or Event()
+
+        def opened(response: httpx.Response) -> None:
+            self._response = response
+            # an interruption that came before the response opened could not abort it
+            if closed.is_set():
+                _abort(response)
+
+        try:
+            while True:
+                # marked as connected before checking `closed`, so that a concurrent close either sees it connected or stops it here
+                self._on_connect()
+                if closed.is_set():
+                    return
+                idle = False
+                error: Exception | None = None
+                lines = self.api_client.make_stream_request(
+                    method="GET",
+                    endpoint=self.endpoint,
+                    params=self.params,
+                    headers=self._request_headers(),
+                    read_timeout=(
+                        self.read_timeout.total_seconds()
+                        if self.read_timeout is not None
+                        else None
+                    ),
+                    on_response=opened,
+                )
+                try:
+                    with closing(lines):
+                        for line in lines:
+                            if closed.is_set():
+                                return
+                            if line is None:
+                                idle = True
+                                continue
+                            event = self._on_line(line)
+                            if event is not None:
+                                yield event
+                except (SignalsAPIError, httpx.TransportError, httpx.StreamError) as e:
+                    if closed.is_set():
+                        # aborted by `interrupt()`
+                        return
+                    error = e
+                finally:
+                    self._response = None
+
+                if idle and error is None:
+                    # nothing was received for `read_timeout`, which is not a failure
+                    self._on_idle()
+                    continue
+                delay = self._on_disconnect(error)
+                if delay is None or closed.wait(delay):
+                    return
+                self._on_reconnect()
+        finally:
+            self.connected = False
+
+    def interrupt(self) -> None:
+        """
+        Aborts the open connection from another thread, so that an iteration of `events` waiting for the next line checks its `closed` event at once.
+        """
+        response = self._response
+        if response is not None:
+            _abort(response)
+
+
+class AsyncEventStream(_BaseEventStream):
+    """
+    Asyncio counterpart of `EventStream`. Cancelling the consuming task closes the connection.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncApiClient,
+        endpoint: str,
+        params: Mapping[str, str | list[str]] | None = None,
+        headers: dict[str, str] | None = None,
+        reconnect_policy: ReconnectPolicy | None = DEFAULT_RECONNECT_POLICY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(endpoint, params, headers, reconnect_policy, clock)
+        self.api_client = api_client
+
+    async def events(self) -> AsyncIterator[ServerSentEvent]:
+        """
+        Yields the events of the stream, reconnecting whenever the connection drops.
+        """
+        try:
+            while True:
+                error: Exception | None = None
+                self._on_connect()
+                lines = self.api_client.make_stream_request(
+                    method="GET",
+                    endpoint=self.endpoint,
+                    params=self.params,
+                    headers=self._request_headers(),
+                )
+                try:
+                    async with aclosing(lines):
+                        async for line in lines:
+                            event = self._on_line(line)
+                            if event is not None:
+                                yield event
+                except (SignalsAPIError, httpx.TransportError) as e:
+                    error = e
+
+                delay = self._on_disconnect(error)
+                if delay is None:
+                    return
+                await asyncio.sleep(delay)
+                self._on_reconnect()
+        finally:
+            self.connected = False
+
+
+def _abort(response: httpx.Response) -> None:
+    # shutting the socket down wakes a read blocked on it in another thread, which closing it may not
+    network_stream = response.extensions.get("network_stream")
+    sock = network_stream.get_extra_info("socket") if network_stream else None
+    if sock is None:
+        response.close()
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
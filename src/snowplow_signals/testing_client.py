@@ -1,6 +1,6 @@
 import pandas as pd
 
-from .api_client import ApiClient
+from .api_client import ApiClient, AsyncApiClient
 from .models import (
     TestAttributeGroupRequest,
 )
@@ -14,10 +14,34 @@ class TestingClient:
         data = self.api_client.make_request(
             method="POST",
             endpoint="testing/attribute_groups/",
-            data=request.model_dump(
-                mode="json",
-                exclude_none=True,
-            ),
+            data=_model_dump(request),
         )
 
         return pd.DataFrame(data)
+
+
+class AsyncTestingClient:
+    """
+    Asyncio counterpart of `TestingClient`.
+    """
+
+    def __init__(self, api_client: AsyncApiClient):
+        self.api_client = api_client
+
+    async def test_attribute_group(
+        self, request: TestAttributeGroupRequest
+    ) -> pd.DataFrame:
+        data = await self.api_client.make_request(
+            method="POST",
+            endpoint="testing/attribute_groups/",
+            data=_model_dump(request),
+        )
+
+        return pd.DataFrame(data)
+
+
+def _model_dump(request: TestAttributeGroupRequest) -> dict:
+    return request.model_dump(
+        mode="json",
+        exclude_none=True,
+    )
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+import jwt
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import FileTokenStore
+from snowplow_signals.api_client import ApiClient, AsyncApiClient
+
+from ..utils import MOCK_ORG_ID, utc_timestamp
+
+TOKEN_URL = f"https://console.snowplowanalytics.com/api/msc/v1/organizations/{MOCK_ORG_ID}/credentials/v3/token"
+INTERVENTIONS_URL = "http://localhost:8000/api/v1/registry/interventions/"
+
+
+def _token(expires_in: int, claim: str = "foo") -> str:
+    return jwt.encode(
+        {"exp": utc_timestamp() + expires_in, "claim": claim},
+        "secret",
+    )
+
+
+def _api_client(**kwargs) -> ApiClient:
+    return ApiClient(
+        api_url="http://localhost:8000",
+        api_key="foo",
+        api_key_id="bar",
+        org_id=MOCK_ORG_ID,
+        **kwargs,
+    )
+
+
+@pytest.mark.noauthmock
+class TestTokenRefresh:
+    def test_concurrent_requests_fetch_one_token(self, respx_mock: MockRouter):
+        def slow_token(request):
+            time.sleep(0.05)
+            return httpx.Response(200, json={"accessToken": _token(3600)})
+
+        token_request = respx_mock.get(TOKEN_URL).mock(side_effect=slow_token)
+        respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        api_client = _api_client()
+
+        threads = [
+            threading.Thread(
+                target=api_client.make_request, args=("GET", "registry/interventions/")
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert token_request.call_count == 1
+
+    def test_token_near_expiry_is_refreshed_in_background(self, respx_mock: MockRouter):
+        first_token = _token(3600, claim="first")
+        second_token = _token(3600, claim="second")
+        token_request = respx_mock.get(TOKEN_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"accessToken": first_token}),
+                httpx.Response(200, json={"accessToken": second_token}),
+            ]
+        )
+        interventions_request = respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        api_client = _api_client(token_refresh_skew=timedelta(hours=2))
+        api_client.make_request("GET", "registry/interventions/")
+        # Half the token's lifetime has not passed yet
+        assert not api_client._should_refresh()
+
+        api_client._token_refresh_skew = 7200
+        api_client.make_request("GET", "registry/interventions/")
+
+        # The request still used the valid token while the refresh ran
+        assert (
+            interventions_request.calls[1].request.headers["Authorization"]
+            == f"Bearer {first_token}"
+        )
+        deadline = time.monotonic() + 5
+        while api_client.token != second_token and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert token_request.call_count == 2
+        assert api_client.token == second_token
+
+    def test_file_token_store_is_shared_between_clients(
+        self, respx_mock: MockRouter, tmp_path: Path
+    ):
+        token_request = respx_mock.get(TOKEN_URL).mock(
+            return_value=httpx.Response(200, json={"accessToken": _token(3600)})
+        )
+        respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        token_path = tmp_path / "signals" / "token"
+
+        first_client = _api_client(token_store=FileTokenStore(token_path))
+        second_client = _api_client(token_store=FileTokenStore(token_path))
+        first_client.make_request("GET", "registry/interventions/")
+        second_client.make_request("GET", "registry/interventions/")
+
+        assert token_request.call_count == 1
+        assert second_client.token == first_client.token == token_path.read_text()
+
+    def test_async_concurrent_requests_fetch_one_token(self, respx_mock: MockRouter):
+        token_request = respx_mock.get(TOKEN_URL).mock(
+            return_value=httpx.Response(200, json={"accessToken": _token(3600)})
+        )
+        respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        async def run():
+            async with AsyncApiClient(
+                api_url="http://localhost:8000",
+                api_key="foo",
+                api_key_id="bar",
+                org_id=MOCK_ORG_ID,
+            ) as api_client:
+                await asyncio.gather(
+                    *(
+                        api_client.make_request("GET", "registry/interventions/")
+                        for _ in range(8)
+                    )
+                )
+
+        asyncio.run(run())
+
+        assert token_request.call_count == 1
@@ -456,6 +456,24 @@ class TestBaseConfigGenerator:
         base_config_generator.add_to_properties({"a": "b"})
         assert base_config_generator.properties == [{"a": "b"}]
 
+    def test_resolve_property_name_collisions_across_calls(
+        self, base_config_generator: BaseConfigGenerator
+    ):
+        """Test that properties added after a resolution get names unused by the resolved ones"""
+        base_config_generator.add_to_properties({"a.x": "x"})
+        base_config_generator.add_to_properties({"b.x": "x"})
+        base_config_generator.resolve_property_name_collisions()
+        base_config_generator.add_to_properties({"x_2": "x_2"})
+        base_config_generator.add_to_properties({"b.x": "x"})
+        base_config_generator.add_to_properties({"b.x": "x_2"})
+        base_config_generator.resolve_property_name_collisions()
+        assert base_config_generator.properties == [
+            {"a.x": "x"},
+            {"b.x": "x_2"},
+            {"x_2": "x_2_2"},
+            {"b.x": "x_3"},
+        ]
+
     #
     def test_get_filter_condition_name_component_mixed_operators(
         self, base_config_generator: BaseConfigGenerator
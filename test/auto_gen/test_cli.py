@@ -245,7 +245,12 @@ def test_cli_generate_models_succeeds(
 
     assert exc_info.value.code == 0
     cast(MagicMock, mock_dbt_client.generate_models).assert_called_once_with(
-        repo_path=str(test_repo_dir), project_name=None, update=False
+        repo_path=str(test_repo_dir),
+        project_name=None,
+        update=False,
+        workers=1,
+        check=False,
+        compiled_templates_path=None,
     )
 
 
@@ -274,7 +279,12 @@ def test_cli_generate_models_with_update_succeeds(
 
     assert exc_info.value.code == 0
     cast(MagicMock, mock_dbt_client.generate_models).assert_called_once_with(
-        repo_path=str(test_repo_dir), project_name=None, update=True
+        repo_path=str(test_repo_dir),
+        project_name=None,
+        update=True,
+        workers=1,
+        check=False,
+        compiled_templates_path=None,
     )
 
 
@@ -425,3 +435,37 @@ def test_validate_repo_path_fails_with_file(test_repo_dir: Path) -> None:
 
     # Clean up
     test_file.unlink()
+
+
+def test_cli_generate_models_with_workers_succeeds(
+    test_repo_dir: Path,
+    mock_dbt_client: BatchAutogenClient,
+    api_params: List[str],
+    target_type: str,
+) -> None:
+    """
+    Test generation of all projects in a pool of worker processes.
+
+    Args:
+        test_repo_dir: Path to test repository directory
+        mock_dbt_client: Mocked BatchAutogenClient
+        api_params: API-related command line arguments
+    """
+    cast(MagicMock, mock_dbt_client.generate_models).return_value = True
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(
+            ["generate", "--repo-path", str(test_repo_dir), "--workers", "4"]
+            + api_params
+            + ["--target-type", target_type]
+        )
+
+    assert exc_info.value.code == 0
+    cast(MagicMock, mock_dbt_client.generate_models).assert_called_once_with(
+        repo_path=str(test_repo_dir),
+        project_name=None,
+        update=False,
+        workers=4,
+        check=False,
+        compiled_templates_path=None,
+    )
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from snowplow_signals.batch_autogen.models.dbt_asset_generator import (
+    TEMPLATE_PATH,
+    DbtAssetGenerator,
+    compile_templates,
+)
+
+"""Tests for the DbtAssetGenerator class"""
+
+
+def generate(project_path: Path, **kwargs) -> str:
+    generator = DbtAssetGenerator(
+        project_path=project_path,
+        asset_subpath="",
+        filename="dbt_project",
+        asset_type="yml",
+        **kwargs,
+    )
+    generator.generate_asset(update=False, context={})
+    return generator.get_filepath().read_text()
+
+
+def test_environment_is_shared_across_projects(tmp_path: Path):
+    first = DbtAssetGenerator(
+        project_path=tmp_path / "first",
+        asset_subpath="",
+        filename="dbt_project",
+        asset_type="yml",
+    )
+    second = first.model_copy(update={"project_path": tmp_path / "second"})
+
+    assert first._jinja_environment() is second._jinja_environment()
+    assert "name: 'first'" in generate(tmp_path / "first")
+    assert "name: 'second'" in generate(tmp_path / "second")
+
+
+def test_precompiled_templates_render_identically(tmp_path: Path):
+    compiled_path = compile_templates(tmp_path / "compiled")
+
+    assert len(list(compiled_path.iterdir())) == len(list(TEMPLATE_PATH.glob("*.j2")))
+    assert generate(
+        tmp_path / "project", compiled_templates_path=compiled_path
+    ) == generate(tmp_path / "project")
@@ -2,11 +2,13 @@
 
 import json
 import os
+from pathlib import Path
 from typing import Generator, cast
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
+from jinja2 import ModuleLoader
 from respx import MockRouter
 
 from snowplow_signals.api_client import ApiClient
@@ -14,7 +16,10 @@ from snowplow_signals.batch_autogen.cli_params import (
     TargetType,
 )
 from snowplow_signals.batch_autogen.dbt_client import BatchAutogenClient
-from snowplow_signals.batch_autogen.models.dbt_asset_generator import DbtAssetGenerator
+from snowplow_signals.batch_autogen.models.dbt_asset_generator import (
+    DbtAssetGenerator,
+    _jinja_environment,
+)
 from snowplow_signals.batch_autogen.models.dbt_config_generator import (
     ConfigAttributes,
     ConfigEvents,
@@ -22,6 +27,7 @@ from snowplow_signals.batch_autogen.models.dbt_config_generator import (
     DbtConfig,
     FilteredEvents,
 )
+from snowplow_signals.batch_autogen.utils.manifest import MANIFEST_PATH
 
 
 @pytest.fixture
@@ -196,6 +202,139 @@ def test_generate_models_all_projects_success(
     assert result is True
 
 
+def test_generate_models_in_worker_processes(
+    dbt_client: BatchAutogenClient,
+    temp_repo_path: str,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test that projects generated in worker processes are reported without aborting the others"""
+    for project in ["project1", "project2", "broken"]:
+        configs_path = os.path.join(temp_repo_path, project, "configs")
+        os.makedirs(configs_path, exist_ok=True)
+        with open(os.path.join(configs_path, "base_config.json"), "w") as f:
+            if project == "broken":
+                f.write("{not json")
+            else:
+                json.dump(
+                    {
+                        "events": [],
+                        "properties": [],
+                        "periods": [],
+                        "transformed_attributes": [],
+                        "attribute_key": "user_id",
+                    },
+                    f,
+                )
+
+    with caplog.at_level("INFO"):
+        result = dbt_client.generate_models(temp_repo_path, workers=2)
+
+    assert result is True
+    for project in ["project1", "project2"]:
+        assert os.path.exists(os.path.join(temp_repo_path, project, "packages.yml"))
+    assert "Failed to generate models for projects: broken" in caplog.text
+    # the records of each project are emitted together
+    messages = [record.getMessage() for record in caplog.records]
+    start = messages.index("Processing project/attribute group: project1")
+    assert messages[start + 1 : start + 3] == [
+        "📄 Dbt Config file generated for project1: dbt_config.json",
+        "Generating dbt project assets for project1...",
+    ]
+
+
+def test_generate_models_skips_unchanged_projects(
+    dbt_client: BatchAutogenClient,
+    temp_repo_path: str,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test that regeneration from unchanged inputs leaves the files untouched, and that check mode reports drift"""
+    project_path = Path(temp_repo_path, "test_project")
+    base_config_path = project_path / "configs" / "base_config.json"
+    base_config = {
+        "events": [],
+        "properties": [],
+        "periods": [],
+        "transformed_attributes": [],
+        "attribute_key": "user_id",
+    }
+    base_config_path.parent.mkdir(parents=True)
+    base_config_path.write_text(json.dumps(base_config))
+    dbt_project_path = project_path / "dbt_project.yml"
+    attributes_path = project_path / "models/attributes/test_project_attributes.sql"
+
+    assert dbt_client.generate_models(temp_repo_path) is True
+    assert (project_path / MANIFEST_PATH).exists()
+    mtime = dbt_project_path.stat().st_mtime_ns
+    macro_mtime = (project_path / "macros/allow_refresh.sql").stat().st_mtime_ns
+
+    with caplog.at_level("INFO"):
+        assert dbt_client.generate_models(temp_repo_path) is True
+        assert dbt_client.generate_models(temp_repo_path, check=True) is True
+    assert "test_project is up to date, skipping" in caplog.text
+    assert dbt_project_path.stat().st_mtime_ns == mtime
+
+    # a changed base config is reported as drift by check mode, without writing
+    base_config_path.write_text(json.dumps({**base_config, "attribute_key": "other"}))
+    caplog.clear()
+    assert dbt_client.generate_models(temp_repo_path, check=True) is False
+    assert "test_project/dbt_project.yml is out of date" in caplog.text
+    assert "user_id" in dbt_project_path.read_text()
+
+    # regeneration rewrites only the files whose content changed
+    attributes_path.write_text("edited")
+    assert dbt_client.generate_models(temp_repo_path) is True
+    assert "other" in dbt_project_path.read_text()
+    assert attributes_path.read_text() != "edited"
+    assert dbt_client.generate_models(temp_repo_path, check=True) is True
+    assert (project_path / "macros/allow_refresh.sql").stat().st_mtime_ns == macro_mtime
+
+
+def test_generate_models_renders_from_compiled_templates(
+    dbt_client: BatchAutogenClient, temp_repo_path: str, tmp_path: Path
+):
+    """Test that generation compiles the templates once into the given directory and renders from the compiled modules"""
+    project_path = Path(temp_repo_path, "test_project")
+    base_config_path = project_path / "configs" / "base_config.json"
+    base_config_path.parent.mkdir(parents=True)
+    base_config_path.write_text(
+        json.dumps(
+            {
+                "events": [],
+                "properties": [],
+                "periods": [],
+                "transformed_attributes": [],
+                "attribute_key": "user_id",
+            }
+        )
+    )
+    dbt_project_path = project_path / "dbt_project.yml"
+    cache_path = tmp_path / "compiled"
+
+    assert dbt_client.generate_models(temp_repo_path) is True
+    from_source = dbt_project_path.read_text()
+    assert (
+        dbt_client.generate_models(
+            temp_repo_path, update=True, compiled_templates_path=str(cache_path)
+        )
+        is True
+    )
+    assert dbt_project_path.read_text() == from_source
+
+    (compiled_path,) = cache_path.iterdir()
+    module_path = compiled_path / ModuleLoader.get_module_filename("dbt_project.j2")
+    module_path.write_text(
+        module_path.read_text().replace("name: '", "name: 'compiled_")
+    )
+    _jinja_environment.cache_clear()
+    assert (
+        dbt_client.generate_models(
+            temp_repo_path, update=True, compiled_templates_path=str(cache_path)
+        )
+        is True
+    )
+    assert "name: 'compiled_test_project'" in dbt_project_path.read_text()
+
+
 def test_generate_models_no_projects_found(
     dbt_client: BatchAutogenClient, temp_repo_path: str
 ):
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import httpx
@@ -7,7 +8,7 @@ from respx import MockRouter
 from snowplow_signals import Signals
 from snowplow_signals.batch_autogen.models.dbt_project_setup import DbtProjectSetup
 
-from .utils import get_attribute_view_response
+from .utils import get_attribute_view_response, get_integration_test_view_response
 
 
 def test_batch_setup_get_attribute_views_uses_all_views(
@@ -43,6 +44,32 @@ def test_batch_setup_get_attribute_views_uses_specified_attribute_group_name(
     assert attribute_views_mock.call_count == 1
 
 
+def test_batch_setup_get_attribute_views_filters_by_name_on_the_server(
+    signals_client: Signals, respx_mock: MockRouter
+):
+    mock_attribute_views_response = get_attribute_view_response()
+    name = mock_attribute_views_response[0]["name"]
+    # the name prefix also matches longer names, which are left out
+    longer_name = {**mock_attribute_views_response[0], "name": f"{name}_other"}
+    attribute_views_mock = respx_mock.get(
+        "http://localhost:8000/api/v1/registry/attribute_groups/"
+    ).mock(
+        return_value=httpx.Response(
+            200, json=[mock_attribute_views_response[0], longer_name]
+        )
+    )
+
+    dbt_project_setup = DbtProjectSetup(
+        signals_client.api_client, "repo", attribute_group_name=name
+    )
+    valid_attribute_views = dbt_project_setup._get_attribute_groups()
+
+    assert [view.name for view in valid_attribute_views] == [name]
+    params = attribute_views_mock.calls[0].request.url.params
+    assert params["name_prefix"] == name
+    assert params["offline"] == "true"
+
+
 def test_batch_setup_get_attribute_views_throws_on_empty_views(
     signals_client: Signals, respx_mock: MockRouter
 ):
@@ -122,3 +149,32 @@ def test_setup_all_projects_skips_views_with_no_attributes_and_fields(
         called_projects = [call[0][0] for call in mock_create.call_args_list]
         assert "with_attributes_1" in called_projects
         assert len(called_projects) == 1
+
+
+def test_setup_all_projects_writes_configs_of_every_group(
+    signals_client: Signals, respx_mock: MockRouter, tmp_path
+):
+    view = get_integration_test_view_response(warehouse="snowflake")[0]
+    mock_attribute_views_response = [view, {**view, "name": f"{view['name']}_other"}]
+    respx_mock.get("http://localhost:8000/api/v1/registry/attribute_groups/").mock(
+        return_value=httpx.Response(200, json=mock_attribute_views_response)
+    )
+
+    dbt_project_setup = DbtProjectSetup(
+        signals_client.api_client, "snowflake", repo_path=str(tmp_path), max_workers=2
+    )
+    assert dbt_project_setup.setup_all_projects() is True
+
+    for view in mock_attribute_views_response:
+        configs_path = tmp_path / f"{view['name']}_{view['version']}" / "configs"
+        base_config = json.loads((configs_path / "base_config.json").read_text())
+        batch_source_config = json.loads(
+            (configs_path / "batch_source_config.json").read_text()
+        )
+        assert base_config["attribute_key"]
+        assert (
+            batch_source_config["name"]
+            == f"{view['name']}_{view['version']}_attributes"
+        )
+    # no temporary files are left behind
+    assert not list(tmp_path.rglob("*.tmp"))
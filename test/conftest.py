@@ -4,7 +4,7 @@ import pytest
 from pytest import FixtureRequest
 from respx import MockRouter
 
-from snowplow_signals import Signals, SignalsSandbox
+from snowplow_signals import AsyncSignals, Signals, SignalsSandbox
 from snowplow_signals.api_client import ApiClient
 
 from .utils import (
@@ -49,6 +49,16 @@ def signals_client_sandbox() -> SignalsSandbox:
     )
 
 
+@pytest.fixture
+def async_signals_client() -> AsyncSignals:
+    return AsyncSignals(
+        api_url="http://localhost:8000",
+        api_key="foo",
+        api_key_id="bar",
+        org_id=MOCK_ORG_ID,
+    )
+
+
 @pytest.fixture
 def access_jwt() -> str:
     """Creates a sample JWT claimset for use as a payload during tests"""
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import threading
+from datetime import timedelta
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import AttributeKeyIdentifiers
+from snowplow_signals.api_client import AsyncApiClient
+from snowplow_signals.interventions_subscription import AsyncInterventionsSubscription
+from snowplow_signals.sse import ServerSentEvent
+
+TARGETS = AttributeKeyIdentifiers({"domain_userid": ["123"]})
+
+
+def mock_stream(respx_mock: MockRouter, count: int) -> None:
+    events = b"".join(
+        "data: {}\n\n".format(json.dumps({"name": "test", "version": version})).encode()
+        for version in range(1, count + 1)
+    )
+    respx_mock.get("http://localhost:8000/api/v1/interventions").mock(
+        return_value=httpx.Response(200, stream=httpx.ByteStream(events))
+    )
+
+
+def run_subscription(test, **options):
+    async def run():
+        async with AsyncApiClient(
+            api_url="http://localhost:8000",
+            auth_mode="sandbox",
+            sandbox_token="test-sandbox-token",
+        ) as api_client:
+            subscription = AsyncInterventionsSubscription(
+                api_client, TARGETS, reconnect_policy=None, **options
+            )
+            return await test(subscription)
+
+    return asyncio.run(run())
+
+
+async def drain(subscription: AsyncInterventionsSubscription) -> list[int]:
+    # waits for the stream to end before consuming the buffer
+    subscription.start()
+    assert subscription._task is not None
+    await asyncio.wait_for(asyncio.shield(subscription._task), 1)
+    versions = [intervention.version async for intervention in subscription]
+    await subscription.stop()
+    return versions
+
+
+class TestAsyncInterventionsSubscription:
+    @pytest.mark.parametrize(
+        ("overflow", "versions"),
+        [("drop_oldest", [3, 4]), ("drop_newest", [1, 2])],
+    )
+    def test_drops_interventions_when_buffer_is_full(
+        self, respx_mock: MockRouter, overflow: str, versions: list[int]
+    ):
+        mock_stream(respx_mock, 4)
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            return await drain(subscription), subscription.dropped
+
+        received, dropped = run_subscription(test, max_buffer_size=2, overflow=overflow)
+
+        assert received == versions
+        assert dropped == 2
+
+    def test_blocks_until_consumer_catches_up(self, respx_mock: MockRouter):
+        mock_stream(respx_mock, 4)
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            async with subscription:
+                return [intervention.version async for intervention in subscription]
+
+        assert run_subscription(test, max_buffer_size=1) == [1, 2, 3, 4]
+
+    def test_ends_consumers_when_stream_ends_with_a_full_buffer(self):
+        async def events():
+            yield ServerSentEvent(data=json.dumps({"name": "test", "version": 1}))
+
+        async def consume(subscription: AsyncInterventionsSubscription) -> list[int]:
+            return [intervention.version async for intervention in subscription]
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            # both consumers wait on the empty buffer, which the last intervention fills
+            consumers = asyncio.gather(consume(subscription), consume(subscription))
+            await asyncio.sleep(0)
+            await subscription._pipe(events())
+            return await asyncio.wait_for(consumers, 1)
+
+        received = run_subscription(test, max_buffer_size=1)
+
+        assert sorted(received) == [[], [1]]
+
+    def test_slow_handler_does_not_delay_others(self, respx_mock: MockRouter):
+        mock_stream(respx_mock, 3)
+        fast: list[int] = []
+        cancelled: list[int] = []
+
+        async def slow_handler(intervention):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(intervention.version)
+                raise
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            subscription.add_handler(slow_handler)
+            subscription.add_handler(
+                lambda intervention: fast.append(intervention.version)
+            )
+            async with subscription:
+                async for _ in subscription:
+                    pass
+
+        run_subscription(test, handler_timeout=timedelta(milliseconds=50))
+
+        assert sorted(fast) == [1, 2, 3]
+        assert sorted(cancelled) == [1, 2, 3]
+
+    def test_sync_handler_does_not_block_the_loop(self, respx_mock: MockRouter):
+        mock_stream(respx_mock, 1)
+        release = threading.Event()
+        released: list[bool] = []
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            subscription.add_handler(
+                lambda intervention: released.append(release.wait(1))
+            )
+            async with subscription:
+                # the blocked handler runs in a thread, so the loop can release it
+                await subscription.get(timeout=1)
+                release.set()
+
+        run_subscription(test)
+
+        assert released == [True]
+
+    def test_bounds_concurrent_handlers(self, respx_mock: MockRouter):
+        mock_stream(respx_mock, 6)
+        running = 0
+        most_running = 0
+
+        async def handler(intervention):
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            subscription.add_handler(handler)
+            return await drain(subscription)
+
+        assert run_subscription(test, max_concurrent_handlers=2) == [1, 2, 3, 4, 5, 6]
+        assert most_running == 2
+
+    def test_failing_handler_stops_subscription(self, respx_mock: MockRouter):
+        mock_stream(respx_mock, 1)
+
+        def failing_handler(intervention):
+            raise ValueError("handler failed")
+
+        async def test(subscription: AsyncInterventionsSubscription):
+            subscription.add_handler(failing_handler, ignore_fail=False)
+            subscription.start()
+            await subscription.get(timeout=1)
+            await subscription.stop()
+
+        with pytest.raises(ValueError, match="handler failed"):
+            run_subscription(test)
@@ -50,6 +50,33 @@ class TestInterventionsClient:
         assert intervention[0].name == mock_interventions_response[0]["name"]
         assert intervention[1].name == mock_interventions_response[1]["name"]
 
+    def test_iter_interventions_fetches_pages_lazily(
+        self, respx_mock: MockRouter, interventions_client: InterventionsClient
+    ):
+        mock_interventions_response = get_interventions_response()
+
+        def page(request):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(
+                200, json=mock_interventions_response[offset : offset + limit]
+            )
+
+        route = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/interventions/"
+        ).mock(side_effect=page)
+
+        interventions = interventions_client.iter(name_prefix="cycle", page_size=1)
+        assert next(interventions).name == mock_interventions_response[0]["name"]
+        assert route.call_count == 1
+
+        assert [intervention.name for intervention in interventions] == [
+            mock_interventions_response[1]["name"]
+        ]
+        # the last request returns an empty page
+        assert route.call_count == 3
+        assert route.calls[0].request.url.params["name_prefix"] == "cycle"
+
     def test_create_intervention(
         self, respx_mock: MockRouter, interventions_client: InterventionsClient
     ):
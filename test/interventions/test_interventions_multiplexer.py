@@ -0,0 +1,154 @@
+import json
+import threading
+from datetime import timedelta
+
+import httpx
+from respx import MockRouter
+
+from snowplow_signals import (
+    AttributeKeyIdentifiers,
+    InterventionsMultiplexer,
+    ReconnectPolicy,
+)
+from snowplow_signals.api_client import ApiClient
+
+INTERVENTIONS_URL = "http://localhost:8000/api/v1/interventions"
+
+
+def stream_for_targets(request: httpx.Request) -> httpx.Response:
+    # one intervention for every requested target, so each connection only sees its own targets
+    events = b"".join(
+        "data: {}\n\n".format(
+            json.dumps(
+                {
+                    "name": "test",
+                    "version": 1,
+                    "target_attribute_key": {"name": name, "id": identifier},
+                }
+            )
+        ).encode()
+        for name, identifier in request.url.params.multi_items()
+    )
+    return httpx.Response(200, stream=httpx.ByteStream(events))
+
+
+class OpenStream(httpx.SyncByteStream):
+    """A response body that stays open after its events until the response is closed."""
+
+    def __init__(self, events: bytes):
+        self.events = events
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        yield self.events
+        self.closed.wait(10)
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def open_stream_for_targets(request: httpx.Request) -> httpx.Response:
+    response = stream_for_targets(request)
+    return httpx.Response(200, stream=OpenStream(response.read()))
+
+
+class TestInterventionsMultiplexer:
+    def test_demultiplexes_interventions_by_target(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(side_effect=stream_for_targets)
+        threads = threading.active_count()
+
+        with InterventionsMultiplexer(api_client, max_connections=1) as multiplexer:
+            subscriptions = {
+                identifier: multiplexer.subscribe(
+                    AttributeKeyIdentifiers({"domain_userid": [identifier]})
+                )
+                for identifier in ("a", "b", "c")
+            }
+            assert threading.active_count() == threads + 1
+
+            received = {
+                identifier: subscription.get(timeout=5)
+                for identifier, subscription in subscriptions.items()
+            }
+
+        assert {
+            identifier: intervention.target_attribute_key.id
+            for identifier, intervention in received.items()
+        } == {"a": "a", "b": "b", "c": "c"}
+        # every change of targets reconnects with all of them merged
+        last_request = route.calls.last.request
+        assert last_request.url.params.get_list("domain_userid") == ["a", "b", "c"]
+
+    def test_unsubscribing_reconnects_without_the_targets(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(side_effect=stream_for_targets)
+
+        with InterventionsMultiplexer(api_client, max_connections=1) as multiplexer:
+            kept = multiplexer.subscribe(
+                AttributeKeyIdentifiers({"domain_userid": ["a"]})
+            )
+            with multiplexer.subscribe(
+                AttributeKeyIdentifiers({"domain_userid": ["b"]})
+            ) as removed:
+                removed.get(timeout=5)
+            assert not multiplexer.unsubscribe(removed)
+
+            # the reconnection after unsubscribing only requests the remaining target
+            while route.calls.last.request.url.params.get_list("domain_userid") != [
+                "a"
+            ]:
+                kept.get(timeout=5)
+
+    def test_subscribing_mid_stream_reopens_at_once(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            side_effect=open_stream_for_targets
+        )
+
+        with InterventionsMultiplexer(api_client, max_connections=1) as multiplexer:
+            first = multiplexer.subscribe(
+                AttributeKeyIdentifiers({"domain_userid": ["a"]})
+            )
+            first.get(timeout=5)
+
+            # the open stream is aborted rather than waiting for the idle timeout, and both subscriptions share one reconnection
+            second = multiplexer.subscribe(
+                AttributeKeyIdentifiers({"domain_userid": ["b"]})
+            )
+            third = multiplexer.subscribe(
+                AttributeKeyIdentifiers({"domain_userid": ["c"]})
+            )
+            assert second.get(timeout=2).target_attribute_key.id == "b"
+            assert third.get(timeout=2).target_attribute_key.id == "c"
+
+        assert route.call_count == 2
+        assert route.calls.last.request.url.params.get_list("domain_userid") == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_reopens_after_a_rejected_request(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        responses = iter([httpx.Response(403, json={"detail": "forbidden"})])
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            side_effect=lambda request: next(responses, None)
+            or stream_for_targets(request)
+        )
+
+        with InterventionsMultiplexer(
+            api_client,
+            max_connections=1,
+            reconnect_policy=ReconnectPolicy(initial_backoff=timedelta(0)),
+        ) as multiplexer:
+            subscription = multiplexer.subscribe(
+                AttributeKeyIdentifiers({"domain_userid": ["a"]})
+            )
+
+            assert subscription.get(timeout=2).target_attribute_key.id == "a"
+        assert route.call_count >= 2
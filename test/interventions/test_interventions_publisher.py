@@ -0,0 +1,164 @@
+import asyncio
+import queue
+import time
+from threading import Event
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import AsyncInterventionsPublisher, InterventionsPublisher
+from snowplow_signals.api_client import ApiClient, AsyncApiClient
+from snowplow_signals.interventions_client import (
+    AsyncInterventionsClient,
+    InterventionsClient,
+)
+
+from .utils import get_publishable_intervention
+
+INTERVENTIONS_URL = "http://localhost:8000/api/v1/interventions"
+
+
+class TestInterventionsPublisher:
+    def test_counts_delivery_statuses(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        respx_mock.post(INTERVENTIONS_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"status": "success"}),
+                httpx.Response(200, json={"status": "undelivered"}),
+                httpx.Response(200, json={"status": "failure"}),
+                httpx.Response(400, json={"detail": "invalid"}),
+            ]
+        )
+        targets, intervention = get_publishable_intervention()
+
+        with InterventionsPublisher(
+            InterventionsClient(api_client), max_concurrency=1
+        ) as publisher:
+            for _ in range(4):
+                publisher.publish(intervention, targets)
+            assert publisher.flush(timeout=5)
+            stats = publisher.stats()
+
+        assert stats.success == stats.undelivered == stats.failure == stats.errors == 1
+        assert stats.queued == stats.in_flight == 0
+        assert stats.delivery_times_ms.count == 4
+
+    def test_counts_unknown_statuses_as_failures(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        respx_mock.post(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json={"status": "queued"})
+        )
+        targets, intervention = get_publishable_intervention()
+
+        with InterventionsPublisher(
+            InterventionsClient(api_client), max_concurrency=1
+        ) as publisher:
+            for _ in range(2):
+                publisher.publish(intervention, targets)
+            # the worker survives the first unknown status to send the second intervention
+            assert publisher.flush(timeout=5)
+
+        assert publisher.stats().failure == 2
+
+    def test_applies_backpressure_when_queue_is_full(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        release = Event()
+
+        def slow_publish(request):
+            release.wait(5)
+            return httpx.Response(200, json={"status": "success"})
+
+        route = respx_mock.post(INTERVENTIONS_URL).mock(side_effect=slow_publish)
+        targets, intervention = get_publishable_intervention()
+
+        publisher = InterventionsPublisher(
+            InterventionsClient(api_client), max_queue_size=1, max_concurrency=1
+        )
+        publisher.publish(intervention, targets)
+        # the worker holds the first intervention, the second fills the queue
+        while publisher.stats().queued:
+            time.sleep(0.001)
+        publisher.publish(intervention, targets)
+
+        with pytest.raises(queue.Full):
+            publisher.publish(intervention, targets, block=False)
+        with pytest.raises(queue.Full):
+            publisher.publish(intervention, targets, timeout=0.01)
+        assert not publisher.flush(timeout=0.01)
+
+        release.set()
+        assert publisher.close(timeout=5)
+        assert route.call_count == 2
+        assert publisher.stats().success == 2
+        with pytest.raises(RuntimeError):
+            publisher.publish(intervention, targets)
+
+    def test_close_abandons_queued_interventions_on_timeout(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        release = Event()
+
+        def slow_publish(request):
+            release.wait(5)
+            return httpx.Response(200, json={"status": "success"})
+
+        route = respx_mock.post(INTERVENTIONS_URL).mock(side_effect=slow_publish)
+        targets, intervention = get_publishable_intervention()
+
+        publisher = InterventionsPublisher(
+            InterventionsClient(api_client), max_queue_size=1, max_concurrency=2
+        )
+        publisher.publish(intervention, targets)
+        publisher.publish(intervention, targets)
+        # both workers hold an intervention, the third fills the queue
+        while publisher.stats().queued:
+            time.sleep(0.001)
+        publisher.publish(intervention, targets)
+
+        started = time.monotonic()
+        assert not publisher.close(timeout=0.05)
+        assert time.monotonic() - started < 1
+
+        release.set()
+        assert publisher.flush(timeout=5)
+        assert route.call_count == 2
+        assert publisher.stats().queued == 0
+
+    def test_async_publisher(self, respx_mock: MockRouter):
+        route = respx_mock.post(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json={"status": "success"})
+        )
+        targets, intervention = get_publishable_intervention()
+
+        async def run():
+            async with AsyncApiClient(
+                api_url="http://localhost:8000",
+                auth_mode="sandbox",
+                sandbox_token="test-sandbox-token",
+            ) as api_client:
+                async with AsyncInterventionsPublisher(
+                    AsyncInterventionsClient(api_client), max_queue_size=2
+                ) as publisher:
+                    publisher.publish_nowait(intervention, targets)
+                    publisher.publish_nowait(intervention, targets)
+                    with pytest.raises(asyncio.QueueFull):
+                        publisher.publish_nowait(intervention, targets)
+                    # waits for a worker to take an intervention off the queue
+                    await publisher.publish(intervention, targets)
+                    await publisher.flush()
+                    stats = publisher.stats()
+                with pytest.raises(RuntimeError):
+                    await publisher.publish(intervention, targets)
+                with pytest.raises(RuntimeError):
+                    publisher.publish_nowait(intervention, targets)
+                return stats
+
+        stats = asyncio.run(run())
+
+        assert route.call_count == 3
+        assert stats.success == 3
+        assert stats.queued == stats.in_flight == 0
@@ -0,0 +1,52 @@
+import httpx
+from respx import MockRouter
+
+from snowplow_signals import Signals
+from snowplow_signals.api_client import ApiClient
+
+from .utils import MOCK_ORG_ID
+
+
+class TestApiClient:
+    def test_reuses_pooled_client_across_requests(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/interventions/"
+        ).mock(return_value=httpx.Response(200, json=[]))
+        client = api_client._client
+
+        api_client.make_request(method="GET", endpoint="registry/interventions/")
+        api_client.make_request(method="GET", endpoint="registry/interventions/")
+
+        assert route.call_count == 2
+        assert api_client._client is client
+        assert not client.is_closed
+
+    def test_accepts_custom_limits(self):
+        api_client = ApiClient(
+            api_url="http://localhost:8000",
+            auth_mode="sandbox",
+            sandbox_token="test-sandbox-token",
+            limits=httpx.Limits(max_connections=5, keepalive_expiry=60.0),
+        )
+        pool = api_client._client._transport._pool  # pyright: ignore
+
+        assert pool._max_connections == 5
+        assert pool._keepalive_expiry == 60.0
+
+    def test_context_manager_closes_client(self):
+        with Signals(
+            api_url="http://localhost:8000",
+            api_key="foo",
+            api_key_id="bar",
+            org_id=MOCK_ORG_ID,
+        ) as signals:
+            assert not signals.api_client._client.is_closed
+
+        assert signals.api_client._client.is_closed
+
+    def test_close(self, api_client_sandbox: ApiClient):
+        api_client_sandbox.close()
+
+        assert api_client_sandbox._client.is_closed
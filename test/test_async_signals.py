@@ -0,0 +1,211 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import (
+    AsyncSignals,
+    AsyncSignalsSandbox,
+    AttributeGroup,
+    Service,
+    SignalsAPIError,
+    domain_userid,
+)
+
+from .interventions.utils import get_intervention_stream, get_publishable_intervention
+from .utils import mock_registry_lists
+
+
+class TestAsyncSignals:
+    def test_get_group_attributes(
+        self, respx_mock: MockRouter, async_signals_client: AsyncSignals, access_jwt
+    ):
+        def check_group_request(request):
+            body = json.loads(request.content)
+            assert body["attribute_keys"] == {"domain_userid": ["user-123"]}
+            assert body["attributes"] == ["my_group_v1:page_views"]
+            assert request.headers["Authorization"] == f"Bearer {access_jwt}"
+            return httpx.Response(
+                200, json={"domain_userid": ["user-123"], "page_views": [10]}
+            )
+
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            side_effect=check_group_request
+        )
+
+        async def run():
+            async with async_signals_client as signals:
+                return await signals.get_group_attributes(
+                    name="my_group",
+                    version=1,
+                    attributes=["page_views"],
+                    attribute_key="domain_userid",
+                    identifier="user-123",
+                )
+
+        assert asyncio.run(run()) == {"domain_userid": "user-123", "page_views": 10}
+        assert async_signals_client.api_client._client.is_closed
+
+    def test_get_service_attributes_sandbox(self, respx_mock: MockRouter):
+        def check_service_request(request):
+            body = json.loads(request.content)
+            assert body["service"] == "my_service"
+            assert request.headers["Authorization"] == "Bearer test-sandbox-token"
+            return httpx.Response(200, json={"page_views": [10]})
+
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            side_effect=check_service_request
+        )
+        signals = AsyncSignalsSandbox(
+            api_url="http://localhost:8000", sandbox_token="test-sandbox-token"
+        )
+
+        response = asyncio.run(
+            signals.get_service_attributes(
+                name="my_service", attribute_key="domain_userid", identifier="a"
+            )
+        )
+
+        assert response == {"page_views": 10}
+
+    def test_publish(self, respx_mock: MockRouter, async_signals_client: AsyncSignals):
+        attribute_group = AttributeGroup(
+            name="my_attribute_group",
+            attribute_key=domain_userid,
+            owner="test@example.com",
+        )
+        service = Service(
+            name="my_service",
+            attribute_groups=[attribute_group],
+            owner="test@example.com",
+        )
+
+        def echo(request):
+            body = json.loads(request.content)
+            assert body["is_published"] is True
+            return httpx.Response(201, json=body)
+
+        mock_registry_lists(respx_mock)
+        group_mock = respx_mock.post(
+            "http://localhost:8000/api/v1/registry/attribute_groups/"
+        ).mock(side_effect=echo)
+        service_mock = respx_mock.post(
+            "http://localhost:8000/api/v1/registry/services/"
+        ).mock(side_effect=echo)
+
+        # services are passed first but published after their attribute groups
+        published = asyncio.run(
+            async_signals_client.publish([service, attribute_group])
+        )
+
+        assert group_mock.called
+        assert service_mock.called
+        assert isinstance(published[0], AttributeGroup)
+        assert isinstance(published[1], Service)
+        assert all(object.is_published for object in published)
+
+    def test_push_intervention(
+        self, respx_mock: MockRouter, async_signals_client: AsyncSignals
+    ):
+        route = respx_mock.post("http://localhost:8000/api/v1/interventions").mock(
+            httpx.Response(200, json={"status": "success"})
+        )
+        targets, intervention = get_publishable_intervention()
+
+        status = asyncio.run(
+            async_signals_client.push_intervention(targets, intervention)
+        )
+
+        assert status == "success"
+        assert route.calls[0].request.url.params.get_list("domain_userid") == ["123"]
+
+    def test_pull_interventions(
+        self, respx_mock: MockRouter, async_signals_client: AsyncSignals
+    ):
+        targets, stream_bytes = get_intervention_stream()
+        respx_mock.get("http://localhost:8000/api/v1/interventions").mock(
+            httpx.Response(200, stream=httpx.ByteStream(stream_bytes))
+        )
+        handler = Mock(return_value=None)
+
+        async def run():
+            received = []
+            async with async_signals_client.pull_interventions(targets) as sub:
+                sub.add_handler(handler)
+                async for intervention in sub:
+                    received.append(intervention)
+                    # the subscription reconnects when the stream ends, so stop after the streamed intervention
+                    break
+            return received
+
+        received = asyncio.run(run())
+
+        assert len(received) == 1
+        assert received[0].target_attribute_key is not None
+        assert received[0].target_attribute_key.id == "123"
+        handler.assert_called_once_with(received[0])
+
+    def test_async_handler_is_awaited(
+        self, respx_mock: MockRouter, async_signals_client: AsyncSignals
+    ):
+        targets, stream_bytes = get_intervention_stream()
+        respx_mock.get("http://localhost:8000/api/v1/interventions").mock(
+            httpx.Response(200, stream=httpx.ByteStream(stream_bytes))
+        )
+        received = []
+
+        async def handler(intervention):
+            received.append(intervention)
+
+        async def run():
+            sub = async_signals_client.pull_interventions(targets)
+            sub.add_handler(handler)
+            sub.start()
+            await sub.get(timeout=1)
+            await sub.stop()
+
+        asyncio.run(run())
+
+        assert len(received) == 1
+
+    def test_api_error(
+        self, respx_mock: MockRouter, async_signals_client: AsyncSignals
+    ):
+        respx_mock.get(
+            "http://localhost:8000/api/v1/registry/attribute_groups/missing"
+        ).mock(httpx.Response(404, json={"detail": "Not found"}))
+
+        with pytest.raises(SignalsAPIError) as e:
+            asyncio.run(async_signals_client.get_attribute_group("missing"))
+        assert e.value.status_code == 404
+
+    def test_get_service_attributes_batch(
+        self, respx_mock: MockRouter, async_signals_client: AsyncSignals
+    ):
+        async_signals_client.attributes.max_identifiers_per_request = 2
+
+        def echo_rows(request):
+            rows = json.loads(request.content)["attribute_keys"]["domain_userid"]
+            return httpx.Response(200, json={"domain_userid": rows})
+
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+
+        response = asyncio.run(
+            async_signals_client.get_service_attributes_batch(
+                name="my_service", identifiers={"domain_userid": ["a", "b", "c"]}
+            )
+        )
+
+        assert route.call_count == 2
+        assert response == {
+            "domain_userid": {
+                "a": {"domain_userid": "a"},
+                "b": {"domain_userid": "b"},
+                "c": {"domain_userid": "c"},
+            }
+        }
@@ -0,0 +1,185 @@
+import json
+from datetime import timedelta
+
+import httpx
+from respx import MockRouter
+
+from snowplow_signals import (
+    AttributeKeyIdentifiers,
+    AttributesCache,
+    InterventionInstance,
+    Signals,
+)
+from snowplow_signals.api_client import ApiClient
+from snowplow_signals.attributes_cache import AttributesCacheKey
+from snowplow_signals.attributes_client import AttributesClient
+
+from .utils import MOCK_ORG_ID
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def service_key(identifier: str, name="my_service") -> AttributesCacheKey:
+    return AttributesCacheKey(
+        kind="service",
+        name=name,
+        version=None,
+        attributes=None,
+        attribute_key="domain_userid",
+        identifier=identifier,
+    )
+
+
+class TestAttributesCache:
+    def test_evicts_least_recently_used(self):
+        cache = AttributesCache(max_size=2)
+        cache.set(service_key("a"), {"count": 1})
+        cache.set(service_key("b"), {"count": 2})
+        assert cache.get(service_key("a")) == {"count": 1}
+
+        cache.set(service_key("c"), {"count": 3})
+
+        assert cache.get(service_key("b")) is None
+        assert cache.get(service_key("a")) == {"count": 1}
+        assert cache.get(service_key("c")) == {"count": 3}
+        assert cache.stats().model_dump() == {
+            "size": 2,
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+        }
+
+    def test_uses_per_name_ttl(self):
+        clock = FakeClock()
+        cache = AttributesCache(
+            ttl=timedelta(seconds=10),
+            ttls={"slow_service": timedelta(minutes=5)},
+            clock=clock,
+        )
+        cache.set(service_key("a"), {"count": 1})
+        cache.set(service_key("a", name="slow_service"), {"count": 2})
+
+        clock.now = 11
+
+        assert cache.get(service_key("a")) is None
+        assert cache.get(service_key("a", name="slow_service")) == {"count": 2}
+
+    def test_invalidate(self):
+        cache = AttributesCache()
+        cache.set(service_key("a"), {"count": 1})
+        cache.set(service_key("a", name="other_service"), {"count": 1})
+        cache.set(service_key("b"), {"count": 2})
+
+        assert cache.invalidate(attribute_key="domain_userid", identifier="a") == 2
+        assert cache.get(service_key("a")) is None
+        assert cache.get(service_key("b")) == {"count": 2}
+        assert cache.invalidate(name="my_service") == 1
+        assert len(cache) == 0
+
+    def test_invalidate_intervention_target(self):
+        cache = AttributesCache()
+        cache.set(service_key("a"), {"count": 1})
+
+        cache.invalidate_intervention_target(
+            InterventionInstance(
+                name="test",
+                version=1,
+                target_attribute_key={"name": "domain_userid", "id": "a"},
+            )
+        )
+
+        assert len(cache) == 0
+
+    def test_returned_attributes_are_copies(self):
+        cache = AttributesCache()
+        cache.set(service_key("a"), {"count": 1})
+
+        cache.get(service_key("a"))["count"] = 2  # type: ignore[index]
+
+        assert cache.get(service_key("a")) == {"count": 1}
+
+
+class TestAttributesClientCache:
+    def test_reads_through_cache(self, respx_mock: MockRouter, api_client: ApiClient):
+        cache = AttributesCache()
+        attributes_client = AttributesClient(api_client=api_client, cache=cache)
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(return_value=httpx.Response(200, json={"page_views": [10]}))
+
+        for _ in range(3):
+            response = attributes_client.get_group_attributes(
+                name="my_group",
+                version=1,
+                attributes=["page_views"],
+                attribute_key="domain_userid",
+                identifier="a",
+            )
+            assert response == {"page_views": 10}
+
+        # a different attribute list is a different entry
+        attributes_client.get_group_attributes(
+            name="my_group",
+            version=1,
+            attributes=["page_views", "sessions"],
+            attribute_key="domain_userid",
+            identifier="a",
+        )
+
+        assert route.call_count == 2
+        assert cache.stats().hits == 2
+
+    def test_batch_only_fetches_missing_identifiers(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        cache = AttributesCache()
+        attributes_client = AttributesClient(api_client=api_client, cache=cache)
+
+        def echo_rows(request):
+            rows = json.loads(request.content)["attribute_keys"]["domain_userid"]
+            return httpx.Response(200, json={"domain_userid": rows})
+
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+
+        attributes_client.get_service_attributes(
+            name="my_service", attribute_key="domain_userid", identifier="a"
+        )
+        response = attributes_client.get_service_attributes_batch(
+            name="my_service", identifiers={"domain_userid": ["a", "b"]}
+        )
+
+        assert route.call_count == 2
+        assert json.loads(route.calls[1].request.content)["attribute_keys"] == {
+            "domain_userid": ["b"]
+        }
+        assert response == {
+            "domain_userid": {
+                "a": {"domain_userid": "a"},
+                "b": {"domain_userid": "b"},
+            }
+        }
+
+    def test_pull_interventions_invalidates_cache(self):
+        cache = AttributesCache()
+        signals = Signals(
+            api_url="http://localhost:8000",
+            api_key="foo",
+            api_key_id="bar",
+            org_id=MOCK_ORG_ID,
+            attributes_cache=cache,
+        )
+
+        subscription = signals.pull_interventions(
+            targets=AttributeKeyIdentifiers({"domain_userid": ["a"]}),
+            invalidate_attributes_cache=True,
+        )
+
+        assert cache.invalidate_intervention_target in subscription._handlers
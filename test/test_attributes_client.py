@@ -1,4 +1,7 @@
+import json
+
 import httpx
+import pytest
 from respx import MockRouter
 
 from snowplow_signals.api_client import ApiClient
@@ -144,3 +147,174 @@ class TestAttributesClient:
         }
 
         assert response == expected_response
+
+    def test_get_service_attributes_batch(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        attributes_client = AttributesClient(api_client=api_client)
+
+        def echo_rows(request):
+            body = json.loads(request.content)
+            assert body["service"] == "my_service"
+            rows = [
+                identifier
+                for identifiers in body["attribute_keys"].values()
+                for identifier in identifiers
+            ]
+            return httpx.Response(
+                200,
+                json={
+                    "identifier": rows,
+                    "page_views_count": [len(row) for row in rows],
+                },
+            )
+
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+
+        response = attributes_client.get_service_attributes_batch(
+            name="my_service",
+            identifiers={
+                "domain_userid": ["a", "bb", "a"],
+                "domain_sessionid": ["ccc"],
+            },
+        )
+
+        assert route.call_count == 1
+        assert json.loads(route.calls[0].request.content)["attribute_keys"] == {
+            "domain_userid": ["a", "bb"],
+            "domain_sessionid": ["ccc"],
+        }
+        assert response == {
+            "domain_userid": {
+                "a": {"identifier": "a", "page_views_count": 1},
+                "bb": {"identifier": "bb", "page_views_count": 2},
+            },
+            "domain_sessionid": {
+                "ccc": {"identifier": "ccc", "page_views_count": 3},
+            },
+        }
+
+    def test_get_group_attributes_batch_is_chunked(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        attributes_client = AttributesClient(
+            api_client=api_client, max_identifiers_per_request=2
+        )
+
+        def echo_rows(request):
+            body = json.loads(request.content)
+            assert body["attributes"] == ["my_group_v1:page_views_count"]
+            rows = body["attribute_keys"]["domain_userid"]
+            return httpx.Response(200, json={"domain_userid": rows})
+
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+
+        identifiers = [f"user-{i}" for i in range(5)]
+        response = attributes_client.get_group_attributes_batch(
+            name="my_group",
+            version=1,
+            attributes=["page_views_count"],
+            identifiers={"domain_userid": identifiers},
+        )
+
+        assert route.call_count == 3
+        assert response["domain_userid"] == {
+            identifier: {"domain_userid": identifier} for identifier in identifiers
+        }
+
+    def test_get_attributes_batch_rejects_mismatched_rows(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        attributes_client = AttributesClient(api_client=api_client)
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            return_value=httpx.Response(200, json={"page_views_count": [1]})
+        )
+
+        with pytest.raises(ValueError):
+            attributes_client.get_service_attributes_batch(
+                name="my_service", identifiers={"domain_userid": ["a", "b"]}
+            )
+
+    def test_get_attributes_batch_matches_rows_by_attribute_key(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        attributes_client = AttributesClient(api_client=api_client)
+        # the server dropped the unknown identifier "b" and reordered the others
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            return_value=httpx.Response(
+                200,
+                json={"domain_userid": ["c", "a"], "page_views_count": [3, 1]},
+            )
+        )
+
+        response = attributes_client.get_service_attributes_batch(
+            name="my_service", identifiers={"domain_userid": ["a", "b", "c"]}
+        )
+
+        assert response == {
+            "domain_userid": {
+                "a": {"domain_userid": "a", "page_views_count": 1},
+                "b": {},
+                "c": {"domain_userid": "c", "page_views_count": 3},
+            }
+        }
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_fast_decode_matches_model_decode(
+        self,
+        respx_mock: MockRouter,
+        api_client: ApiClient,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ):
+        if not use_orjson:
+            monkeypatch.setattr("snowplow_signals.attributes_client.orjson", None)
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            return_value=httpx.Response(
+                200,
+                json={"page_views_count": [10], "first_page": ["/home"], "empty": []},
+            )
+        )
+
+        expected = AttributesClient(api_client=api_client).get_service_attributes(
+            name="my_service", attribute_key="domain_userid", identifier="a"
+        )
+        response = AttributesClient(
+            api_client=api_client, fast_decode=True
+        ).get_service_attributes(
+            name="my_service", attribute_key="domain_userid", identifier="a"
+        )
+
+        assert (
+            response
+            == expected
+            == {
+                "page_views_count": 10,
+                "first_page": "/home",
+                "empty": None,
+            }
+        )
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_fast_decode_rejects_malformed_response(
+        self,
+        respx_mock: MockRouter,
+        api_client: ApiClient,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ):
+        if not use_orjson:
+            monkeypatch.setattr("snowplow_signals.attributes_client.orjson", None)
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            return_value=httpx.Response(200, json={"page_views_count": 10})
+        )
+        attributes_client = AttributesClient(api_client=api_client, fast_decode=True)
+
+        with pytest.raises(ValueError):
+            attributes_client.get_service_attributes(
+                name="my_service", attribute_key="domain_userid", identifier="a"
+            )
@@ -0,0 +1,186 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import (
+    AsyncAttributesDispatcher,
+    AsyncSignalsSandbox,
+    AttributesDispatcher,
+)
+from snowplow_signals.api_client import ApiClient
+from snowplow_signals.attributes_client import AttributesClient
+
+
+def echo_rows(request):
+    body = json.loads(request.content)
+    rows = [
+        identifier
+        for identifiers in body["attribute_keys"].values()
+        for identifier in identifiers
+    ]
+    return httpx.Response(200, json={"identifier": rows})
+
+
+class TestAttributesDispatcher:
+    def test_merges_lookups_into_one_request(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+        identifiers = [f"user-{i}" for i in range(10)]
+
+        with AttributesDispatcher(
+            AttributesClient(api_client=api_client),
+            max_batch_size=10,
+            max_wait=timedelta(seconds=5),
+        ) as dispatcher:
+            with ThreadPoolExecutor(len(identifiers)) as pool:
+                results = list(
+                    pool.map(
+                        lambda identifier: dispatcher.get_service_attributes(
+                            name="my_service",
+                            attribute_key="domain_userid",
+                            identifier=identifier,
+                        ),
+                        identifiers,
+                    )
+                )
+
+        assert route.call_count == 1
+        assert results == [{"identifier": identifier} for identifier in identifiers]
+        stats = dispatcher.stats()
+        assert stats.batch_sizes.count == 1
+        assert stats.batch_sizes.sum == 10
+        assert stats.wait_times_ms.count == 10
+
+    def test_dispatches_after_max_wait(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+
+        with AttributesDispatcher(
+            AttributesClient(api_client=api_client),
+            max_wait=timedelta(milliseconds=5),
+        ) as dispatcher:
+            group = dispatcher.submit_group_attributes(
+                name="my_group",
+                version=1,
+                attributes=["page_views"],
+                attribute_key="domain_userid",
+                identifier="a",
+            )
+            service = dispatcher.submit_service_attributes(
+                name="my_service", attribute_key="domain_userid", identifier="a"
+            )
+
+            assert group.result(timeout=2) == {"identifier": "a"}
+            assert service.result(timeout=2) == {"identifier": "a"}
+
+        # different targets are never merged
+        assert route.call_count == 2
+        assert json.loads(route.calls[0].request.content)["attributes"] == [
+            "my_group_v1:page_views"
+        ]
+
+    def test_propagates_errors_to_every_caller(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        respx_mock.post("http://localhost:8000/api/v1/get-online-attributes").mock(
+            return_value=httpx.Response(500, json={"detail": "boom"})
+        )
+
+        with AttributesDispatcher(
+            AttributesClient(api_client=api_client), max_batch_size=2
+        ) as dispatcher:
+            futures = [
+                dispatcher.submit_service_attributes(
+                    name="my_service", attribute_key="domain_userid", identifier=i
+                )
+                for i in ("a", "b")
+            ]
+
+        for future in futures:
+            with pytest.raises(Exception):
+                future.result(timeout=2)
+
+    def test_cancelled_lookup_does_not_block_the_batch(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+
+        with AttributesDispatcher(
+            AttributesClient(api_client=api_client),
+            max_batch_size=3,
+            max_wait=timedelta(seconds=5),
+        ) as dispatcher:
+            futures = {
+                identifier: dispatcher.submit_service_attributes(
+                    name="my_service",
+                    attribute_key="domain_userid",
+                    identifier=identifier,
+                )
+                for identifier in ("a", "b")
+            }
+            assert futures["a"].cancel()
+            futures["c"] = dispatcher.submit_service_attributes(
+                name="my_service", attribute_key="domain_userid", identifier="c"
+            )
+
+            assert futures["b"].result(timeout=2) == {"identifier": "b"}
+            assert futures["c"].result(timeout=2) == {"identifier": "c"}
+
+        assert json.loads(route.calls[0].request.content)["attribute_keys"] == {
+            "domain_userid": ["b", "c"]
+        }
+
+    def test_rejects_lookups_after_close(self, api_client: ApiClient):
+        dispatcher = AttributesDispatcher(AttributesClient(api_client=api_client))
+        dispatcher.close()
+
+        with pytest.raises(RuntimeError):
+            dispatcher.submit_service_attributes(
+                name="my_service", attribute_key="domain_userid", identifier="a"
+            )
+
+
+class TestAsyncAttributesDispatcher:
+    def test_merges_concurrent_lookups(self, respx_mock: MockRouter):
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+        signals = AsyncSignalsSandbox(
+            api_url="http://localhost:8000", sandbox_token="test-sandbox-token"
+        )
+        identifiers = [f"user-{i}" for i in range(5)]
+
+        async def run():
+            async with AsyncAttributesDispatcher(
+                signals.attributes, max_wait=timedelta(milliseconds=5)
+            ) as dispatcher:
+                return await asyncio.gather(
+                    *(
+                        dispatcher.get_group_attributes(
+                            name="my_group",
+                            version=1,
+                            attributes=["page_views"],
+                            attribute_key="domain_userid",
+                            identifier=identifier,
+                        )
+                        for identifier in identifiers
+                    )
+                )
+
+        results = asyncio.run(run())
+
+        assert route.call_count == 1
+        assert results == [{"identifier": identifier} for identifier in identifiers]
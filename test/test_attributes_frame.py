@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from snowplow_signals.attributes_frame import AttributesFrameBuilder
+
+
+class TestAttributesFrameBuilder:
+    def test_fills_attributes_missing_from_some_chunks(self):
+        builder = AttributesFrameBuilder()
+        builder.add("domain_userid", ["a", "b"], {"count": [1, 2]})
+        builder.add("domain_userid", ["c"], {"count": [3], "is_new": [True]})
+
+        frame = builder.build("domain_userid", {"count": "int32", "is_new": "bool"})
+
+        assert list(frame.index) == ["a", "b", "c"]
+        assert str(frame.dtypes["count"]) == "Int32"
+        assert str(frame.dtypes["is_new"]) == "boolean"
+        assert frame["is_new"].isna().tolist() == [True, True, False]
+
+    def test_rejects_mismatched_rows(self):
+        with pytest.raises(ValueError):
+            AttributesFrameBuilder().add("domain_userid", ["a", "b"], {"count": [1]})
+
+    def test_matches_rows_by_attribute_key_column(self):
+        builder = AttributesFrameBuilder()
+        # the server dropped "b" and returned the other rows in a different order
+        builder.add(
+            "domain_userid",
+            ["a", "b", "c"],
+            {"domain_userid": ["c", "a"], "count": [3, 1]},
+        )
+
+        frame = builder.build("domain_userid", {"count": "int32"})
+
+        assert frame["count"].tolist() == [1, pd.NA, 3]
+
+    def test_pyarrow_dtypes(self):
+        pytest.importorskip("pyarrow")
+        builder = AttributesFrameBuilder()
+        builder.add(
+            "domain_userid", ["a", "b"], {"count": [1, None], "tags": [["x"], []]}
+        )
+
+        frame = builder.build(
+            "domain_userid",
+            {"count": "int64", "tags": "string_list"},
+            dtype_backend="pyarrow",
+        )
+
+        assert str(frame.dtypes["count"]) == "int64[pyarrow]"
+        assert str(frame.dtypes["tags"]) == "list<item: string>[pyarrow]"
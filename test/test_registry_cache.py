@@ -0,0 +1,193 @@
+import asyncio
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import AttributeKey, RegistryCache, SignalsAPIError
+from snowplow_signals.api_client import ApiClient, AsyncApiClient
+from snowplow_signals.interventions_client import InterventionsClient
+from snowplow_signals.registry_client import AsyncRegistryClient, RegistryClient
+
+SERVICE_URL = "http://localhost:8000/api/v1/registry/services/my_service"
+SERVICE = {
+    "name": "my_service",
+    "attribute_groups": [{"name": "my_attribute_group", "version": 1}],
+    "owner": "test@example.com",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRegistryCache:
+    def test_serves_fresh_entries_and_revalidates_stale_ones(
+        self, respx_mock: MockRouter, api_client_sandbox: ApiClient
+    ):
+        clock = FakeClock()
+        route = respx_mock.get(SERVICE_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=SERVICE, headers={"ETag": '"v1"'}),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+        registry = RegistryClient(
+            api_client_sandbox,
+            cache=RegistryCache(max_age=timedelta(seconds=60), clock=clock),
+        )
+
+        registry.get_service("my_service")
+        clock.now += 30
+        registry.get_service("my_service")
+        assert route.call_count == 1
+
+        clock.now += 60
+        service = registry.get_service("my_service")
+
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert service.name == "my_service"
+
+    def test_serves_stale_entries_while_api_is_unavailable(
+        self, respx_mock: MockRouter, api_client_sandbox: ApiClient
+    ):
+        clock = FakeClock()
+        respx_mock.get(SERVICE_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=SERVICE),
+                httpx.Response(503, json={"detail": "unavailable"}),
+            ]
+        )
+        respx_mock.get(
+            "http://localhost:8000/api/v1/registry/services/other_service"
+        ).mock(return_value=httpx.Response(503, json={"detail": "unavailable"}))
+        registry = RegistryClient(
+            api_client_sandbox,
+            cache=RegistryCache(max_age=timedelta(seconds=60), clock=clock),
+        )
+
+        registry.get_service("my_service")
+        clock.now += 120
+
+        assert registry.get_service("my_service").name == "my_service"
+        with pytest.raises(SignalsAPIError):
+            registry.get_service("other_service")
+
+    def test_warms_from_file(
+        self, respx_mock: MockRouter, api_client_sandbox: ApiClient, tmp_path: Path
+    ):
+        path = tmp_path / "registry.json"
+        clock = FakeClock()
+        route = respx_mock.get(SERVICE_URL).mock(
+            return_value=httpx.Response(200, json=SERVICE, headers={"ETag": '"v1"'})
+        )
+        RegistryClient(
+            api_client_sandbox, cache=RegistryCache(path=path, clock=clock)
+        ).get_service("my_service")
+        snapshot = json.loads(path.read_text())
+        assert snapshot["entries"]["registry/services/my_service"]["etag"] == '"v1"'
+
+        # a day later, the snapshot is served on startup without waiting on the registry
+        clock.now += 86_400
+        warm = RegistryClient(
+            api_client_sandbox,
+            cache=RegistryCache(path=path, warm_from_file=True, clock=clock),
+        )
+        assert warm.get_service("my_service").name == "my_service"
+        assert route.call_count == 1
+
+        cold = RegistryClient(
+            api_client_sandbox, cache=RegistryCache(path=path, clock=clock)
+        )
+        cold.get_service("my_service")
+        assert route.call_count == 2
+
+    def test_saves_only_changed_entries(
+        self, respx_mock: MockRouter, api_client_sandbox: ApiClient, tmp_path: Path
+    ):
+        path = tmp_path / "registry.json"
+        clock = FakeClock()
+        respx_mock.get(SERVICE_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=SERVICE, headers={"ETag": '"v1"'}),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+                httpx.Response(
+                    200,
+                    json=SERVICE | {"owner": "new@example.com"},
+                    headers={"ETag": '"v2"'},
+                ),
+            ]
+        )
+        registry = RegistryClient(
+            api_client_sandbox,
+            cache=RegistryCache(max_age=timedelta(seconds=60), path=path, clock=clock),
+        )
+        registry.get_service("my_service")
+        saved = path.read_text()
+
+        clock.now += 120
+        registry.get_service("my_service")
+        assert path.read_text() == saved
+
+        clock.now += 120
+        registry.get_service("my_service")
+        snapshot = json.loads(path.read_text())
+        assert snapshot["entries"]["registry/services/my_service"]["etag"] == '"v2"'
+
+    def test_ignores_unreadable_snapshot(self, tmp_path: Path):
+        path = tmp_path / "registry.json"
+        path.write_text("{not json")
+
+        assert len(RegistryCache(path=path)) == 0
+
+    def test_writes_invalidate_cached_reads(
+        self, respx_mock: MockRouter, api_client_sandbox: ApiClient
+    ):
+        cache = RegistryCache()
+        interventions_route = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/interventions/"
+        ).mock(return_value=httpx.Response(200, json=[]))
+        respx_mock.delete(
+            "http://localhost:8000/api/v1/registry/interventions/my_intervention/versions/1"
+        ).mock(return_value=httpx.Response(200, json={"deleted": True}))
+        respx_mock.delete(
+            "http://localhost:8000/api/v1/registry/attribute_keys/my_key"
+        ).mock(return_value=httpx.Response(200, json={}))
+        interventions = InterventionsClient(api_client_sandbox, cache=cache)
+        registry = RegistryClient(api_client_sandbox, cache=cache)
+
+        interventions.list()
+        interventions.list()
+        interventions.delete("my_intervention", 1)
+        interventions.list()
+        assert interventions_route.call_count == 2
+
+        cache.store("registry/attribute_keys/my_key", {"name": "my_key"}, None)
+        registry.delete([AttributeKey(name="my_key")])
+        assert cache.lookup("registry/attribute_keys/my_key") is None
+
+    def test_async_reads_through_cache(self, respx_mock: MockRouter):
+        route = respx_mock.get(SERVICE_URL).mock(
+            return_value=httpx.Response(200, json=SERVICE)
+        )
+
+        async def run():
+            async with AsyncApiClient(
+                api_url="http://localhost:8000",
+                auth_mode="sandbox",
+                sandbox_token="test-sandbox-token",
+            ) as api_client:
+                registry = AsyncRegistryClient(api_client, cache=RegistryCache())
+                await registry.get_service("my_service")
+                return await registry.get_service("my_service")
+
+        assert asyncio.run(run()).name == "my_service"
+        assert route.call_count == 1
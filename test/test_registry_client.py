@@ -1,21 +1,29 @@
 import json
+import threading
+import time
 from datetime import timedelta
+from pathlib import Path
 
 import httpx
+import pytest
 from respx import MockRouter
 
 from snowplow_signals import (
     Attribute,
     AttributeGroup,
+    AttributeKey,
     BatchSource,
     Event,
+    Service,
+    SignalsAPIError,
     domain_userid,
 )
 from snowplow_signals.api_client import ApiClient
 from snowplow_signals.models import AttributeGroupResponse, AttributeKeyOutput
-from snowplow_signals.registry_client import RegistryClient
+from snowplow_signals.registry_client import RegistryClient, RegistryDependencyError
 
-from .utils import MOCK_ORG_ID
+from .interventions.utils import get_interventions_response
+from .utils import MOCK_ORG_ID, mock_registry_lists
 
 
 class TestRegistryClient:
@@ -227,3 +235,271 @@ class TestRegistryClient:
         registry_client.delete([intervention])
 
         assert delete_mock.called
+
+
+class TestRegistryClientConcurrentPublish:
+    def _objects(self):
+        key = AttributeKey(name="custom_key")
+        group = AttributeGroup(
+            name="my_attribute_group", attribute_key=key, owner="test@example.com"
+        )
+        service = Service(
+            name="my_service", attribute_groups=[group], owner="test@example.com"
+        )
+        return key, group, service
+
+    def test_sends_objects_after_their_dependencies(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        log: list[str] = []
+
+        def echo(kind: str):
+            def respond(request):
+                log.append(f"{kind} sent")
+                time.sleep(0.02)
+                log.append(f"{kind} stored")
+                return httpx.Response(201, json=json.loads(request.content))
+
+            return respond
+
+        for kind in ("attribute_keys", "attribute_groups", "services"):
+            respx_mock.post(f"http://localhost:8000/api/v1/registry/{kind}/").mock(
+                side_effect=echo(kind)
+            )
+        key, group, service = self._objects()
+
+        results = RegistryClient(api_client=api_client).create_or_update_all(
+            [service, group, key]
+        )
+
+        assert all(result.succeeded for result in results)
+        assert [result.object for result in results] == [key, group, service]
+        assert log == [
+            "attribute_keys sent",
+            "attribute_keys stored",
+            "attribute_groups sent",
+            "attribute_groups stored",
+            "services sent",
+            "services stored",
+        ]
+
+    def test_sends_independent_objects_concurrently(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        # both requests must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def respond(request):
+            barrier.wait()
+            return httpx.Response(201, json=json.loads(request.content))
+
+        respx_mock.post("http://localhost:8000/api/v1/registry/attribute_keys/").mock(
+            side_effect=respond
+        )
+
+        keys = RegistryClient(api_client=api_client).create_or_update(
+            [AttributeKey(name="first_key"), AttributeKey(name="second_key")],
+            max_workers=2,
+        )
+
+        assert [key.name for key in keys] == ["first_key", "second_key"]
+
+    def test_reports_per_object_failures(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        def respond(request):
+            body = json.loads(request.content)
+            if body["name"] == "custom_key":
+                return httpx.Response(500, json={"detail": "error"})
+            return httpx.Response(201, json=body)
+
+        respx_mock.post("http://localhost:8000/api/v1/registry/attribute_keys/").mock(
+            side_effect=respond
+        )
+        group_mock = respx_mock.post(
+            "http://localhost:8000/api/v1/registry/attribute_groups/"
+        )
+        key, group, service = self._objects()
+        other_key = AttributeKey(name="other_key")
+        registry_client = RegistryClient(api_client=api_client)
+
+        results = registry_client.create_or_update_all([key, other_key, group, service])
+
+        assert not group_mock.called
+        assert [result.succeeded for result in results] == [False, True, False, False]
+        assert isinstance(results[0].error, SignalsAPIError)
+        assert isinstance(results[2].error, RegistryDependencyError)
+        assert results[3].error.dependency == group  # type: ignore[union-attr]
+
+        with pytest.raises(SignalsAPIError):
+            registry_client.create_or_update([key, other_key, group, service])
+
+
+class TestRegistryClientPlan:
+    def test_plan_lists_every_page(self, respx_mock: MockRouter, api_client: ApiClient):
+        keys = [
+            {"name": f"key_{index}", "blobl_path": f"key_{index}"}
+            for index in range(150)
+        ]
+
+        def page(request):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json=keys[offset : offset + limit])
+
+        route = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/attribute_keys/"
+        ).mock(side_effect=page)
+
+        plan = RegistryClient(api_client=api_client).plan(
+            [
+                AttributeKey(name=f"key_{index}", blobl_path=f"key_{index}")
+                for index in range(140, 160)
+            ]
+        )
+
+        assert route.call_count == 2
+        assert [change.action for change in plan.changes] == 10 * ["unchanged"] + 10 * [
+            "create"
+        ]
+
+    def test_apply_updates_objects_created_since_the_plan(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        mock_registry_lists(respx_mock)
+        registry = RegistryClient(api_client=api_client)
+        plan = registry.plan([AttributeKey(name="custom_key")])
+        respx_mock.post("http://localhost:8000/api/v1/registry/attribute_keys/").mock(
+            return_value=httpx.Response(409, json={"detail": "Already exists"})
+        )
+        put = respx_mock.put(
+            "http://localhost:8000/api/v1/registry/attribute_keys/custom_key"
+        ).mock(
+            side_effect=lambda request: httpx.Response(
+                200, json=json.loads(request.content)
+            )
+        )
+
+        results = registry.apply(plan)
+
+        assert all(result.succeeded for result in results)
+        assert put.call_count == 1
+
+
+class TestRegistryClientExportImport:
+    def test_round_trips_registry_through_json_lines(
+        self, respx_mock: MockRouter, api_client: ApiClient, tmp_path: Path
+    ):
+        key = {"name": "custom_key", "is_published": True}
+        groups = [
+            {
+                "name": "my_attribute_group",
+                "version": version,
+                "attribute_key": {"name": "custom_key", "blobl_path": "custom_key"},
+                "owner": "test@example.com",
+                "feast_name": f"my_attribute_group_v{version}",
+            }
+            for version in (1, 2)
+        ]
+        service = {
+            "name": "my_service",
+            "attribute_groups": [{"name": "my_attribute_group", "version": 2}],
+            "owner": "test@example.com",
+        }
+        mock_registry_lists(
+            respx_mock,
+            attribute_keys=[key],
+            attribute_groups=groups,
+            services=[service],
+            interventions=get_interventions_response(),
+        )
+        path = tmp_path / "registry.jsonl"
+        registry_client = RegistryClient(api_client=api_client)
+
+        assert registry_client.export(path) == 6
+        assert [json.loads(line)["kind"] for line in path.read_text().splitlines()] == [
+            "attribute_key",
+            "attribute_group",
+            "attribute_group",
+            "service",
+            "intervention",
+            "intervention",
+        ]
+
+        sent: list[str] = []
+
+        def echo(request):
+            body = json.loads(request.content)
+            sent.append(f"{request.url.path.split('/')[-2]}:{body['name']}")
+            if body["name"] == "another_cycle_cart_count":
+                return httpx.Response(500, json={"detail": "error"})
+            return httpx.Response(201, json=body)
+
+        for kind in ("attribute_keys", "attribute_groups", "services", "interventions"):
+            respx_mock.post(f"http://localhost:8000/api/v1/registry/{kind}/").mock(
+                side_effect=echo
+            )
+
+        summary = registry_client.import_(path, batch_size=2)
+
+        assert summary.imported == 5
+        assert [result.object.name for result in summary.failed] == [
+            "another_cycle_cart_count"
+        ]
+        assert sent[:4] == [
+            "attribute_keys:custom_key",
+            "attribute_groups:my_attribute_group",
+            "attribute_groups:my_attribute_group",
+            "services:my_service",
+        ]
+
+    def test_rejects_invalid_records(self, api_client: ApiClient, tmp_path: Path):
+        path = tmp_path / "registry.jsonl"
+        path.write_text(
+            '{"kind": "attribute_key", "object": {"name": "key"}}\nnot json\n'
+        )
+
+        with pytest.raises(ValueError, match="line 2"):
+            RegistryClient(api_client=api_client).import_(path)
+
+
+class TestRegistryClientListing:
+    def test_iter_attribute_groups_sends_filters(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/attribute_groups/"
+        ).mock(return_value=httpx.Response(200, json=[]))
+
+        groups = RegistryClient(api_client=api_client).iter_attribute_groups(
+            offline=True, name_prefix="ecommerce_", published=False
+        )
+
+        assert list(groups) == []
+        assert dict(route.calls[0].request.url.params) == {
+            "offline": "true",
+            "name_prefix": "ecommerce_",
+            "is_published": "false",
+            "limit": "100",
+            "offset": "0",
+        }
+
+    def test_stops_when_api_ignores_pagination(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/attribute_keys/"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json=[
+                    {"name": "first_key", "blobl_path": "first_key"},
+                    {"name": "second_key", "blobl_path": "second_key"},
+                ],
+            )
+        )
+
+        keys = RegistryClient(api_client=api_client).iter_attribute_keys(page_size=2)
+
+        assert [key.name for key in keys] == ["first_key", "second_key"]
+        assert route.call_count == 2
@@ -0,0 +1,344 @@
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import (
+    AttributesCache,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    RetryPolicy,
+    SignalsAPIError,
+)
+from snowplow_signals.api_client import ApiClient, AsyncApiClient
+from snowplow_signals.attributes_client import AttributesClient
+from snowplow_signals.resilience import CircuitBreaker, RetryBudget, endpoint_group
+
+INTERVENTIONS_URL = "http://localhost:8000/api/v1/registry/interventions/"
+ATTRIBUTES_URL = "http://localhost:8000/api/v1/get-online-attributes"
+
+NO_WAIT = RetryPolicy(
+    initial_backoff=timedelta(0), max_backoff=timedelta(seconds=1), max_attempts=3
+)
+
+
+def _api_client(**kwargs) -> ApiClient:
+    return ApiClient(
+        api_url="http://localhost:8000",
+        auth_mode="sandbox",
+        sandbox_token="test-sandbox-token",
+        **kwargs,
+    )
+
+
+class TestRetryPolicy:
+    def test_backoff_is_jittered_below_exponential_ceiling(self):
+        policy = RetryPolicy(
+            initial_backoff=timedelta(seconds=1), max_backoff=timedelta(seconds=3)
+        )
+
+        assert all(0 <= policy.backoff(1) <= 1 for _ in range(20))
+        assert all(0 <= policy.backoff(2) <= 2 for _ in range(20))
+        assert all(0 <= policy.backoff(5) <= 3 for _ in range(20))
+
+    def test_backoff_honours_retry_after_up_to_max_backoff(self):
+        policy = RetryPolicy(max_backoff=timedelta(seconds=3))
+
+        assert policy.backoff(1, retry_after=2.0) == 2.0
+        assert policy.backoff(1, retry_after=5.0) is None
+
+    def test_retry_budget(self):
+        budget = RetryBudget(ratio=0.5, capacity=1)
+
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+
+class TestCircuitBreaker:
+    def test_abandoned_trial_reopens_the_circuit(self):
+        breaker = CircuitBreaker(
+            CircuitBreakerPolicy(failure_threshold=1, reset_timeout=timedelta(0))
+        )
+
+        breaker.record_failure()
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        breaker.record_abandoned()
+        assert breaker.state == "open"
+        assert breaker.allow()
+
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        now = 0.0
+        breaker = CircuitBreaker(
+            CircuitBreakerPolicy(
+                failure_threshold=2, reset_timeout=timedelta(seconds=10)
+            ),
+            clock=lambda: now,
+        )
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+        now = 10.0
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        # only one trial request is let through
+        assert not breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        now = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_endpoint_group(self):
+        assert (
+            endpoint_group("registry/attribute_groups/my_group/versions/1")
+            == "registry/attribute_groups"
+        )
+        assert endpoint_group("get-online-attributes") == "get-online-attributes"
+
+
+class TestApiClientResilience:
+    def test_retries_idempotent_requests(self, respx_mock: MockRouter):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            side_effect=[
+                httpx.ConnectError("connection reset"),
+                httpx.Response(503),
+                httpx.Response(200, json=[]),
+            ]
+        )
+        api_client = _api_client(retry_policy=NO_WAIT)
+
+        assert api_client.make_request("GET", "registry/interventions/") == []
+        assert route.call_count == 3
+
+    def test_gives_up_after_max_attempts(self, respx_mock: MockRouter):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(503, json={"detail": "unavailable"})
+        )
+        api_client = _api_client(retry_policy=NO_WAIT)
+
+        with pytest.raises(SignalsAPIError) as error:
+            api_client.make_request("GET", "registry/interventions/")
+        assert error.value.status_code == 503
+        assert route.call_count == 3
+
+    def test_does_not_retry_non_idempotent_requests(self, respx_mock: MockRouter):
+        route = respx_mock.post(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(503, json={"detail": "unavailable"})
+        )
+        api_client = _api_client(retry_policy=NO_WAIT)
+
+        with pytest.raises(SignalsAPIError):
+            api_client.make_request("POST", "registry/interventions/", data={})
+        assert route.call_count == 1
+
+    def test_does_not_retry_client_errors(self, respx_mock: MockRouter):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(404, json={"detail": "not found"})
+        )
+        api_client = _api_client(retry_policy=NO_WAIT)
+
+        with pytest.raises(SignalsAPIError):
+            api_client.make_request("GET", "registry/interventions/")
+        assert route.call_count == 1
+
+    def test_honours_retry_after(self, respx_mock: MockRouter, monkeypatch):
+        sleeps: list[float] = []
+        monkeypatch.setattr("snowplow_signals.api_client.time.sleep", sleeps.append)
+        respx_mock.get(INTERVENTIONS_URL).mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0.5"}),
+                httpx.Response(200, json=[]),
+            ]
+        )
+        api_client = _api_client(retry_policy=NO_WAIT)
+
+        api_client.make_request("GET", "registry/interventions/")
+
+        assert sleeps == [0.5]
+
+    def test_retry_budget_limits_retries(self, respx_mock: MockRouter):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(503, json={"detail": "unavailable"})
+        )
+        api_client = _api_client(
+            retry_policy=NO_WAIT.model_copy(
+                update={"budget_capacity": 1, "budget_ratio": 0}
+            )
+        )
+
+        for _ in range(2):
+            with pytest.raises(SignalsAPIError):
+                api_client.make_request("GET", "registry/interventions/")
+
+        # one retry for the first request, none left for the second
+        assert route.call_count == 3
+
+    def test_circuit_breaker_fails_fast_per_endpoint(self, respx_mock: MockRouter):
+        interventions = respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(500, json={"detail": "error"})
+        )
+        groups = respx_mock.get(
+            "http://localhost:8000/api/v1/registry/attribute_groups/"
+        ).mock(return_value=httpx.Response(200, json=[]))
+        api_client = _api_client(
+            circuit_breaker=CircuitBreakerPolicy(failure_threshold=2)
+        )
+
+        for _ in range(2):
+            with pytest.raises(SignalsAPIError):
+                api_client.make_request("GET", "registry/interventions/")
+        with pytest.raises(CircuitOpenError):
+            api_client.make_request("GET", "registry/interventions/")
+
+        assert interventions.call_count == 2
+        assert api_client.make_request("GET", "registry/attribute_groups/") == []
+        assert groups.call_count == 1
+
+    def test_endpoint_timeouts(self, respx_mock: MockRouter):
+        route = respx_mock.post(ATTRIBUTES_URL).mock(
+            return_value=httpx.Response(200, json={})
+        )
+        respx_mock.get(INTERVENTIONS_URL).mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        api_client = _api_client(
+            timeout=20.0, endpoint_timeouts={"get-online-attributes": 2.0}
+        )
+
+        api_client.make_request("POST", "get-online-attributes", data={})
+        api_client.make_request("GET", "registry/interventions/")
+
+        assert route.calls[0].request.extensions["timeout"]["read"] == 2.0
+        assert api_client._timeout_for("registry/interventions/") == 20.0
+
+    def test_async_retries_idempotent_requests(self, respx_mock: MockRouter):
+        route = respx_mock.get(INTERVENTIONS_URL).mock(
+            side_effect=[httpx.Response(502), httpx.Response(200, json=[])]
+        )
+
+        async def run():
+            async with AsyncApiClient(
+                api_url="http://localhost:8000",
+                auth_mode="sandbox",
+                sandbox_token="test-sandbox-token",
+                retry_policy=NO_WAIT,
+            ) as api_client:
+                return await api_client.make_request("GET", "registry/interventions/")
+
+        assert asyncio.run(run()) == []
+        assert route.call_count == 2
+
+    def test_async_cancelled_trial_lets_the_next_request_through(
+        self, respx_mock: MockRouter
+    ):
+        responses = [httpx.Response(503, json={"detail": "unavailable"})]
+
+        async def respond(request):
+            if not responses:
+                # the trial request hangs until it is cancelled
+                await asyncio.sleep(10)
+            return responses.pop(0)
+
+        route = respx_mock.get(INTERVENTIONS_URL).mock(side_effect=respond)
+
+        async def run():
+            async with AsyncApiClient(
+                api_url="http://localhost:8000",
+                auth_mode="sandbox",
+                sandbox_token="test-sandbox-token",
+                circuit_breaker=CircuitBreakerPolicy(
+                    failure_threshold=1, reset_timeout=timedelta(0)
+                ),
+            ) as api_client:
+                with pytest.raises(SignalsAPIError):
+                    await api_client.make_request("GET", "registry/interventions/")
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        api_client.make_request("GET", "registry/interventions/"),
+                        timeout=0.1,
+                    )
+                route.mock(return_value=httpx.Response(200, json=[]))
+                return await api_client.make_request("GET", "registry/interventions/")
+
+        assert asyncio.run(run()) == []
+
+
+class TestServeStaleOnError:
+    def test_serves_expired_attributes_while_api_is_unavailable(
+        self, respx_mock: MockRouter
+    ):
+        now = 0.0
+        cache = AttributesCache(ttl=timedelta(seconds=10), clock=lambda: now)
+        respx_mock.post(ATTRIBUTES_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"count": [1]}),
+                httpx.Response(503, json={"detail": "unavailable"}),
+                httpx.Response(503, json={"detail": "unavailable"}),
+            ]
+        )
+        attributes = AttributesClient(
+            _api_client(), cache=cache, serve_stale_on_error=True
+        )
+
+        assert attributes.get_service_attributes("s", "domain_userid", "a") == {
+            "count": 1
+        }
+        now = 20.0
+        assert attributes.get_service_attributes("s", "domain_userid", "a") == {
+            "count": 1
+        }
+        with pytest.raises(SignalsAPIError):
+            attributes.get_service_attributes("s", "domain_userid", "b")
+
+    def test_batch_serves_expired_attributes(self, respx_mock: MockRouter):
+        now = 0.0
+        cache = AttributesCache(ttl=timedelta(seconds=10), clock=lambda: now)
+        respx_mock.post(ATTRIBUTES_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"count": [1, 2]}),
+                httpx.ConnectError("connection reset"),
+            ]
+        )
+        attributes = AttributesClient(
+            _api_client(), cache=cache, serve_stale_on_error=True
+        )
+        identifiers = {"domain_userid": ["a", "b"]}
+
+        attributes.get_service_attributes_batch("s", identifiers)
+        now = 20.0
+
+        assert attributes.get_service_attributes_batch("s", identifiers) == {
+            "domain_userid": {"a": {"count": 1}, "b": {"count": 2}}
+        }
+
+    def test_does_not_serve_stale_on_client_errors(self, respx_mock: MockRouter):
+        now = 0.0
+        cache = AttributesCache(ttl=timedelta(seconds=10), clock=lambda: now)
+        respx_mock.post(ATTRIBUTES_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"count": [1]}),
+                httpx.Response(404, json={"detail": "not found"}),
+            ]
+        )
+        attributes = AttributesClient(
+            _api_client(), cache=cache, serve_stale_on_error=True
+        )
+
+        attributes.get_service_attributes("s", "domain_userid", "a")
+        now = 20.0
+
+        with pytest.raises(SignalsAPIError):
+            attributes.get_service_attributes("s", "domain_userid", "a")
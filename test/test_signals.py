@@ -11,6 +11,8 @@ from snowplow_signals import (
     domain_userid,
 )
 
+from .utils import mock_registry_lists
+
 
 class TestSignalsPublish:
     def test_publish_attribute_group_and_service(
@@ -55,6 +57,7 @@ class TestSignalsPublish:
                 },
             )
 
+        mock_registry_lists(respx_mock)
         group_mock = respx_mock.post(
             "http://localhost:8000/api/v1/registry/attribute_groups/"
         ).mock(side_effect=check_group_request)
@@ -65,6 +68,11 @@ class TestSignalsPublish:
 
         applied_objects = signals_client.publish(objects=[attribute_group, service])
 
+        # without only_changes the objects are written without reading the registry
+        assert not any(
+            call.request.method == "GET" and "/registry/" in call.request.url.path
+            for call in respx_mock.calls
+        )
         assert group_mock.called
         assert service_mock.called
         assert len(applied_objects) == 2
@@ -126,10 +134,12 @@ class TestSignalsPublish:
                 },
             )
 
+        mock_registry_lists(respx_mock)
         key_mock = respx_mock.post(
             "http://localhost:8000/api/v1/registry/attribute_keys/"
         ).mock(side_effect=check_key_request)
 
+        mock_registry_lists(respx_mock)
         group_mock = respx_mock.post(
             "http://localhost:8000/api/v1/registry/attribute_groups/"
         ).mock(side_effect=check_group_request)
@@ -157,31 +167,109 @@ class TestSignalsPublish:
             owner="test@example.com",
         )
 
+        mock_registry_lists(
+            respx_mock,
+            attribute_groups=[
+                attribute_group.model_dump(mode="json", exclude_none=True)
+                | {"is_published": False}
+            ],
+        )
+        publish_mock = respx_mock.post(
+            "http://localhost:8000/api/v1/engines/publish"
+        ).mock(return_value=httpx.Response(200, json={"status": "published"}))
+
+        published_objects = signals_client.publish(
+            objects=[attribute_group], only_changes=True
+        )
+
+        # only the published state differs, so the group is published by reference
+        assert json.loads(publish_mock.calls[0].request.content) == {
+            "attribute_groups": [{"name": "my_attribute_group", "version": 1}]
+        }
+        assert published_objects[0].is_published
+
+    def test_already_existing_attribute_group_with_changes(
+        self, respx_mock: MockRouter, signals_client: Signals
+    ):
+        attribute_group = AttributeGroup(
+            name="my_attribute_group",
+            attribute_key=domain_userid,
+            owner="test@example.com",
+            description="New description",
+        )
+
         def check_publish_flag(request):
             body = json.loads(request.content)
             assert body["is_published"] is True
-            return httpx.Response(
-                200,
-                json={
-                    "name": "my_attribute_group",
-                    "attribute_key": {"name": "user"},
-                    "owner": "test@example.com",
-                    "is_published": True,
-                },
-            )
-
+            return httpx.Response(200, json=body)
+
+        mock_registry_lists(
+            respx_mock,
+            attribute_groups=[
+                attribute_group.model_dump(mode="json", exclude_none=True)
+                | {"description": "Old description", "is_published": False}
+            ],
+        )
         group_post_mock = respx_mock.post(
             "http://localhost:8000/api/v1/registry/attribute_groups/"
-        ).mock(return_value=httpx.Response(400, json={}))
-
+        )
         group_put_mock = respx_mock.put(
             "http://localhost:8000/api/v1/registry/attribute_groups/my_attribute_group/versions/1"
         ).mock(side_effect=check_publish_flag)
+        publish_mock = respx_mock.post("http://localhost:8000/api/v1/engines/publish")
 
-        signals_client.publish(objects=[attribute_group])
+        signals_client.publish(objects=[attribute_group], only_changes=True)
 
-        assert group_post_mock.called
+        assert not group_post_mock.called
         assert group_put_mock.called
+        assert not publish_mock.called
+
+    def test_publish_creates_objects_before_publishing_existing_ones(
+        self, respx_mock: MockRouter, signals_client: Signals
+    ):
+        attribute_group = AttributeGroup(
+            name="my_attribute_group",
+            attribute_key=domain_userid,
+            owner="test@example.com",
+        )
+        service = Service(
+            name="my_service",
+            attribute_groups=[attribute_group],
+            owner="test@example.com",
+        )
+
+        mock_registry_lists(
+            respx_mock,
+            attribute_groups=[
+                attribute_group.model_dump(mode="json", exclude_none=True)
+                | {"is_published": False}
+            ],
+        )
+        respx_mock.post("http://localhost:8000/api/v1/registry/services/").mock(
+            side_effect=lambda request: httpx.Response(
+                201, json=json.loads(request.content)
+            )
+        )
+        respx_mock.post("http://localhost:8000/api/v1/engines/publish").mock(
+            return_value=httpx.Response(200, json={"status": "published"})
+        )
+
+        signals_client.publish(objects=[service, attribute_group], only_changes=True)
+
+        # each object is looked up on its own instead of listing its collection
+        assert [
+            (call.request.method, call.request.url.path)
+            for call in respx_mock.calls
+            if "/credentials/" not in call.request.url.path
+        ] == [
+            (
+                "GET",
+                "/api/v1/registry/attribute_groups/my_attribute_group/versions/1",
+            ),
+            ("GET", "/api/v1/registry/services/my_service"),
+            ("POST", "/api/v1/registry/services/"),
+            ("POST", "/api/v1/engines/publish"),
+        ]
 
 
 class TestSignalsUnpublish:
@@ -228,6 +316,7 @@ class TestSignalsUnpublish:
                 },
             )
 
+        mock_registry_lists(respx_mock)
         group_mock = respx_mock.post(
             "http://localhost:8000/api/v1/registry/attribute_groups/"
         ).mock(side_effect=check_group_request)
@@ -246,6 +335,47 @@ class TestSignalsUnpublish:
         assert not unpublished_objects[0].is_published
         assert not unpublished_objects[1].is_published
 
+    def test_unpublish_existing_objects_by_reference(
+        self, respx_mock: MockRouter, signals_client: Signals
+    ):
+        custom_key = AttributeKey(name="custom_key", is_published=True)
+        service = Service(
+            name="my_service",
+            attribute_groups=[
+                AttributeGroup(
+                    name="my_attribute_group",
+                    attribute_key=custom_key,
+                    owner="test@example.com",
+                )
+            ],
+            owner="test@example.com",
+            is_published=True,
+        )
+
+        mock_registry_lists(
+            respx_mock,
+            attribute_keys=[custom_key.model_dump(mode="json", exclude_none=True)],
+            services=[service.model_dump(mode="json", exclude_none=True)],
+        )
+        unpublish_mock = respx_mock.post(
+            "http://localhost:8000/api/v1/engines/unpublish"
+        ).mock(return_value=httpx.Response(200, json={"status": "unpublished"}))
+
+        unpublished_objects = signals_client.unpublish(
+            objects=[service, custom_key], only_changes=True
+        )
+
+        assert unpublish_mock.call_count == 1
+        assert json.loads(unpublish_mock.calls[0].request.content) == {
+            "attribute_keys": [{"name": "custom_key"}],
+            "services": [{"name": "my_service"}],
+        }
+        assert [object.name for object in unpublished_objects] == [
+            "custom_key",
+            "my_service",
+        ]
+        assert not any(object.is_published for object in unpublished_objects)
+
 
 class TestSignalsDelete:
     def test_delete_attribute_group_and_service(
@@ -320,3 +450,168 @@ class TestSignalsGetAttributes:
         )
         assert response["domain_userid"] == "user-123"
         assert response["page_views_count"] == 10
+
+
+class TestSignalsAttributesFrame:
+    def test_get_service_attributes_frame(
+        self, respx_mock: MockRouter, signals_client: Signals
+    ):
+        event = {"vendor": "com.snowplowanalytics.snowplow", "name": "page_view"}
+        respx_mock.get(
+            "http://localhost:8000/api/v1/registry/services/my_service"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "name": "my_service",
+                    "owner": "test@example.com",
+                    "attribute_groups": [{"name": "my_group", "version": 1}],
+                },
+            )
+        )
+        respx_mock.get(
+            "http://localhost:8000/api/v1/registry/attribute_groups/my_group/versions/1"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "name": "my_group",
+                    "version": 1,
+                    "attribute_key": {
+                        "name": "domain_userid",
+                        "blobl_path": "domain_userid",
+                    },
+                    "attribute_key_or_name": "domain_userid",
+                    "feast_name": "my_group_v1",
+                    "full_name": "my_group_v1",
+                    "stream_source_name": "my_group_v1_stream",
+                    "attributes": [
+                        {
+                            "name": name,
+                            "type": type,
+                            "events": [event],
+                            "aggregation": "counter",
+                        }
+                        for name, type in [
+                            ("page_views", "int64"),
+                            ("first_referrer", "string"),
+                            ("last_seen", "unix_timestamp"),
+                        ]
+                    ],
+                },
+            )
+        )
+
+        def echo_rows(request):
+            rows = json.loads(request.content)["attribute_keys"]["domain_userid"]
+            return httpx.Response(
+                200,
+                json={
+                    "page_views": [None if row == "b" else 1 for row in rows],
+                    "first_referrer": [f"ref-{row}" for row in rows],
+                    "last_seen": [1700000000 for _ in rows],
+                },
+            )
+
+        online_route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=echo_rows)
+        signals_client.attributes.max_identifiers_per_request = 2
+
+        frame = signals_client.get_service_attributes_frame(
+            name="my_service",
+            attribute_key="domain_userid",
+            identifiers=["a", "b", "c"],
+        )
+
+        assert online_route.call_count == 2
+        assert frame.index.name == "domain_userid"
+        assert list(frame.index) == ["a", "b", "c"]
+        assert str(frame.dtypes["page_views"]) == "Int64"
+        assert str(frame.dtypes["first_referrer"]) == "string"
+        assert str(frame.dtypes["last_seen"]) == "datetime64[ns, UTC]"
+        assert frame["page_views"].isna().tolist() == [False, True, False]
+        assert frame.loc["c", "first_referrer"] == "ref-c"
+
+
+class TestSignalsPlanPublish:
+    def test_plan_and_apply_send_only_changes(
+        self, respx_mock: MockRouter, signals_client: Signals
+    ):
+        custom_key = AttributeKey(name="custom_key")
+        attribute_group = AttributeGroup(
+            name="my_attribute_group",
+            attribute_key=custom_key,
+            owner="test@example.com",
+            description="New description",
+        )
+        service = Service(
+            name="my_service",
+            attribute_groups=[attribute_group],
+            owner="test@example.com",
+        )
+
+        mock_registry_lists(
+            respx_mock,
+            attribute_keys=[{"name": "custom_key", "is_published": True}],
+            attribute_groups=[
+                {
+                    "name": "my_attribute_group",
+                    "version": 1,
+                    "attribute_key": {
+                        "name": "custom_key",
+                        "blobl_path": "custom_key",
+                    },
+                    "owner": "test@example.com",
+                    "description": "Old description",
+                    "is_published": True,
+                    "feast_name": "my_attribute_group_v1",
+                }
+            ],
+        )
+        key_post = respx_mock.post(
+            "http://localhost:8000/api/v1/registry/attribute_keys/"
+        )
+        group_put = respx_mock.put(
+            "http://localhost:8000/api/v1/registry/attribute_groups/my_attribute_group/versions/1"
+        ).mock(
+            side_effect=lambda request: httpx.Response(
+                200, json=json.loads(request.content)
+            )
+        )
+        service_post = respx_mock.post(
+            "http://localhost:8000/api/v1/registry/services/"
+        ).mock(
+            side_effect=lambda request: httpx.Response(
+                201, json=json.loads(request.content)
+            )
+        )
+
+        plan = signals_client.plan_publish([service, attribute_group, custom_key])
+
+        assert [change.action for change in plan.changes] == [
+            "unchanged",
+            "update",
+            "create",
+        ]
+        assert plan.changes[1].changes == {
+            "description": ("Old description", "New description")
+        }
+        assert str(plan) == (
+            "~ update AttributeGroup 'my_attribute_group' v1\n"
+            "    description: 'Old description' -> 'New description'\n"
+            "+ create Service 'my_service'\n"
+            "Plan: 1 to create, 1 to update, 1 unchanged."
+        )
+
+        applied_objects = signals_client.apply(plan)
+
+        assert not key_post.called
+        assert group_put.call_count == 1
+        assert service_post.call_count == 1
+        assert [object.name for object in applied_objects] == [
+            "custom_key",
+            "my_attribute_group",
+            "my_service",
+        ]
+        assert all(object.is_published for object in applied_objects)
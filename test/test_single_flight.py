@@ -0,0 +1,133 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import AsyncSignalsSandbox
+from snowplow_signals.api_client import ApiClient
+from snowplow_signals.attributes_client import AttributesClient
+from snowplow_signals.single_flight import AsyncSingleFlight, SingleFlight
+
+CALLERS = 8
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    def test_coalesces_concurrent_calls(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            wait_for(lambda: single_flight.coalesced == CALLERS - 1)
+            return 42
+
+        with ThreadPoolExecutor(CALLERS) as pool:
+            results = list(
+                pool.map(lambda _: single_flight.do("key", fn), range(CALLERS))
+            )
+
+        assert results == [42] * CALLERS
+        assert len(calls) == 1
+
+    def test_shares_exceptions_and_forgets_failed_calls(self):
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        def fail():
+            wait_for(lambda: single_flight.coalesced == CALLERS - 1)
+            raise RuntimeError("boom")
+
+        def call(_):
+            with pytest.raises(RuntimeError):
+                single_flight.do("key", fail)
+
+        with ThreadPoolExecutor(CALLERS) as pool:
+            list(pool.map(call, range(CALLERS)))
+
+        assert single_flight.do("key", lambda: 1) == 1
+
+    def test_async_coalesces_concurrent_calls(self):
+        single_flight: AsyncSingleFlight[str, int] = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def run():
+            return await asyncio.gather(
+                *(single_flight.do("key", fn) for _ in range(CALLERS))
+            )
+
+        assert asyncio.run(run()) == [42] * CALLERS
+        assert len(calls) == 1
+        assert single_flight.coalesced == CALLERS - 1
+
+
+class TestAttributesClientCoalescing:
+    def test_concurrent_identical_lookups_share_one_request(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        attributes_client = AttributesClient(
+            api_client=api_client, coalesce_requests=True
+        )
+        single_flight = attributes_client.single_flight
+        assert single_flight is not None
+
+        def respond(request):
+            wait_for(lambda: single_flight.coalesced == CALLERS - 1)
+            return httpx.Response(200, json={"page_views": [10]})
+
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(side_effect=respond)
+
+        def lookup(_):
+            return attributes_client.get_service_attributes(
+                name="my_service", attribute_key="domain_userid", identifier="hot"
+            )
+
+        with ThreadPoolExecutor(CALLERS) as pool:
+            results = list(pool.map(lookup, range(CALLERS)))
+
+        assert route.call_count == 1
+        assert results == [{"page_views": 10}] * CALLERS
+        assert len({id(result) for result in results}) == CALLERS
+
+    def test_async_concurrent_identical_lookups_share_one_request(
+        self, respx_mock: MockRouter
+    ):
+        signals = AsyncSignalsSandbox(
+            api_url="http://localhost:8000",
+            sandbox_token="test-sandbox-token",
+            coalesce_requests=True,
+        )
+        route = respx_mock.post(
+            "http://localhost:8000/api/v1/get-online-attributes"
+        ).mock(return_value=httpx.Response(200, json={"page_views": [10]}))
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    signals.get_service_attributes(
+                        name="my_service",
+                        attribute_key="domain_userid",
+                        identifier="hot",
+                    )
+                    for _ in range(CALLERS)
+                )
+            )
+
+        assert asyncio.run(run()) == [{"page_views": 10}] * CALLERS
+        assert route.call_count == 1
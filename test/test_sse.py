@@ -0,0 +1,197 @@
+import asyncio
+from datetime import timedelta
+from threading import Event
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from snowplow_signals import ReconnectPolicy, SignalsAPIError
+from snowplow_signals.api_client import ApiClient, AsyncApiClient
+from snowplow_signals.sse import (
+    AsyncEventStream,
+    EventStream,
+    ServerSentEvent,
+    SSEDecoder,
+)
+
+STREAM_URL = "http://localhost:8000/api/v1/interventions"
+
+IMMEDIATE = ReconnectPolicy(initial_backoff=timedelta(0))
+
+
+class IdleStream(httpx.SyncByteStream):
+    """A response body that times out reading after its content."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def __iter__(self):
+        yield self.content
+        raise httpx.ReadTimeout("idle")
+
+
+def decode(lines: list[str]) -> list[ServerSentEvent]:
+    decoder = SSEDecoder()
+    return [event for line in lines if (event := decoder.decode(line)) is not None]
+
+
+class TestSSEDecoder:
+    def test_decodes_event_frames(self):
+        events = decode(
+            [
+                ": keep-alive",
+                "id: 1",
+                "event: intervention",
+                "data: first",
+                "data:second",
+                "",
+                "data",
+                "",
+                "id: 2",
+                "",
+                "data: after an event without data",
+                "",
+            ]
+        )
+
+        assert events == [
+            ServerSentEvent(data="first\nsecond", event="intervention", id="1"),
+            ServerSentEvent(data="", event="message", id="1"),
+            ServerSentEvent(data="after an event without data", id="2"),
+        ]
+
+    def test_keeps_reconnection_state(self):
+        decoder = SSEDecoder()
+        for line in ["retry: 2500", "retry: soon", "id: a\0b", "data: partial"]:
+            decoder.decode(line)
+        decoder.reset()
+
+        assert decoder.retry == timedelta(milliseconds=2500)
+        assert decoder.last_event_id == ""
+        assert decoder.decode("") is None
+
+
+class TestEventStream:
+    def test_reconnects_and_resumes_from_last_event_id(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(STREAM_URL).mock(
+            side_effect=[
+                httpx.Response(200, stream=httpx.ByteStream(b"data: 1\n\n")),
+                httpx.ConnectError("dropped"),
+                httpx.Response(200, stream=httpx.ByteStream(b"id: 2\ndata: 2\n\n")),
+                httpx.Response(503, json={"detail": "unavailable"}),
+                httpx.Response(200, stream=httpx.ByteStream(b"data: 3\n\n")),
+            ]
+        )
+        stream = EventStream(api_client, "interventions", reconnect_policy=IMMEDIATE)
+
+        events = stream.events()
+        received = [next(events).data for _ in range(3)]
+        events.close()
+
+        assert received == ["1", "2", "3"]
+        assert "Last-Event-ID" not in route.calls[2].request.headers
+        assert route.calls[4].request.headers["Last-Event-ID"] == "2"
+        stats = stream.stats()
+        assert (stats.connections, stats.reconnects, stats.gaps) == (3, 4, 2)
+        assert stats.disconnected_ms.count == 2
+        assert not stream.connected
+
+    def test_gives_up_after_max_attempts(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        respx_mock.get(STREAM_URL).mock(
+            return_value=httpx.Response(503, json={"detail": "unavailable"})
+        )
+        stream = EventStream(
+            api_client,
+            "interventions",
+            reconnect_policy=ReconnectPolicy(
+                initial_backoff=timedelta(0), max_attempts=2
+            ),
+        )
+
+        with pytest.raises(SignalsAPIError):
+            list(stream.events())
+        assert stream.stats().reconnects == 2
+
+    def test_does_not_reconnect_after_rejected_request(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        route = respx_mock.get(STREAM_URL).mock(
+            return_value=httpx.Response(401, json={"detail": "unauthorized"})
+        )
+
+        with pytest.raises(SignalsAPIError):
+            list(EventStream(api_client, "interventions").events())
+        assert route.call_count == 1
+
+    def test_stops_while_waiting_to_reconnect(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        respx_mock.get(STREAM_URL).mock(
+            return_value=httpx.Response(200, stream=httpx.ByteStream(b"data: 1\n\n"))
+        )
+        closed = Event()
+        stream = EventStream(
+            api_client,
+            "interventions",
+            reconnect_policy=ReconnectPolicy(initial_backoff=timedelta(hours=1)),
+        )
+
+        events = stream.events(closed)
+        assert next(events).data == "1"
+        closed.set()
+
+        assert list(events) == []
+
+    def test_idle_reopens_are_not_counted_as_reconnects(
+        self, respx_mock: MockRouter, api_client: ApiClient
+    ):
+        respx_mock.get(STREAM_URL).mock(
+            side_effect=[
+                httpx.Response(200, stream=IdleStream(b"data: 1\n\n")),
+                httpx.Response(200, stream=IdleStream(b"data: 2\n\n")),
+                httpx.Response(200, stream=httpx.ByteStream(b"data: 3\n\n")),
+            ]
+        )
+        stream = EventStream(
+            api_client, "interventions", read_timeout=timedelta(seconds=1)
+        )
+
+        events = stream.events()
+        received = [next(events).data for _ in range(3)]
+        events.close()
+
+        assert received == ["1", "2", "3"]
+        stats = stream.stats()
+        assert (stats.connections, stats.reconnects, stats.idle_reopens) == (1, 0, 2)
+
+    def test_async_reconnects(self, respx_mock: MockRouter):
+        respx_mock.get(STREAM_URL).mock(
+            side_effect=[
+                httpx.Response(200, stream=httpx.ByteStream(b"id: 1\ndata: 1\n\n")),
+                httpx.Response(200, stream=httpx.ByteStream(b"data: 2\n\n")),
+            ]
+        )
+
+        async def run():
+            async with AsyncApiClient(
+                api_url="http://localhost:8000",
+                auth_mode="sandbox",
+                sandbox_token="test-sandbox-token",
+            ) as api_client:
+                stream = AsyncEventStream(
+                    api_client, "interventions", reconnect_policy=IMMEDIATE
+                )
+                events = stream.events()
+                received = [(await anext(events)).data for _ in range(2)]
+                await events.aclose()
+                return received, stream.stats()
+
+        received, stats = asyncio.run(run())
+
+        assert received == ["1", "2"]
+        assert (stats.reconnects, stats.gaps) == (1, 0)
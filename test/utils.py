@@ -1,5 +1,9 @@
+import re
 from datetime import UTC, datetime
 
+import httpx
+from respx import MockRouter
+
 MOCK_ORG_ID = "1111-1111-1111-1111-1111"
 MOCK_API_URL = "http://localhost:8087"
 MOCK_API_KEY = "test-api-key"
@@ -10,3 +14,36 @@ MOCK_ATTRIBUTE_GROUP_VERSION = 1
 
 def utc_timestamp() -> int:
     return int(datetime.now(tz=UTC).timestamp())
+
+
+def mock_registry_lists(
+    respx_mock: MockRouter,
+    api_url: str = "http://localhost:8000",
+    **collections: list[dict],
+) -> None:
+    """Mocks the registry list and object endpoints, returning the given objects per collection and no objects otherwise"""
+    for collection in (
+        "attribute_keys",
+        "attribute_groups",
+        "services",
+        "interventions",
+    ):
+        objects = collections.get(collection, [])
+        respx_mock.get(f"{api_url}/api/v1/registry/{collection}/").mock(
+            return_value=httpx.Response(200, json=objects)
+        )
+        respx_mock.get(
+            url__regex=rf"^{re.escape(api_url)}/api/v1/registry/{collection}/(?P<name>[^/]+)(/versions/(?P<version>\d+))?$"
+        ).mock(side_effect=_get_registry_object(objects))
+
+
+def _get_registry_object(objects: list[dict]):
+    def side_effect(request: httpx.Request, name: str, version: str | None):
+        for object in objects:
+            if object["name"] == name and (
+                version is None or object.get("version", 1) == int(version)
+            ):
+                return httpx.Response(200, json=object)
+        return httpx.Response(404, json={"detail": "Not found"})
+
+    return side_effect